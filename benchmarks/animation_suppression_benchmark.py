@@ -0,0 +1,222 @@
+# Per-step latency of the ui steps the flows sleep for (menus, dialogs with backdrops, smooth scrolling), with and without animation suppression
+#
+# python benchmarks/animation_suppression_benchmark.py
+# python benchmarks/animation_suppression_benchmark.py --repeat 20 --no-headless
+# python benchmarks/animation_suppression_benchmark.py --studio --cookies-folder-path ./cookies --cookies-id account1
+#
+# A step's latency is the time from the click until its target is displayed, no finite animation or transition is running
+# and the target stopped moving. The synthetic page mimics the Polymer timings of Studio, --studio measures the real menus too.
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Dict, Optional
+import os, sys, time, tempfile, argparse, statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local
+from zs_selenium_youtube import animation_suppression
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+SYNTHETIC_PAGE = '''<!DOCTYPE html>
+<html><head><style>
+    body { margin: 0; height: 6000px; font-family: sans-serif; }
+    button { margin: 8px; }
+    #menu { position: absolute; top: 40px; left: 8px; display: none; background: #fff; box-shadow: 0 2px 8px #888; }
+    #menu.opened { display: block; animation: menu-open 250ms cubic-bezier(0.4, 0, 0.2, 1); }
+    @keyframes menu-open { from { transform: scale(0.6); opacity: 0; } to { transform: scale(1); opacity: 1; } }
+    #backdrop { position: fixed; inset: 0; background: #000; opacity: 0; visibility: hidden; transition: opacity 300ms linear; }
+    #backdrop.opened { opacity: 0.6; visibility: visible; }
+    #dialog { position: fixed; top: 30%; left: 30%; padding: 24px; background: #fff; display: none; }
+    #tab-ink { height: 2px; width: 0; background: #c00; transition: width 200ms ease-out; }
+    #tab-ink.selected { width: 200px; }
+    #far { position: absolute; top: 5500px; }
+</style></head><body>
+    <button id="menu-trigger" onclick="document.getElementById('menu').classList.add('opened')">menu</button>
+    <button id="dialog-trigger" onclick="openDialog()">dialog</button>
+    <button id="scroll-trigger" onclick="document.getElementById('far').scrollIntoView({behavior: 'smooth'})">scroll</button>
+    <button id="tab-trigger" onclick="document.getElementById('tab-ink').classList.add('selected')">tab</button>
+    <div id="tab-ink"></div>
+    <div id="menu"><div id="menu-item">item</div></div>
+    <div id="backdrop"></div>
+    <div id="dialog"><button id="dialog-button">ok</button></div>
+    <div id="far"><button id="far-button">far</button></div>
+    <script>
+        function openDialog() {
+            document.getElementById('backdrop').classList.add('opened');
+            var dialog = document.getElementById('dialog');
+            dialog.style.display = 'block';
+            // neon-animation: scale-up-animation + fade-in-animation
+            dialog.animate([{transform: 'scale(0.8)', opacity: 0}, {transform: 'scale(1)', opacity: 1}], {duration: 400, easing: 'cubic-bezier(0.4, 0, 0.2, 1)'});
+        }
+    </script>
+</body></html>'''
+
+# trigger id -> target id
+SYNTHETIC_STEPS = [
+    ('menu-trigger', 'menu-item'),
+    ('dialog-trigger', 'dialog-button'),
+    ('scroll-trigger', 'far-button'),
+    ('tab-trigger', 'tab-ink')
+]
+
+# returns the target's position while it's not ready, null when it is
+READY_JS = '''
+var target = arguments[0], rect = target.getBoundingClientRect();
+var running = (document.getAnimations ? document.getAnimations() : []).filter(function (animation) {
+    return animation.playState === 'running' && isFinite(animation.effect.getComputedTiming().endTime);
+});
+var visible = rect.width > 0 && rect.height > 0 && rect.top >= 0 && rect.bottom <= window.innerHeight && getComputedStyle(target).visibility !== 'hidden';
+
+return visible && !running.length ? [rect.left, rect.top, rect.width, rect.height].join(',') : null;
+'''
+
+POLL_SECONDS = 0.01
+STEP_TIMEOUT_SECONDS = 10
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# seconds from the click until READY_JS reported the same position twice in a row
+def measure_step(driver, trigger, target_locator) -> Optional[float]:
+    start_time = time.time()
+    trigger.click()
+    last_position = None
+
+    while time.time() - start_time < STEP_TIMEOUT_SECONDS:
+        try:
+            position = driver.execute_script(READY_JS, target_locator())
+        except Exception:
+            position = None
+
+        if position is not None and position == last_position:
+            return time.time() - start_time
+
+        last_position = position
+        time.sleep(POLL_SECONDS)
+
+    return None
+
+def bench_synthetic(driver, page_path: str, suppress: bool, repeat: int) -> Dict[str, List[float]]:
+    results = {}
+
+    for _ in range(repeat):
+        driver.get('file://' + page_path)
+
+        if suppress:
+            animation_suppression.suppress(driver)
+
+        for trigger_id, target_id in SYNTHETIC_STEPS:
+            # every step starts from a fresh page, so the scroll position and open overlays don't carry over
+            driver.execute_script('window.scrollTo(0, 0); document.getElementById(\'backdrop\').classList.remove(\'opened\'); document.getElementById(\'dialog\').style.display = \'none\';')
+            latency = measure_step(driver, driver.find_element_by_id(trigger_id), lambda: driver.find_element_by_id(target_id))
+
+            if latency is not None:
+                results.setdefault(trigger_id, []).append(latency)
+
+    return results
+
+# the menus bulk_set_videos_to_private and __change_to_private_on_current_page click through
+def bench_studio(youtube, suppress: bool, repeat: int) -> Dict[str, List[float]]:
+    from selenium.webdriver.common.keys import Keys
+    from zs_selenium_youtube.youtube import YT_PROFILE_CONTENT_URL
+
+    youtube.suppress_animations = suppress
+    results = {}
+    driver = youtube.browser.driver
+
+    for _ in range(repeat):
+        youtube.get(YT_PROFILE_CONTENT_URL.format(youtube.current_user_id), force=True)
+        # force=True reloads the page, so nothing is left injected from the other mode
+        youtube.browser.find_by('ytcp-video-row', timeout=15)
+
+        steps = [
+            ('filter-menu', lambda: youtube.browser.find_by('input', class_='text-input style-scope ytcp-chip-bar'), lambda: youtube.browser.find_by('paper-item', id='text-item-6')),
+            ('select-all', lambda: youtube.browser.find_by('ytcp-checkbox-lit', id='selection-checkbox'), lambda: youtube.browser.find_by('ytcp-select', class_='top-dropdown bulk-actions-edit style-scope ytcp-bulk-actions'))
+        ]
+
+        for name, trigger, target in steps:
+            latency = measure_step(driver, trigger(), target)
+
+            if latency is not None:
+                results.setdefault(name, []).append(latency)
+
+            driver.find_element_by_tag_name('body').send_keys(Keys.ESCAPE)
+
+    return results
+
+def print_results(title: str, normal: Dict[str, List[float]], suppressed: Dict[str, List[float]]) -> None:
+    print(title)
+    print('{:<16} {:>12} {:>12} {:>10}'.format('step', 'normal ms', 'suppressed', 'saved'))
+    total_normal, total_suppressed = 0, 0
+
+    for step in normal:
+        if step not in suppressed:
+            continue
+
+        normal_ms = statistics.median(normal[step]) * 1000
+        suppressed_ms = statistics.median(suppressed[step]) * 1000
+        total_normal += normal_ms
+        total_suppressed += suppressed_ms
+        print('{:<16} {:>12.1f} {:>12.1f} {:>9.0f}%'.format(step, normal_ms, suppressed_ms, 100 * (1 - suppressed_ms / normal_ms) if normal_ms else 0))
+
+    print('{:<16} {:>12.1f} {:>12.1f}'.format('total', total_normal, total_suppressed))
+    print('fixed settle sleep per step: {:.2f}s -> {:.2f}s'.format(0.5, animation_suppression.SETTLE_SECONDS))
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--no-headless', action='store_true')
+    parser.add_argument('--studio', action='store_true')
+    parser.add_argument('--cookies-folder-path', default=None)
+    parser.add_argument('--cookies-id', default=None)
+    args = parser.parse_args()
+
+    from selenium_firefox import Firefox
+
+    page_path = os.path.join(tempfile.mkdtemp(prefix='animation_bench_'), 'page.html')
+
+    with open(page_path, 'w') as f:
+        f.write(SYNTHETIC_PAGE)
+
+    browser = Firefox(headless=not args.no_headless)
+
+    try:
+        # the first load warms up the caches of both modes
+        bench_synthetic(browser.driver, page_path, False, 1)
+        normal = bench_synthetic(browser.driver, page_path, False, args.repeat)
+        suppressed = bench_synthetic(browser.driver, page_path, True, args.repeat)
+        print_results('synthetic page, median of {}'.format(args.repeat), normal, suppressed)
+    finally:
+        browser.driver.quit()
+
+    if args.studio:
+        from zs_selenium_youtube import Youtube
+
+        youtube = Youtube(cookies_folder_path=args.cookies_folder_path, cookies_id=args.cookies_id, headless=not args.no_headless, prompt_user_input_login=False)
+
+        try:
+            normal = bench_studio(youtube, False, args.repeat)
+            suppressed = bench_studio(youtube, True, args.repeat)
+            print_results('studio, median of {}'.format(args.repeat), normal, suppressed)
+        finally:
+            youtube.quit()
+
+    os.remove(page_path)
+    os.rmdir(os.path.dirname(page_path))
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    main()
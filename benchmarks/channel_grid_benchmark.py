@@ -0,0 +1,166 @@
+# Time and peak memory of the extraction step of Youtube.get_channel_video_ids, per parser engine
+#
+# python benchmarks/channel_grid_benchmark.py
+# python benchmarks/channel_grid_benchmark.py --sizes 100 1000 --corpus-folder-path ./recorded_channel_pages
+#
+# Every engine runs in its own subprocess, so the peak RSS of one does not hide the next one's.
+# The output of every engine is compared with the bs4 reference on every input.
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Tuple
+import os, sys, json, time, random, string, argparse, resource, subprocess, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local
+from zs_selenium_youtube.channel_grid import extract_video_ids, SelectolaxParser
+from zs_selenium_youtube.enums.html_parser_engine import HtmlParserEngine
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+DEFAULT_SIZES = [100, 1000, 10000, 50000]
+IGNORED_TITLES = ['Channel trailer', 'Ignored upload']
+
+ITEM_TEMPLATE = '''<ytd-grid-video-renderer class="style-scope yt-horizontal-list-renderer" lockup="">
+<div id="dismissible" class="style-scope ytd-grid-video-renderer">
+<ytd-thumbnail use-hovered-property="" width="210" class="style-scope ytd-grid-video-renderer">
+<a id="thumbnail" class="yt-simple-endpoint inline-block style-scope ytd-thumbnail" aria-hidden="true" tabindex="-1" rel="null" href="/watch?v={id}">
+<yt-img-shadow ftl-eligible="" class="style-scope ytd-thumbnail no-transition" style="background-color: transparent;"><img id="img" class="style-scope yt-img-shadow" alt="" width="210" src="https://i.ytimg.com/vi/{id}/hqdefault.jpg?sqp=-oaymwEjCNACELwBSFryq4qpAxUIARUAAAAAGAElAADIQj0AgKJDeAE=&amp;rs=AOn4CLC"></yt-img-shadow>
+<div id="overlays" class="style-scope ytd-thumbnail"><ytd-thumbnail-overlay-time-status-renderer class="style-scope ytd-thumbnail" overlay-style="DEFAULT"><span class="style-scope ytd-thumbnail-overlay-time-status-renderer" aria-label="{minutes} minutes">{minutes}:{seconds:02d}</span></ytd-thumbnail-overlay-time-status-renderer></div>
+</a></ytd-thumbnail>
+<div id="details" class="style-scope ytd-grid-video-renderer"><div id="meta" class="style-scope ytd-grid-video-renderer">
+<h3 class="style-scope ytd-grid-video-renderer"><ytd-badge-supported-renderer class="style-scope ytd-grid-video-renderer" disable-upgrade="" hidden=""></ytd-badge-supported-renderer>
+<a id="video-title" class="yt-simple-endpoint style-scope ytd-grid-video-renderer" aria-label="{title} by Channel {views} views {minutes} minutes" href="/watch?v={id}{extra}" title="{title}">{title}</a>
+</h3><div id="metadata-container" class="style-scope ytd-grid-video-renderer"><div id="metadata-line" class="style-scope ytd-grid-video-renderer">
+<span class="style-scope ytd-grid-video-renderer">{views} views</span><span class="style-scope ytd-grid-video-renderer">{days} days ago</span>
+</div></div></div></div></div></ytd-grid-video-renderer>
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+def video_id(rnd: random.Random) -> str:
+    return ''.join(rnd.choice(string.ascii_letters + string.digits + '-_') for _ in range(11))
+
+# grid page with ~1% duplicated items (the grid re-renders while scrolling) and some ignored titles
+def synthetic_page(video_count: int, seed: int = 0) -> str:
+    rnd = random.Random(seed)
+    ids = [video_id(rnd) for _ in range(video_count)]
+    items = []
+
+    for i, id_ in enumerate(ids):
+        if i > 0 and rnd.random() < 0.01:
+            id_ = ids[rnd.randrange(i)]
+
+        title = rnd.choice(IGNORED_TITLES) if rnd.random() < 0.01 else 'Video {} - {}'.format(i, ''.join(rnd.choice(string.ascii_letters + ' ') for _ in range(40)))
+        items.append(ITEM_TEMPLATE.format(
+            id=id_,
+            extra='&amp;t=10s' if rnd.random() < 0.05 else '',
+            title=title.replace('"', ''),
+            minutes=rnd.randrange(1, 60),
+            seconds=rnd.randrange(60),
+            views=rnd.randrange(1000000),
+            days=rnd.randrange(1, 1000)
+        ))
+
+    return '<!DOCTYPE html><html><head><title>Channel - YouTube</title></head><body><ytd-app><div id="items" class="style-scope ytd-grid-renderer">' \
+        + ''.join(items) + '</div></ytd-app></body></html>'
+
+def load_inputs(sizes: List[int], corpus_folder_path: str) -> List[Tuple[str, str]]:
+    inputs = [('synthetic-{}'.format(size), synthetic_page(size)) for size in sizes]
+
+    if corpus_folder_path:
+        for file_name in sorted(os.listdir(corpus_folder_path)):
+            if file_name.endswith('.html'):
+                with open(os.path.join(corpus_folder_path, file_name), 'r', encoding='utf-8') as f:
+                    inputs.append((file_name, f.read()))
+
+    return inputs
+
+# runs in the subprocess
+def measure(engine: HtmlParserEngine, page_source: str, repeat: int) -> dict:
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    tracemalloc.start()
+    video_ids = extract_video_ids(page_source, IGNORED_TITLES, engine=engine)
+    _, python_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    seconds = []
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        extract_video_ids(page_source, IGNORED_TITLES, engine=engine)
+        seconds.append(time.perf_counter() - start_time)
+
+    return {
+        'seconds': min(seconds),
+        'python_peak_bytes': python_peak,
+        # ru_maxrss is in kilobytes on linux, in bytes on macos
+        'rss_growth_bytes': (rss_after - rss_before) * (1 if sys.platform == 'darwin' else 1024),
+        'video_ids': video_ids
+    }
+
+def run_child(engine: HtmlParserEngine, name: str, args: argparse.Namespace) -> dict:
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--child', engine.value, name, '--repeat', str(args.repeat), '--sizes'] + [str(s) for s in args.sizes]
+        + (['--corpus-folder-path', args.corpus_folder_path] if args.corpus_folder_path else []),
+        stdout=subprocess.PIPE,
+        check=True
+    ).stdout
+
+    return json.loads(out)
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--corpus-folder-path', default=None)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--child', nargs=2, default=None)
+    args = parser.parse_args()
+
+    if args.child:
+        engine, name = HtmlParserEngine(args.child[0]), args.child[1]
+        page_source = dict(load_inputs(args.sizes, args.corpus_folder_path))[name]
+        print(json.dumps(measure(engine, page_source, args.repeat)))
+
+        return
+
+    engines = [HtmlParserEngine.BS4, HtmlParserEngine.LXML] + ([HtmlParserEngine.SELECTOLAX] if SelectolaxParser else [])
+    names = [name for name, _ in load_inputs(args.sizes, args.corpus_folder_path)]
+
+    print('{:<24} {:<11} {:>10} {:>8} {:>14} {:>14} {:>9}'.format('input', 'engine', 'seconds', 'speedup', 'py peak MB', 'rss growth MB', 'identical'))
+
+    for name in names:
+        reference = None
+
+        for engine in engines:
+            res = run_child(engine, name, args)
+            reference = reference or res
+
+            print('{:<24} {:<11} {:>10.4f} {:>7.1f}x {:>14.1f} {:>14.1f} {:>9}'.format(
+                name,
+                engine.value,
+                res['seconds'],
+                reference['seconds'] / res['seconds'] if res['seconds'] else 0,
+                res['python_peak_bytes'] / 1024 / 1024,
+                res['rss_growth_bytes'] / 1024 / 1024,
+                str(res['video_ids'] == reference['video_ids'])
+            ))
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    main()
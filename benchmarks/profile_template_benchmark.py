@@ -0,0 +1,158 @@
+# Compares preparing the profile of a session the way it is done without a template (fresh selenium profile, zipped for
+# geckodriver, addons installed into it) with cloning a prebuilt template, that firefox is started on directly
+#
+# python benchmarks/profile_template_benchmark.py --accounts 20
+# python benchmarks/profile_template_benchmark.py --source-profile ~/.mozilla/firefox/xxx.default --accounts 20
+# python benchmarks/profile_template_benchmark.py --launch --addons-folder-path ./addons --accounts 3
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, List
+import os, sys, time, uuid, shutil, tempfile, argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Pip
+from selenium.webdriver.firefox.firefox_profile import FirefoxProfile
+
+# Local
+from zs_selenium_youtube.profile_template import ProfileTemplate, TEMPLATE_READY_FILE_NAME
+from zs_selenium_youtube.utils.file_clone import CloneStats, tree_size
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# roughly the shape of a real profile: a few big addons, a handful of sqlite databases and lots of small files
+def create_synthetic_profile(path: str) -> None:
+    os.makedirs(os.path.join(path, 'extensions'), exist_ok=True)
+    os.makedirs(os.path.join(path, 'storage', 'default'), exist_ok=True)
+
+    for i in range(3):
+        with open(os.path.join(path, 'extensions', 'addon{}@bench.xpi'.format(i)), 'wb') as f:
+            f.write(os.urandom(2 * 1024 * 1024))
+
+    for name in ['places.sqlite', 'favicons.sqlite', 'permissions.sqlite', 'webappsstore.sqlite', 'storage.sqlite']:
+        with open(os.path.join(path, name), 'wb') as f:
+            f.write(os.urandom(1024 * 1024))
+
+    for i in range(200):
+        with open(os.path.join(path, 'storage', 'default', 'file{}.json'.format(i)), 'wb') as f:
+            f.write(os.urandom(4 * 1024))
+
+    with open(os.path.join(path, 'prefs.js'), 'w') as f:
+        f.write('user_pref("browser.startup.homepage", "about:blank");\n')
+
+def addon_paths(profile_path: str) -> List[str]:
+    extensions_folder_path = os.path.join(profile_path, 'extensions')
+
+    return [os.path.join(extensions_folder_path, file_name) for file_name in sorted(os.listdir(extensions_folder_path)) if file_name.endswith('.xpi')]
+
+# what a session does today without a template, up to firefox starting:
+# a fresh FirefoxProfile with the prefs, encoded for geckodriver, then every addon is installed into it
+def bench_fresh(addons: List[str], accounts: int) -> (float, int):
+    bytes_written = 0
+    start_time = time.time()
+
+    for i in range(accounts):
+        profile = FirefoxProfile()
+        profile.set_preference('intl.accept_languages', 'en-us')
+        profile.update_preferences()
+        # zipped and base64 encoded into the capabilities sent to geckodriver, which writes it out again as its own copy
+        bytes_written += len(profile.encoded)
+
+        extensions_folder_path = os.path.join(profile.path, 'extensions')
+        os.makedirs(extensions_folder_path, exist_ok=True)
+
+        for addon_path in addons:
+            shutil.copy(addon_path, extensions_folder_path)
+
+        bytes_written += tree_size(profile.path)
+        shutil.rmtree(profile.path, ignore_errors=True)
+
+    return time.time() - start_time, bytes_written
+
+def create_template(source_path: str, work_folder_path: str) -> ProfileTemplate:
+    template = ProfileTemplate(os.path.join(work_folder_path, 'templates'))
+
+    # use the source profile as an already built template instead of launching firefox
+    shutil.copytree(source_path, template.path)
+
+    with open(os.path.join(template.path, TEMPLATE_READY_FILE_NAME), 'w') as f:
+        f.write(str(time.time()))
+
+    return template
+
+# what ProfileTemplate.webdriver_class does before firefox starts: selenium_firefox's profile is only read for its prefs
+def bench_template(template: ProfileTemplate, accounts: int) -> (float, CloneStats):
+    stats = CloneStats()
+    start_time = time.time()
+
+    for i in range(accounts):
+        profile = FirefoxProfile()
+        profile.set_preference('intl.accept_languages', 'en-us')
+        profile.update_preferences()
+        prefs = dict(profile.default_preferences)
+        shutil.rmtree(profile.path, ignore_errors=True)
+
+        template.create_profile(uuid.uuid4().hex, prefs=prefs, stats=stats)
+
+    return time.time() - start_time, stats
+
+def bench_launch(addons_folder_path: Optional[str], work_folder_path: str, accounts: int) -> None:
+    from zs_selenium_youtube import Youtube
+
+    template = ProfileTemplate(os.path.join(work_folder_path, 'launch_templates'), addons_folder_path=addons_folder_path)
+    template.build()
+
+    for name, kwargs in [
+        ('fresh', {'addons_folder_path': addons_folder_path}),
+        ('template', {'profile_template': template})
+    ]:
+        start_time = time.time()
+
+        for i in range(accounts):
+            Youtube(cookies_id='bench{}'.format(i), headless=True, prompt_user_input_login=False, **kwargs).quit()
+
+        print('launch {:<10} {:8.2f}s per session'.format(name, (time.time() - start_time) / accounts))
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--accounts', type=int, default=20)
+    parser.add_argument('--source-profile', default=None)
+    parser.add_argument('--launch', action='store_true')
+    parser.add_argument('--addons-folder-path', default=None)
+    args = parser.parse_args()
+
+    work_folder_path = tempfile.mkdtemp(prefix='profile_template_bench_')
+
+    try:
+        source_path = args.source_profile
+
+        if not source_path:
+            source_path = os.path.join(work_folder_path, 'source')
+            create_synthetic_profile(source_path)
+
+        fresh_seconds, fresh_bytes = bench_fresh(addon_paths(source_path), args.accounts)
+        template = create_template(source_path, work_folder_path)
+        template_seconds, stats = bench_template(template, args.accounts)
+
+        print('profile size: {:.1f} MB, accounts: {}'.format(tree_size(source_path) / 1024 / 1024, args.accounts))
+        print('fresh      {:8.3f}s {:10.1f} MB written'.format(fresh_seconds, fresh_bytes / 1024 / 1024))
+        print('template   {:8.3f}s {:10.1f} MB written {}'.format(template_seconds, stats.bytes_written / 1024 / 1024, stats))
+        print('the fresh profile still has to be initialized by firefox on its first start, use --launch to include that')
+
+        if args.launch:
+            bench_launch(args.addons_folder_path, work_folder_path, args.accounts)
+    finally:
+        shutil.rmtree(work_folder_path, ignore_errors=True)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ python3 -m pip install -U beautifulsoup4==4.9.1
 python3 -m pip install -U kcu==0.0.55
 python3 -m pip install -U kstopit==0.0.10
 python3 -m pip install -U kyoutubescraper==0.0.2
+python3 -m pip install -U lxml==4.9.3
 python3 -m pip install -U selenium==3.141.0
-python3 -m pip install -U selenium-firefox==1.0.2
-python3 -m pip install -U selenium-uploader-account==0.0.5
\ No newline at end of file
+python3 -m pip install -U selenium-firefox==1.0.35
+python3 -m pip install -U selenium-uploader-account==0.0.12
\ No newline at end of file
@@ -0,0 +1,234 @@
+# python -m unittest tests.test_job_queue
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+import os, sys, shutil, tempfile, threading, time, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local
+from zs_selenium_youtube.enums.action_type import ActionType
+from zs_selenium_youtube.enums.job_state import JobState
+from zs_selenium_youtube.enums.upload_stage import UploadStage
+from zs_selenium_youtube.enums.visibility import Visibility
+from zs_selenium_youtube.job_queue import JobQueue, QueuedJob, SqliteJobQueue, FileSystemJobQueue
+from zs_selenium_youtube.upload_state import UploadState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+LEASE_SECONDS       = 60
+SHORT_LEASE_SECONDS = 0.2
+
+# workers racing for the same jobs, each with its own queue instance, like separate hosts
+RACING_WORKERS      = 8
+RACED_JOBS          = 20
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: _JobQueueTests --------------------------------------------------------- #
+
+# the behaviour every JobQueue backend has to guarantee, run once per backend by the test cases below
+class _JobQueueTests:
+
+    # ------------------------------------------------------------ Setup ------------------------------------------------------------- #
+
+    def setUp(self) -> None:
+        self.folder_path = tempfile.mkdtemp()
+        self.queues = []
+        self.queue = self.open_queue()
+
+    def tearDown(self) -> None:
+        for queue in self.queues:
+            if hasattr(queue, 'close'):
+                queue.close()
+
+        shutil.rmtree(self.folder_path, ignore_errors=True)
+
+
+    # ------------------------------------------------------------ Tests ------------------------------------------------------------- #
+
+    def test_claim_is_exclusive(self) -> None:
+        job_ids = [self.queue.enqueue(QueuedJob('account', ActionType.OTHER)).job_id for _ in range(RACED_JOBS)]
+        queues = [self.open_queue() for _ in range(RACING_WORKERS)]
+        claimed = []
+        lock = threading.Lock()
+
+        def work(queue: JobQueue, worker_id: str) -> None:
+            while True:
+                job = queue.claim(worker_id, LEASE_SECONDS)
+
+                if not job:
+                    return
+
+                with lock:
+                    claimed.append(job.job_id)
+
+        threads = [threading.Thread(target=work, args=(queue, 'worker{}'.format(i))) for i, queue in enumerate(queues)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        # every job exactly once
+        self.assertEqual(sorted(claimed), sorted(job_ids))
+        self.assertEqual(self.queue.counts().get(JobState.LEASED.value), RACED_JOBS)
+
+    def test_claim_order_and_accounts(self) -> None:
+        low = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, priority=0))
+        high = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, priority=5))
+        other = self.queue.enqueue(QueuedJob('other_account', ActionType.OTHER, priority=10))
+
+        self.assertEqual(self.queue.claim('worker', LEASE_SECONDS, account_ids=['account']).job_id, high.job_id)
+        self.assertEqual(self.queue.claim('worker', LEASE_SECONDS, account_ids=['account']).job_id, low.job_id)
+        self.assertIsNone(self.queue.claim('worker', LEASE_SECONDS, account_ids=['account']))
+        self.assertIsNone(self.queue.claim('worker', LEASE_SECONDS, account_ids=[]))
+        self.assertEqual(self.queue.claim('worker', LEASE_SECONDS).job_id, other.job_id)
+
+    def test_expired_lease_is_requeued(self) -> None:
+        job = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, max_attempts=2))
+
+        self.assertIsNotNone(self.queue.claim('lost', SHORT_LEASE_SECONDS))
+        time.sleep(SHORT_LEASE_SECONDS + 0.1)
+
+        # the lost worker can do nothing with it anymore, even before anyone claimed it again
+        self.assertFalse(self.queue.renew(job.job_id, 'lost', LEASE_SECONDS))
+
+        reclaimed = self.queue.claim('new', LEASE_SECONDS)
+
+        self.assertEqual(reclaimed.job_id, job.job_id)
+        self.assertEqual(reclaimed.attempts, 2)
+        self.assertFalse(self.queue.complete(job.job_id, 'lost'))
+        self.assertTrue(self.queue.complete(job.job_id, 'new', result='ok'))
+        self.assertEqual(self.queue.get(job.job_id).state, JobState.SUCCEEDED)
+        self.assertEqual(self.queue.get(job.job_id).result, 'ok')
+
+    def test_expired_lease_without_attempts_left_fails(self) -> None:
+        job = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, max_attempts=1))
+
+        self.queue.claim('lost', SHORT_LEASE_SECONDS)
+        time.sleep(SHORT_LEASE_SECONDS + 0.1)
+
+        self.assertIsNone(self.queue.claim('new', LEASE_SECONDS))
+        self.assertEqual(self.queue.get(job.job_id).state, JobState.FAILED)
+        self.assertIn('expired', self.queue.get(job.job_id).error)
+
+    def test_only_the_owner_can_finish_the_job(self) -> None:
+        job = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, max_attempts=2))
+        self.queue.claim('owner', SHORT_LEASE_SECONDS)
+
+        self.assertFalse(self.queue.renew(job.job_id, 'other', LEASE_SECONDS))
+        self.assertFalse(self.queue.complete(job.job_id, 'other'))
+        self.assertFalse(self.queue.fail(job.job_id, 'other', 'error'))
+        self.assertFalse(self.queue.release(job.job_id, 'other'))
+
+        # renewed, it outlives the short lease
+        self.assertTrue(self.queue.renew(job.job_id, 'owner', LEASE_SECONDS))
+        time.sleep(SHORT_LEASE_SECONDS + 0.1)
+        self.assertIsNone(self.queue.claim('other', LEASE_SECONDS))
+
+        self.assertTrue(self.queue.fail(job.job_id, 'owner', 'error', retry=True))
+        self.assertEqual(self.queue.get(job.job_id).state, JobState.PENDING)
+
+        self.queue.claim('owner', LEASE_SECONDS)
+        self.assertTrue(self.queue.fail(job.job_id, 'owner', 'error', retry=True))
+
+        # out of attempts
+        self.assertEqual(self.queue.get(job.job_id).state, JobState.FAILED)
+
+    def test_release_does_not_count_as_attempt(self) -> None:
+        job = self.queue.enqueue(QueuedJob('account', ActionType.OTHER))
+        self.queue.claim('worker', LEASE_SECONDS)
+
+        self.assertTrue(self.queue.release(job.job_id, 'worker'))
+        self.assertEqual(self.queue.get(job.job_id).attempts, 0)
+        self.assertEqual(self.queue.claim('worker', LEASE_SECONDS).attempts, 1)
+
+    def test_enqueue_is_idempotent(self) -> None:
+        first = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, idempotency_key='key'))
+        second = self.open_queue().enqueue(QueuedJob('account', ActionType.OTHER, idempotency_key='key'))
+        other = self.queue.enqueue(QueuedJob('account', ActionType.OTHER, idempotency_key='other key'))
+
+        self.assertEqual(second.job_id, first.job_id)
+        self.assertNotEqual(other.job_id, first.job_id)
+        self.assertEqual(self.queue.counts().get(JobState.PENDING.value), 2)
+
+    def test_upload_state_survives_the_retry(self) -> None:
+        job = self.queue.enqueue(QueuedJob(
+            'account',
+            ActionType.UPLOAD,
+            payload={'video_path': '/videos/video.mp4', 'title': 'title', 'visibility': Visibility.PRIVATE}
+        ))
+        claimed = self.queue.claim('first_host', LEASE_SECONDS)
+        upload_state = UploadState('/videos/video.mp4', video_id='video_id', stage=UploadStage.TAGS_SET, transfer_complete=True)
+
+        # what QueueWorker hands back with the failed attempt
+        self.assertTrue(self.queue.fail(job.job_id, 'first_host', 'error', payload=dict(claimed.payload, upload_state=upload_state.to_dict())))
+
+        retried = self.open_queue().claim('second_host', LEASE_SECONDS)
+        resumed = UploadState.from_dict(retried.payload['upload_state'])
+
+        self.assertEqual(retried.job_id, job.job_id)
+        self.assertEqual(retried.payload['visibility'], Visibility.PRIVATE.name)
+        self.assertEqual(retried.payload['title'], 'title')
+        self.assertEqual(resumed.video_id, 'video_id')
+        self.assertEqual(resumed.stage, UploadStage.TAGS_SET)
+        self.assertTrue(resumed.transfer_complete)
+        self.assertTrue(resumed.is_resumable)
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # another instance on the same storage, as another host would open it
+    def open_queue(self) -> JobQueue:
+        queue = self.create_queue()
+        self.queues.append(queue)
+
+        return queue
+
+    def create_queue(self) -> JobQueue:
+        raise NotImplementedError
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------ class: SqliteJobQueueTest ------------------------------------------------------- #
+
+class SqliteJobQueueTest(_JobQueueTests, unittest.TestCase):
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def create_queue(self) -> JobQueue:
+        return SqliteJobQueue(os.path.join(self.folder_path, 'jobs.db'))
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------- class: FileSystemJobQueueTest ----------------------------------------------------- #
+
+class FileSystemJobQueueTest(_JobQueueTests, unittest.TestCase):
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def create_queue(self) -> JobQueue:
+        return FileSystemJobQueue(self.folder_path)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# python -m unittest tests.test_job_scheduler
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+import os, sys, threading, time, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local
+from zs_selenium_youtube.enums.action_type import ActionType
+from zs_selenium_youtube.scheduler import JobScheduler, RateLimit
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+RESULT_TIMEOUT_SECONDS = 5
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: _FakeSession ---------------------------------------------------------- #
+
+# stands in for a Youtube session, only quit() is called by the scheduler
+class _FakeSession:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, account_id: str):
+        self.account_id = account_id
+        self.quit_count = 0
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def quit(self) -> bool:
+        self.quit_count += 1
+
+        return True
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: JobSchedulerTest -------------------------------------------------------- #
+
+class JobSchedulerTest(unittest.TestCase):
+
+    # ------------------------------------------------------------ Setup ------------------------------------------------------------- #
+
+    def setUp(self) -> None:
+        self.sessions = []
+        self.scheduler = None
+
+    def tearDown(self) -> None:
+        if self.scheduler:
+            self.scheduler.stop(wait=False)
+
+
+    # ------------------------------------------------------------ Tests ------------------------------------------------------------- #
+
+    def test_higher_priority_runs_first(self) -> None:
+        self.scheduler = self.__scheduler(max_workers=1)
+        order = []
+        jobs = [
+            self.scheduler.submit('account', lambda session, name=name: order.append(name), priority=priority)
+            for name, priority in [('low', 0), ('high', 10), ('medium', 5), ('low2', 0)]
+        ]
+
+        self.scheduler.start()
+        self.__wait(jobs)
+
+        self.assertEqual(order, ['high', 'medium', 'low', 'low2'])
+
+    def test_account_rate_limit_spaces_the_jobs(self) -> None:
+        # 5 per second, a token every 0.2s after the first one
+        self.scheduler = self.__scheduler(max_workers=2, account_rate_limit=RateLimit(rate_per_hour=5*3600, burst=1))
+        start_times = []
+        jobs = [self.scheduler.submit('account', lambda session: start_times.append(time.monotonic())) for _ in range(3)]
+
+        self.scheduler.start()
+        self.__wait(jobs)
+
+        gaps = [b - a for a, b in zip(start_times, start_times[1:])]
+
+        self.assertEqual(len(gaps), 2)
+
+        for gap in gaps:
+            self.assertGreaterEqual(gap, 0.15)
+            self.assertLess(gap, 1)
+
+    def test_throttled_account_does_not_block_the_others(self) -> None:
+        self.scheduler = self.__scheduler(max_workers=1, action_rate_limits={ActionType.UPLOAD: RateLimit(rate_per_hour=1, burst=1)})
+        order = []
+        first_upload = self.scheduler.submit('throttled', lambda session: order.append('upload1'), action=ActionType.UPLOAD, priority=10)
+        second_upload = self.scheduler.submit('throttled', lambda session: order.append('upload2'), action=ActionType.UPLOAD, priority=10)
+        others = [self.scheduler.submit('free', lambda session, i=i: order.append('free{}'.format(i))) for i in range(3)]
+
+        self.scheduler.start()
+        self.__wait([first_upload] + others)
+
+        # the only worker went on with the other account, while the second upload waits for its token
+        self.assertEqual(order, ['upload1', 'free0', 'free1', 'free2'])
+        self.assertFalse(second_upload.future.done())
+        self.assertEqual(self.scheduler.metrics_dict()['queue_depth'], 1)
+
+    def test_busy_account_hands_the_worker_to_the_others(self) -> None:
+        self.scheduler = self.__scheduler(max_workers=2)
+        release = threading.Event()
+        started = threading.Event()
+        running_during_block = []
+
+        def block(session) -> None:
+            started.set()
+            release.wait(RESULT_TIMEOUT_SECONDS)
+
+        blocking = self.scheduler.submit('busy', block)
+        queued_behind = self.scheduler.submit('busy', lambda session: running_during_block.append(release.is_set()))
+        others = [self.scheduler.submit('free', lambda session: 'done') for _ in range(3)]
+
+        self.scheduler.start()
+        self.assertTrue(started.wait(RESULT_TIMEOUT_SECONDS))
+        self.__wait(others)
+
+        # one session runs one job at a time, the second job of the busy account waited, the other account did not
+        self.assertFalse(queued_behind.future.done())
+
+        release.set()
+        self.__wait([blocking, queued_behind])
+
+        self.assertEqual(running_during_block, [True])
+
+    def test_stop_quits_the_sessions(self) -> None:
+        self.scheduler = self.__scheduler(max_workers=2)
+        jobs = [self.scheduler.submit(account_id, lambda session: session.account_id) for account_id in ['a', 'b', 'a']]
+
+        self.scheduler.start()
+        self.__wait(jobs)
+
+        # one session per account
+        self.assertEqual(sorted(session.account_id for session in self.sessions), ['a', 'b'])
+
+        self.scheduler.stop()
+
+        self.assertEqual([session.quit_count for session in self.sessions], [1, 1])
+        self.assertIsNone(self.scheduler.session('a'))
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __scheduler(self, **kwargs) -> JobScheduler:
+        return JobScheduler(self.__provide_session, **kwargs)
+
+    def __provide_session(self, account_id: str) -> _FakeSession:
+        session = _FakeSession(account_id)
+        self.sessions.append(session)
+
+        return session
+
+    @staticmethod
+    def __wait(jobs: list) -> None:
+        for job in jobs:
+            job.result(timeout=RESULT_TIMEOUT_SECONDS)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+# python -m unittest tests.test_proxy_pool
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import os, sys, socket, threading, time, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Pip
+from selenium_uploader_account import Proxy
+
+# Local
+from zs_selenium_youtube.proxy_pool import ProxyPool
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# answered by the stand-in proxies themselves, nothing is resolved or fetched
+PROBE_URL           = 'http://probe.test/generate_204'
+QUARANTINE_SECONDS  = 0.5
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------- class: _StandInProxyHandler ------------------------------------------------------ #
+
+# answers every proxied GET with 204
+class _StandInProxyHandler(BaseHTTPRequestHandler):
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def do_GET(self) -> None:
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: ProxyPoolTest --------------------------------------------------------- #
+
+class ProxyPoolTest(unittest.TestCase):
+
+    # ------------------------------------------------------------ Setup ------------------------------------------------------------- #
+
+    def setUp(self) -> None:
+        self.servers = []
+        self.live_proxy = self.__start_stand_in()
+        self.dead_proxy = Proxy('127.0.0.1', self.__free_port())
+        self.pool = ProxyPool(
+            [self.live_proxy, self.dead_proxy],
+            probe_url=PROBE_URL,
+            probe_timeout_seconds=2,
+            quarantine_seconds=QUARANTINE_SECONDS,
+            max_quarantine_seconds=QUARANTINE_SECONDS * 4,
+            max_consecutive_failures=1
+        )
+
+    def tearDown(self) -> None:
+        self.pool.stop()
+
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+
+    # ------------------------------------------------------------ Tests ------------------------------------------------------------- #
+
+    def test_dead_proxy_is_quarantined_and_readmitted(self) -> None:
+        results = self.pool.probe_all()
+
+        self.assertTrue(results[ProxyPool.proxy_id(self.live_proxy)])
+        self.assertFalse(results[ProxyPool.proxy_id(self.dead_proxy)])
+        self.assertTrue(self.pool.is_healthy(self.live_proxy))
+        self.assertFalse(self.pool.is_healthy(self.dead_proxy))
+
+        # only the live one is handed out meanwhile
+        for i in range(5):
+            self.assertEqual(ProxyPool.proxy_id(self.pool.acquire('account{}'.format(i))), ProxyPool.proxy_id(self.live_proxy))
+
+        # still quarantined, the proxy comes back, but the quarantine is not over yet
+        self.__start_stand_in(self.dead_proxy.port)
+        self.assertEqual(self.pool.probe_all(only_expired_quarantine=True), {})
+        self.assertFalse(self.pool.is_healthy(self.dead_proxy))
+
+        time.sleep(QUARANTINE_SECONDS + 0.1)
+
+        self.assertTrue(self.pool.probe_all(only_expired_quarantine=True)[ProxyPool.proxy_id(self.dead_proxy)])
+        self.assertTrue(self.pool.is_healthy(self.dead_proxy))
+
+    def test_release_gives_back_the_account_load(self) -> None:
+        self.pool.probe_all()
+        self.__start_stand_in(self.dead_proxy.port)
+        time.sleep(QUARANTINE_SECONDS + 0.1)
+        self.pool.probe_all(only_expired_quarantine=True)
+
+        live_id = ProxyPool.proxy_id(self.live_proxy)
+
+        for i in range(3):
+            self.pool.acquire('account{}'.format(i))
+
+        assigned = sum(metrics['accounts'] for metrics in self.pool.metrics().values())
+        self.assertEqual(assigned, 3)
+
+        for i in range(3):
+            self.pool.release('account{}'.format(i))
+
+        self.assertEqual(sum(metrics['accounts'] for metrics in self.pool.metrics().values()), 0)
+        self.assertIsNone(self.pool.assigned_proxy('account0'))
+        self.assertIn(live_id, self.pool.metrics())
+
+    def test_real_traffic_does_not_count_as_latency(self) -> None:
+        self.pool.probe_all()
+        live_id = ProxyPool.proxy_id(self.live_proxy)
+        probed = self.pool.metrics()[live_id]
+
+        # page loads take seconds, the probe only a round trip, using a proxy must not make it look slow
+        for _ in range(5):
+            self.pool.report_success(self.live_proxy, request_seconds=5)
+
+        metrics = self.pool.metrics()[live_id]
+
+        self.assertEqual(metrics['latency_seconds'], probed['latency_seconds'])
+        self.assertLessEqual(metrics['score'], probed['score'])
+        self.assertEqual(metrics['request_seconds'], 5)
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __start_stand_in(self, port: int = 0) -> Proxy:
+        server = ThreadingHTTPServer(('127.0.0.1', port), _StandInProxyHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.servers.append(server)
+
+        return Proxy('127.0.0.1', server.server_address[1])
+
+    # nothing listens on it, until a stand-in is started on it
+    @staticmethod
+    def __free_port() -> int:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+
+            return sock.getsockname()[1]
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+# python -m unittest tests.test_shaping_proxy
+
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import os, sys, socket, threading, time, unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Local
+from zs_selenium_youtube.shaping_proxy import ShapingProxy, SessionBandwidth
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+MAX_DOWNLOAD_BYTES_PER_SECOND   = 512 * 1024
+CHUNK                           = b'x' * 16 * 1024
+
+# the first second fills the socket buffers and the buckets, only the one after it is measured
+WARMUP_SECONDS                  = 1
+MEASURE_SECONDS                 = 3
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: _OriginHandler --------------------------------------------------------- #
+
+# streams until the client goes away
+class _OriginHandler(BaseHTTPRequestHandler):
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/octet-stream')
+        self.end_headers()
+
+        try:
+            while True:
+                self.wfile.write(CHUNK)
+        except OSError:
+            pass
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: ShapingProxyTest -------------------------------------------------------- #
+
+class ShapingProxyTest(unittest.TestCase):
+
+    # ------------------------------------------------------------ Setup ------------------------------------------------------------- #
+
+    def setUp(self) -> None:
+        self.origin = ThreadingHTTPServer(('127.0.0.1', 0), _OriginHandler)
+        self.origin.daemon_threads = True
+        threading.Thread(target=self.origin.serve_forever, daemon=True).start()
+        self.origin_url = 'http://127.0.0.1:{}/'.format(self.origin.server_address[1])
+        self.shaping_proxy = ShapingProxy(max_download_bytes_per_second=MAX_DOWNLOAD_BYTES_PER_SECOND)
+
+    def tearDown(self) -> None:
+        self.shaping_proxy.stop()
+        self.origin.shutdown()
+        self.origin.server_close()
+
+
+    # ------------------------------------------------------------ Tests ------------------------------------------------------------- #
+
+    def test_weights_share_the_cap(self) -> None:
+        heavy = self.shaping_proxy.register_session('heavy', bandwidth=SessionBandwidth(weight=3))
+        light = self.shaping_proxy.register_session('light', bandwidth=SessionBandwidth(weight=1))
+        received = {}
+        threads = [
+            threading.Thread(target=self.__download, args=(proxy, session_id, received))
+            for session_id, proxy in [('heavy', heavy), ('light', light)]
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        heavy_rate = received['heavy'] / MEASURE_SECONDS
+        light_rate = received['light'] / MEASURE_SECONDS
+
+        self.assertLessEqual(heavy_rate + light_rate, MAX_DOWNLOAD_BYTES_PER_SECOND * 1.15)
+        self.assertGreaterEqual(heavy_rate + light_rate, MAX_DOWNLOAD_BYTES_PER_SECOND * 0.75)
+        self.assertAlmostEqual(heavy_rate / light_rate, 3, delta=0.6)
+
+    def test_unregister_frees_the_port(self) -> None:
+        proxy = self.shaping_proxy.register_session('session')
+
+        self.assertEqual(self.shaping_proxy.register_session('session').port, proxy.port)
+        self.assertNotEqual(self.shaping_proxy.register_session('other').port, proxy.port)
+
+        # still open after the unregister, what it relays from then on is not metered
+        sock = self.__open_download(proxy)
+        self.assertTrue(sock.recv(64 * 1024))
+        self.assertIn('session', self.shaping_proxy.download_meter.session_ids())
+
+        self.shaping_proxy.unregister_session('session')
+        sock.recv(64 * 1024)
+        sock.close()
+
+        with self.assertRaises(ConnectionRefusedError):
+            socket.create_connection((proxy.host, proxy.port), timeout=1).close()
+
+        self.assertNotIn('session', self.shaping_proxy.throughput())
+        self.assertNotIn('session', self.shaping_proxy.download_shaper.rates())
+        self.assertNotIn('session', self.shaping_proxy.download_meter.session_ids())
+        self.assertNotIn('session', self.shaping_proxy.upload_meter.session_ids())
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    # counts the bytes that arrive through the session's local proxy during the measured window
+    def __download(self, proxy, session_id: str, received: dict) -> None:
+        sock = self.__open_download(proxy)
+
+        start_time = time.time()
+        measured = 0
+
+        try:
+            while True:
+                chunk = sock.recv(64 * 1024)
+                elapsed = time.time() - start_time
+
+                if not chunk or elapsed >= WARMUP_SECONDS + MEASURE_SECONDS:
+                    break
+
+                if elapsed >= WARMUP_SECONDS:
+                    measured += len(chunk)
+        finally:
+            sock.close()
+
+        received[session_id] = measured
+
+    def __open_download(self, proxy) -> socket.socket:
+        sock = socket.create_connection((proxy.host, proxy.port), timeout=5)
+        sock.sendall('GET {} HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n'.format(self.origin_url).encode())
+
+        return sock
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+if __name__ == '__main__':
+    unittest.main()
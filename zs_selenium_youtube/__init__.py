@@ -3,6 +3,31 @@ from .youtube import Youtube
 from .enums.analytics_period import AnalyticsPeriod
 from .enums.analytics_tab import AnalyticsTab
 from .enums.visibility import Visibility
+from .enums.recycle_reason import RecycleReason
+from .enums.action_type import ActionType
+from .enums.upload_stage import UploadStage
+from .enums.upload_status import UploadStatus
+from .enums.upload_event_type import UploadEventType
+from .enums.html_parser_engine import HtmlParserEngine
+from .enums.processing_state import ProcessingState
+from .enums.job_state import JobState
+
+from .recycle_policy import RecyclePolicy
+from .session_metrics import SessionMetrics, RecycleEvent
+from .profile_template import ProfileTemplate
+from .upload_state import UploadState
+from .upload_event import UploadEvent
+from .upload_event_stream import UploadEventStream
+from .account_result import AccountResult
+from .shaping_proxy import ShapingProxy, SessionBandwidth
+from .proxy_pool import ProxyPool, ProxyStats
+from .search import VideoSearch, SearchResult
+from .cookie_store import CookieStore, FileCookieStore, SqliteCookieStore
+from .reaper import Reaper, ReapReport, SessionRegistry, SessionRecord
+from .scheduler import JobScheduler, Job, RateLimit, SchedulerMetrics
+from .inventory import ContentInventory, VideoRecord
+from .processing_watcher import ProcessingWatcher, FollowUp, FollowUpResult
+from .job_queue import JobQueue, QueuedJob, SqliteJobQueue, FileSystemJobQueue, QueueWorker
 
 from kyoutubescraper import ChannelAboutData, YoutubeScraper as Scraper
 from selenium_uploader_account import *
\ No newline at end of file
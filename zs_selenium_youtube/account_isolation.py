@@ -0,0 +1,89 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# The origins a logged in youtube session leaves state on.
+# Google's own cookies have to go too, otherwise youtube signs the next account back in as the previous one.
+# www.youtube.com is the last one, the next account's cookies are added from there.
+ISOLATED_ORIGINS = [
+    'https://accounts.google.com',
+    'https://www.google.com',
+    'https://studio.youtube.com',
+    'https://www.youtube.com'
+]
+
+# a small same-origin document, so clearing an origin does not load its whole app (or get redirected off the origin)
+BLANK_PATH = '/robots.txt'
+
+# Clears the storage of the current origin that cookie deletion does not reach. Async, calls back with true when done.
+CLEAR_STORAGE_JS = '''
+var done = arguments[arguments.length - 1];
+var tasks = [];
+
+try {
+    localStorage.clear();
+    sessionStorage.clear();
+} catch (e) {
+    // storage can be disabled
+}
+
+if (window.indexedDB && indexedDB.databases) {
+    tasks.push(indexedDB.databases().then(function (databases) {
+        return Promise.all(databases.map(function (database) {
+            return new Promise(function (resolve) {
+                var request = indexedDB.deleteDatabase(database.name);
+                request.onsuccess = request.onerror = request.onblocked = resolve;
+            });
+        }));
+    }));
+}
+
+if (window.caches) {
+    tasks.push(caches.keys().then(function (keys) {
+        return Promise.all(keys.map(function (key) {
+            return caches.delete(key);
+        }));
+    }));
+}
+
+if (navigator.serviceWorker) {
+    tasks.push(navigator.serviceWorker.getRegistrations().then(function (registrations) {
+        return Promise.all(registrations.map(function (registration) {
+            return registration.unregister();
+        }));
+    }));
+}
+
+Promise.all(tasks).then(function () {
+    done(true);
+}, function () {
+    done(false);
+});
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+def blank_urls() -> List[str]:
+    return [origin + BLANK_PATH for origin in ISOLATED_ORIGINS]
+
+# clears the cookies and storage of the origin the driver is on, True if all of it was cleared
+def clear_current_origin(driver) -> bool:
+    try:
+        driver.delete_all_cookies()
+
+        return bool(driver.execute_async_script(CLEAR_STORAGE_JS))
+    except Exception:
+        return False
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
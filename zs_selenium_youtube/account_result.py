@@ -0,0 +1,60 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict, Any
+import time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: AccountResult --------------------------------------------------------- #
+
+# the outcome of one account's step in Youtube.sweep_accounts
+class AccountResult:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        account_id: str,
+        logged_in: bool,
+        channel_id: Optional[str] = None,
+        result: Any = None,
+        error: Optional[str] = None,
+        duration_seconds: float = 0
+    ):
+        self.time = time.time()
+        self.account_id = account_id
+        self.logged_in = logged_in
+        self.channel_id = channel_id
+        self.result = result
+        self.error = error
+        self.duration_seconds = duration_seconds
+
+
+    # ------------------------------------------------------ Public properties ------------------------------------------------------- #
+
+    @property
+    def succeeded(self) -> bool:
+        return self.logged_in and self.error is None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def to_dict(self) -> Dict:
+        return {
+            'time': self.time,
+            'account_id': self.account_id,
+            'logged_in': self.logged_in,
+            'channel_id': self.channel_id,
+            'result': self.result,
+            'error': self.error,
+            'duration_seconds': self.duration_seconds
+        }
+
+    def __repr__(self) -> str:
+        return 'AccountResult({}, {})'.format(self.account_id, 'ok' if self.succeeded else self.error or 'not logged in')
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
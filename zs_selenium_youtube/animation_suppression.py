@@ -0,0 +1,110 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Dict, Union
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# Makes the page's css transitions, css animations and web animations finish right away, and turns smooth scrolling off.
+# Durations are set to 1ms instead of 0, because zero-length transitions fire no transitionend,
+# and iron-overlay/paper-dropdown wait for the end events to become interactive.
+# YouTube runs Polymer on shady dom, so a document level stylesheet reaches into the components too.
+# Returns True if it was injected now, False if the document already had it.
+SUPPRESS_ANIMATIONS_JS = '''
+if (window.__animationsSuppressed) {
+    return false;
+}
+
+window.__animationsSuppressed = true;
+
+var style = document.createElement('style');
+style.id = 'suppress-animations';
+style.textContent = '*, *::before, *::after {' +
+    'transition-duration: 1ms !important; transition-delay: 0s !important;' +
+    'animation-duration: 1ms !important; animation-delay: 0s !important; animation-iteration-count: 1 !important;' +
+    'scroll-behavior: auto !important;' +
+'}';
+(document.head || document.documentElement).appendChild(style);
+
+// neon-animation and the web animations used by the dialogs
+var animate = Element.prototype.animate;
+
+if (animate) {
+    Element.prototype.animate = function (keyframes, options) {
+        if (typeof options === 'number') {
+            options = Math.min(options, 1);
+        } else if (options) {
+            options = Object.assign({}, options, {duration: Math.min(Number(options.duration) || 0, 1), delay: 0, endDelay: 0});
+        }
+
+        return animate.call(this, keyframes, options);
+    };
+}
+
+if (document.getAnimations) {
+    document.getAnimations().forEach(function (animation) {
+        try {
+            animation.finish();
+        } catch (e) {
+            // infinite ones can not be finished
+        }
+    });
+}
+
+// scripted smooth scrolling (scrollIntoView({behavior: 'smooth'}) ...), the css above only covers the declarative one
+function instant(target, name) {
+    var original = target[name];
+
+    if (!original) {
+        return;
+    }
+
+    target[name] = function (options) {
+        if (options && typeof options === 'object') {
+            arguments[0] = Object.assign({}, options, {behavior: 'auto'});
+        }
+
+        return original.apply(this, arguments);
+    };
+}
+
+instant(window, 'scrollTo');
+instant(window, 'scrollBy');
+instant(Element.prototype, 'scrollTo');
+instant(Element.prototype, 'scrollBy');
+instant(Element.prototype, 'scrollIntoView');
+
+return true;
+'''
+
+# the browser level part, needs to be in the profile before firefox starts (see ProfileTemplate.create_profile)
+SUPPRESSED_ANIMATION_PREFS = {
+    'ui.prefersReducedMotion': 1,
+    'general.smoothScroll': False,
+    'toolkit.cosmeticAnimations.enabled': False
+}
+
+# what is left to wait for after a click with animations suppressed: the event handlers and one or two frames
+SETTLE_SECONDS = 0.1
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# True if it was injected into the current document now
+def suppress(driver) -> bool:
+    try:
+        return bool(driver.execute_script(SUPPRESS_ANIMATIONS_JS))
+    except Exception:
+        return False
+
+def prefs() -> Dict[str, Union[str, int, bool]]:
+    return dict(SUPPRESSED_ANIMATION_PREFS)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
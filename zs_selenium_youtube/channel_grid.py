@@ -0,0 +1,167 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict
+
+# Pip
+from kcu import strings
+from bs4 import BeautifulSoup as bs
+from lxml import etree
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxParser
+    except ImportError:
+        SelectolaxParser = None
+
+# Local
+from .enums.html_parser_engine import HtmlParserEngine
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+GRID_VIDEO_TITLE_TAG    = 'a'
+GRID_VIDEO_TITLE_ID     = 'video-title'
+GRID_VIDEO_TITLE_CLASS  = 'yt-simple-endpoint style-scope ytd-grid-video-renderer'
+
+DEFAULT_ENGINE = HtmlParserEngine.LXML
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: _GridTarget ---------------------------------------------------------- #
+
+# lxml parser target, only looks at the start tags, so neither a tree nor text nodes are kept in memory
+class _GridTarget:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, ignored_titles: set):
+        self.ignored_titles = ignored_titles
+        self.video_ids = []
+        self.__seen = set()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if tag == GRID_VIDEO_TITLE_TAG and attrib.get('id') == GRID_VIDEO_TITLE_ID and _is_grid_class(attrib.get('class')):
+            _add_video_id(attrib, self.ignored_titles, self.video_ids, self.__seen)
+
+    def end(self, tag: str) -> None:
+        pass
+
+    def data(self, data: str) -> None:
+        pass
+
+    def close(self) -> List[str]:
+        return self.video_ids
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# video ids of the grid, in page order, without duplicates and videos with an ignored title
+def extract_video_ids(
+    page_source: str,
+    ignored_titles: Optional[List[str]] = None,
+    engine: HtmlParserEngine = DEFAULT_ENGINE
+) -> List[str]:
+    if engine == HtmlParserEngine.SELECTOLAX and SelectolaxParser is None:
+        engine = HtmlParserEngine.LXML
+
+    return {
+        HtmlParserEngine.BS4: extract_video_ids_bs4,
+        HtmlParserEngine.LXML: extract_video_ids_lxml,
+        HtmlParserEngine.SELECTOLAX: extract_video_ids_selectolax
+    }[engine](page_source, ignored_titles)
+
+def extract_video_ids_bs4(page_source: str, ignored_titles: Optional[List[str]] = None) -> List[str]:
+    video_ids = []
+    ignored_titles = ignored_titles or []
+
+    soup = bs(page_source, 'lxml')
+    elems = soup.find_all(GRID_VIDEO_TITLE_TAG, {'id':GRID_VIDEO_TITLE_ID, 'class':GRID_VIDEO_TITLE_CLASS})
+
+    for elem in elems:
+        if 'title' in elem.attrs:
+            should_continue = False
+            title = elem['title'].strip().lower()
+
+            for ignored_title in ignored_titles:
+                if ignored_title.strip().lower() == title:
+                    should_continue = True
+
+                    break
+
+            if should_continue:
+                continue
+
+        if 'href' in elem.attrs and '/watch?v=' in elem['href']:
+            vid_id = strings.between(elem['href'], '?v=', '&')
+
+            if vid_id is not None and vid_id not in video_ids:
+                video_ids.append(vid_id)
+
+    return video_ids
+
+def extract_video_ids_lxml(page_source: str, ignored_titles: Optional[List[str]] = None) -> List[str]:
+    if not page_source:
+        return []
+
+    parser = etree.HTMLParser(target=_GridTarget(_normalized_titles(ignored_titles)))
+    parser.feed(page_source)
+
+    return parser.close()
+
+def extract_video_ids_selectolax(page_source: str, ignored_titles: Optional[List[str]] = None) -> List[str]:
+    if SelectolaxParser is None:
+        raise ImportError('selectolax is not installed')
+
+    video_ids = []
+    seen = set()
+    ignored_titles = _normalized_titles(ignored_titles)
+
+    for node in SelectolaxParser(page_source).css('{}#{}'.format(GRID_VIDEO_TITLE_TAG, GRID_VIDEO_TITLE_ID)):
+        attrib = node.attributes
+
+        if _is_grid_class(attrib.get('class')):
+            _add_video_id(attrib, ignored_titles, video_ids, seen)
+
+    return video_ids
+
+
+# ----------------------------------------------------------- Private methods ------------------------------------------------------------ #
+
+def _normalized_titles(titles: Optional[List[str]]) -> set:
+    return set(t.strip().lower() for t in titles or [])
+
+# same as bs4's match of a multi-valued attribute against a string with spaces
+def _is_grid_class(class_: Optional[str]) -> bool:
+    return class_ is not None and ' '.join(class_.split()) == GRID_VIDEO_TITLE_CLASS
+
+def _add_video_id(attrib: Dict[str, str], ignored_titles: set, video_ids: List[str], seen: set) -> None:
+    title = attrib.get('title')
+
+    if title is not None and title.strip().lower() in ignored_titles:
+        return
+
+    href = attrib.get('href')
+
+    if href and '/watch?v=' in href:
+        vid_id = strings.between(href, '?v=', '&')
+
+        if vid_id is not None and vid_id not in seen:
+            seen.add(vid_id)
+            video_ids.append(vid_id)
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
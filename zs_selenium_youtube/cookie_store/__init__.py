@@ -0,0 +1,3 @@
+from .cookie_store import CookieStore
+from .file_cookie_store import FileCookieStore
+from .sqlite_cookie_store import SqliteCookieStore
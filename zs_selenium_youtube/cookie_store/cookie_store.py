@@ -0,0 +1,144 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Any
+from abc import abstractmethod
+import threading, hashlib, json
+
+# Pip
+import tldextract
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# what makes two cookie sets different, expiry is compared rounded to 'expiry_resolution_seconds'
+FINGERPRINT_KEYS = ('domain', 'path', 'name', 'value', 'secure', 'httpOnly', 'sameSite')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: CookieStore ---------------------------------------------------------- #
+
+# Keeps the last saved cookie set of every account in memory and only writes to the backend when the set changed
+#
+# sites refresh the expiry of some cookies on every page load, without rounding it most saves would still be a write
+# the in-memory check is per process, backends compare with what is stored again under their own lock before writing
+class CookieStore:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, expiry_resolution_seconds: Optional[float] = 60*60):
+        self.expiry_resolution_seconds = expiry_resolution_seconds
+        self.write_count = 0
+        self.skipped_write_count = 0
+        self.__lock = threading.Lock()
+        # (account_id, domain) -> (fingerprint, cookies)
+        self.__saved = {}
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # True if the cookies were written
+    def save(self, account_id: str, url: str, cookies: List[Any]) -> bool:
+        # same as the browser's own save, an empty set is never saved, use delete
+        if not cookies:
+            return False
+
+        cookies = [dict(getattr(c, 'dict', c)) for c in cookies]
+        key = (account_id, self.domain(url))
+        fingerprint = self.fingerprint(cookies)
+
+        with self.__lock:
+            saved = self.__saved.get(key)
+
+            if saved and saved[0] == fingerprint:
+                self.skipped_write_count += 1
+
+                return False
+
+        written = self._write(account_id, key[1], cookies, fingerprint)
+
+        with self.__lock:
+            self.__saved[key] = (fingerprint, cookies)
+
+            if written:
+                self.write_count += 1
+            else:
+                self.skipped_write_count += 1
+
+        return written
+
+    # always reads the backend, another process might have saved a newer set since
+    def load(self, account_id: str, url: str) -> Optional[List[Dict]]:
+        key = (account_id, self.domain(url))
+        cookies = self._read(account_id, key[1])
+
+        with self.__lock:
+            if cookies:
+                self.__saved[key] = (self.fingerprint(cookies), cookies)
+            else:
+                self.__saved.pop(key, None)
+
+        return cookies
+
+    # the last saved or loaded set of this process, without touching the backend
+    def cached(self, account_id: str, url: str) -> Optional[List[Dict]]:
+        with self.__lock:
+            saved = self.__saved.get((account_id, self.domain(url)))
+
+        return saved[1] if saved else None
+
+    def delete(self, account_id: str, url: str) -> bool:
+        key = (account_id, self.domain(url))
+
+        with self.__lock:
+            self.__saved.pop(key, None)
+
+        return self._delete(account_id, key[1])
+
+    def fingerprint(self, cookies: List[Dict]) -> str:
+        normalized = sorted(
+            [[c.get(k) for k in FINGERPRINT_KEYS] + [self.__rounded_expiry(c.get('expiry'))] for c in cookies],
+            key=lambda c: (c[0] or '', c[1] or '', c[2] or '')
+        )
+
+        return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode('utf-8')).hexdigest()
+
+    # same key the browser names its cookie files by ('youtube.com' for 'https://studio.youtube.com/...')
+    @staticmethod
+    def domain(url: str) -> str:
+        url_comps = tldextract.extract(url)
+
+        return '{}.{}'.format(url_comps.domain, url_comps.suffix)
+
+
+    # ------------------------------------------------------- Abstract methods ------------------------------------------------------- #
+
+    @abstractmethod
+    def _read(self, account_id: str, domain: str) -> Optional[List[Dict]]:
+        pass
+
+    # returns False if the backend already has a set with the same fingerprint
+    @abstractmethod
+    def _write(self, account_id: str, domain: str, cookies: List[Dict], fingerprint: str) -> bool:
+        pass
+
+    @abstractmethod
+    def _delete(self, account_id: str, domain: str) -> bool:
+        pass
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __rounded_expiry(self, expiry: Optional[float]) -> Optional[int]:
+        if expiry is None or not self.expiry_resolution_seconds:
+            return expiry
+
+        return int(expiry // self.expiry_resolution_seconds)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
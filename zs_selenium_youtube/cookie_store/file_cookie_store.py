@@ -0,0 +1,136 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict
+import os, json, pickle, tempfile, platform
+
+# Local
+from .cookie_store import CookieStore
+from ..utils.file_lock import FileLock
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# the folder selenium_firefox keeps the 'cookies_id' folders in, so cookies it saved before are found
+DEFAULT_FOLDER_PATH = os.path.join('/tmp' if platform.system() == 'Darwin' else tempfile.gettempdir(), 'python-selenium_firefox-cookies')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: FileCookieStore -------------------------------------------------------- #
+
+# One folder per account, with the same '<domain>.json' / '<domain>.pkl' files the browser saves and loads its cookies from
+#
+# writes go to a temp file that replaces the old one, so a reader never sees a half written file
+# the lock file next to it makes the compare-and-write of concurrent processes happen one after the other
+class FileCookieStore(CookieStore):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        folder_path: str = DEFAULT_FOLDER_PATH,
+        pickled: bool = False,
+        lock_timeout_seconds: Optional[float] = 30,
+        expiry_resolution_seconds: Optional[float] = 60*60
+    ):
+        super().__init__(expiry_resolution_seconds=expiry_resolution_seconds)
+
+        self.folder_path = folder_path
+        self.pickled = pickled
+        self.lock_timeout_seconds = lock_timeout_seconds
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # an absolute path is used as the account's folder as is, like 'cookies_folder_path'
+    def account_folder_path(self, account_id: str) -> str:
+        return account_id if os.path.isabs(account_id) else os.path.join(self.folder_path, account_id)
+
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def _read(self, account_id: str, domain: str) -> Optional[List[Dict]]:
+        pickle_path, json_path = self.__paths(account_id, domain)
+        paths = [p for p in [pickle_path, json_path] if os.path.exists(p)]
+
+        if not paths:
+            return None
+
+        # if both exist, the newer one, same as the browser
+        return self.__read_file(max(paths, key=os.path.getmtime))
+
+    def _write(self, account_id: str, domain: str, cookies: List[Dict], fingerprint: str) -> bool:
+        pickle_path, json_path = self.__paths(account_id, domain)
+        path, other_path = (pickle_path, json_path) if self.pickled else (json_path, pickle_path)
+
+        with self.__file_lock(account_id, domain):
+            stored = self._read(account_id, domain)
+
+            if stored and self.fingerprint(stored) == fingerprint:
+                return False
+
+            tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+
+            with open(tmp_path, 'wb' if self.pickled else 'w') as f:
+                if self.pickled:
+                    pickle.dump(cookies, f)
+                else:
+                    json.dump(cookies, f)
+
+                f.flush()
+                os.fsync(f.fileno())
+
+            os.replace(tmp_path, path)
+
+            # the browser would load the other one, if it was newer
+            if os.path.exists(other_path):
+                os.remove(other_path)
+
+        return True
+
+    def _delete(self, account_id: str, domain: str) -> bool:
+        did_delete = False
+
+        with self.__file_lock(account_id, domain):
+            for path in self.__paths(account_id, domain):
+                if os.path.exists(path):
+                    os.remove(path)
+                    did_delete = True
+
+        return did_delete
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __paths(self, account_id: str, domain: str) -> (str, str):
+        base_path = os.path.join(self.account_folder_path(account_id), domain)
+
+        return '{}.pkl'.format(base_path), '{}.json'.format(base_path)
+
+    def __file_lock(self, account_id: str, domain: str) -> FileLock:
+        return FileLock(
+            os.path.join(self.account_folder_path(account_id), '{}.lock'.format(domain)),
+            timeout=self.lock_timeout_seconds
+        )
+
+    @staticmethod
+    def __read_file(path: str) -> Optional[List[Dict]]:
+        try:
+            if path.endswith('.pkl'):
+                with open(path, 'rb') as f:
+                    return pickle.load(f)
+
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print('FileCookieStore - could not read \'{}\''.format(path), e)
+
+            return None
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,104 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict
+import sqlite3, threading, json, time, os
+
+# Local
+from .cookie_store import CookieStore
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS cookies (
+    account_id      TEXT NOT NULL,
+    domain          TEXT NOT NULL,
+    fingerprint     TEXT NOT NULL,
+    cookies         TEXT NOT NULL,
+    updated_at      REAL NOT NULL,
+    PRIMARY KEY (account_id, domain)
+);
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: SqliteCookieStore ------------------------------------------------------- #
+
+# One database file for the cookies of many accounts, shared by every process that uses them
+#
+# a save is a single upsert that only updates the row if the stored fingerprint differs,
+# so concurrent saves need no lock besides sqlite's own
+class SqliteCookieStore(CookieStore):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        db_path: str,
+        busy_timeout_seconds: float = 30,
+        expiry_resolution_seconds: Optional[float] = 60*60
+    ):
+        super().__init__(expiry_resolution_seconds=expiry_resolution_seconds)
+
+        folder_path = os.path.dirname(db_path)
+
+        if folder_path:
+            os.makedirs(folder_path, exist_ok=True)
+
+        self.db_path = db_path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(db_path, timeout=busy_timeout_seconds, isolation_level=None, check_same_thread=False)
+        self.__connection.executescript(SCHEMA)
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def account_ids(self) -> List[str]:
+        with self.__lock:
+            return [row[0] for row in self.__connection.execute('SELECT DISTINCT account_id FROM cookies ORDER BY account_id')]
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def _read(self, account_id: str, domain: str) -> Optional[List[Dict]]:
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT cookies FROM cookies WHERE account_id = ? AND domain = ?',
+                (account_id, domain)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def _write(self, account_id: str, domain: str, cookies: List[Dict], fingerprint: str) -> bool:
+        with self.__lock:
+            cursor = self.__connection.execute(
+                '''INSERT INTO cookies (account_id, domain, fingerprint, cookies, updated_at) VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT (account_id, domain) DO UPDATE SET
+                       fingerprint = excluded.fingerprint, cookies = excluded.cookies, updated_at = excluded.updated_at
+                   WHERE cookies.fingerprint != excluded.fingerprint''',
+                (account_id, domain, fingerprint, json.dumps(cookies), time.time())
+            )
+
+            return cursor.rowcount > 0
+
+    def _delete(self, account_id: str, domain: str) -> bool:
+        with self.__lock:
+            cursor = self.__connection.execute(
+                'DELETE FROM cookies WHERE account_id = ? AND domain = ?',
+                (account_id, domain)
+            )
+
+            return cursor.rowcount > 0
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,19 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: ActionType ----------------------------------------------------------- #
+
+class ActionType(Enum):
+    UPLOAD      = 'upload'
+    COMMENT     = 'comment'
+    LIKE        = 'like'
+    WATCH       = 'watch'
+    OTHER       = 'other'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,17 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: HtmlParserEngine -------------------------------------------------------- #
+
+class HtmlParserEngine(Enum):
+    BS4         = 'bs4'         # full BeautifulSoup tree, reference implementation
+    LXML        = 'lxml'        # streaming lxml target parser, no tree is built
+    SELECTOLAX  = 'selectolax'  # optional dependency
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
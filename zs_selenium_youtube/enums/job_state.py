@@ -0,0 +1,18 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: JobState ------------------------------------------------------------ #
+
+class JobState(Enum):
+    PENDING     = 'pending'
+    LEASED      = 'leased'
+    SUCCEEDED   = 'succeeded'
+    FAILED      = 'failed'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
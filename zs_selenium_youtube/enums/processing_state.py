@@ -0,0 +1,18 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: ProcessingState -------------------------------------------------------- #
+
+class ProcessingState(Enum):
+    UNKNOWN     = 'unknown'
+    PROCESSING  = 'processing'
+    PROCESSED   = 'processed'
+    FAILED      = 'failed'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
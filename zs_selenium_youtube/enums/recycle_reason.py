@@ -0,0 +1,21 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: RecycleReason --------------------------------------------------------- #
+
+class RecycleReason(Enum):
+    RSS         = 'rss'
+    JOB_COUNT   = 'job_count'
+    AGE         = 'age'
+    TIMEOUT     = 'timeout'
+    PROXY       = 'proxy'
+    CRASH       = 'crash'
+    MANUAL      = 'manual'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,19 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: UploadEventType -------------------------------------------------------- #
+
+class UploadEventType(Enum):
+    PROGRESS    = 'progress'    # transfer percent, bytes, rate
+    STATUS      = 'status'      # UploadStatus transition (uploading -> processing sd -> ...)
+    VIDEO_ID    = 'video_id'    # the id got assigned
+    STAGE       = 'stage'       # the upload flow reached an UploadStage
+    DONE        = 'done'        # last event, the upload succeeded or failed
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
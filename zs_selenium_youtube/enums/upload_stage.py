@@ -0,0 +1,24 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from enum import Enum
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: UploadStage ---------------------------------------------------------- #
+
+# ordered, every stage implies the ones before it
+class UploadStage(Enum):
+    NOT_STARTED     = 0
+    FILE_SENT       = 1
+    TITLE_SET       = 2
+    DESCRIPTION_SET = 3
+    THUMBNAIL_SET   = 4
+    TAGS_SET        = 5
+    KIDS_SET        = 6
+    VISIBILITY_SET  = 7
+    PUBLISHED       = 8
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -29,10 +29,20 @@ class UploadStatus(Enum):
     ):
         attriutes = ff.get_attributes(element)
 
-        uploading = 'uploading' in attriutes and attriutes['uploading'] == ''
-        processing = 'processing' in attriutes and attriutes['processing'] == ''
-        processed = 'checks-can-start' in attriutes and attriutes['checks-can-start'] == ''
+        return cls.from_flags(
+            uploading='uploading' in attriutes and attriutes['uploading'] == '',
+            processing='processing' in attriutes and attriutes['processing'] == '',
+            processed='checks-can-start' in attriutes and attriutes['checks-can-start'] == ''
+        )
 
+    # the boolean attributes of ytcp-video-upload-progress
+    @classmethod
+    def from_flags(
+        cls,
+        uploading: bool,
+        processing: bool,
+        processed: bool
+    ):
         if uploading:
             return UploadStatus.UPLOADING
         elif processing and processed:
@@ -0,0 +1,3 @@
+from .content_inventory import ContentInventory
+from .content_page import parse_content_page
+from .video_record import VideoRecord
@@ -0,0 +1,201 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Callable, Dict, Iterable
+import sqlite3, threading, time, os
+
+# Local
+from .video_record import VideoRecord
+from ..enums.visibility import Visibility
+from ..enums.processing_state import ProcessingState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS videos (
+    video_id                 TEXT PRIMARY KEY,
+    channel_id               TEXT,
+    title                    TEXT,
+    description_snippet_hash TEXT,
+    visibility               TEXT,
+    made_for_kids            INTEGER,
+    processing_state         TEXT NOT NULL,
+    first_seen_at            REAL NOT NULL,
+    last_seen_at             REAL NOT NULL,
+    deleted                  INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS videos_channel_visibility ON videos (channel_id, visibility);
+'''
+
+COLUMNS = ('video_id', 'channel_id', 'title', 'description_snippet_hash', 'visibility', 'made_for_kids', 'processing_state', 'first_seen_at', 'last_seen_at', 'deleted')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: ContentInventory -------------------------------------------------------- #
+
+# Local snapshot of the studio content list of one or more channels
+class ContentInventory:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, db_path: str):
+        folder_path = os.path.dirname(db_path)
+
+        if folder_path:
+            os.makedirs(folder_path, exist_ok=True)
+
+        self.db_path = db_path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.__connection.executescript(SCHEMA)
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # returns the records that are new or changed
+    def upsert(self, records: Iterable[VideoRecord]) -> List[VideoRecord]:
+        changed = []
+        now = time.time()
+
+        with self.__lock, self.__connection:
+            for record in records:
+                old = self.__get(record.video_id)
+                record.last_seen_at = now
+
+                if old:
+                    record.first_seen_at = old.first_seen_at
+                    record.channel_id = record.channel_id or old.channel_id
+
+                if not old or not old.same_content(record):
+                    changed.append(record)
+
+                self.__connection.execute(
+                    'INSERT OR REPLACE INTO videos ({}) VALUES ({})'.format(', '.join(COLUMNS), ', '.join('?' * len(COLUMNS))),
+                    self.__to_row(record)
+                )
+
+        return changed
+
+    # after a full refresh: everything of the channel not seen since started_at is gone
+    def mark_deleted_not_seen_since(self, channel_id: str, started_at: float) -> int:
+        with self.__lock, self.__connection:
+            return self.__connection.execute(
+                'UPDATE videos SET deleted = 1 WHERE channel_id = ? AND last_seen_at < ? AND deleted = 0',
+                (channel_id, started_at)
+            ).rowcount
+
+    def get(self, video_id: str) -> Optional[VideoRecord]:
+        with self.__lock:
+            return self.__get(video_id)
+
+    def find(
+        self,
+        channel_id: Optional[str] = None,
+        visibility: Optional[Visibility] = None,
+        made_for_kids: Optional[bool] = None,
+        processing_state: Optional[ProcessingState] = None,
+        include_deleted: bool = False
+    ) -> List[VideoRecord]:
+        conditions, params = [], []
+
+        for column, value in [
+            ('channel_id', channel_id),
+            ('visibility', visibility.name if visibility else None),
+            ('made_for_kids', int(made_for_kids) if made_for_kids is not None else None),
+            ('processing_state', processing_state.value if processing_state else None)
+        ]:
+            if value is not None:
+                conditions.append('{} = ?'.format(column))
+                params.append(value)
+
+        if not include_deleted:
+            conditions.append('deleted = 0')
+
+        query = 'SELECT {} FROM videos'.format(', '.join(COLUMNS))
+
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+
+        with self.__lock:
+            return [self.__from_row(row) for row in self.__connection.execute(query + ' ORDER BY first_seen_at DESC', params)]
+
+    # 'videos matching predicate X', the column filters of find narrow it down first
+    def query(self, predicate: Callable[[VideoRecord], bool], **find_kwargs) -> List[VideoRecord]:
+        return [record for record in self.find(**find_kwargs) if predicate(record)]
+
+    def update(self, video_id: str, **values) -> None:
+        record = self.get(video_id)
+
+        if not record:
+            return
+
+        for key, value in values.items():
+            setattr(record, key, value)
+
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO videos ({}) VALUES ({})'.format(', '.join(COLUMNS), ', '.join('?' * len(COLUMNS))),
+                self.__to_row(record)
+            )
+
+    def counts(self, channel_id: Optional[str] = None) -> Dict[str, int]:
+        query = 'SELECT COALESCE(visibility, \'OTHER\'), COUNT(*) FROM videos WHERE deleted = 0'
+        params = []
+
+        if channel_id:
+            query += ' AND channel_id = ?'
+            params.append(channel_id)
+
+        with self.__lock:
+            return dict(self.__connection.execute(query + ' GROUP BY 1', params).fetchall())
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __get(self, video_id: str) -> Optional[VideoRecord]:
+        row = self.__connection.execute('SELECT {} FROM videos WHERE video_id = ?'.format(', '.join(COLUMNS)), (video_id,)).fetchone()
+
+        return self.__from_row(row) if row else None
+
+    @staticmethod
+    def __to_row(record: VideoRecord) -> tuple:
+        return (
+            record.video_id,
+            record.channel_id,
+            record.title,
+            record.description_snippet_hash,
+            record.visibility.name if record.visibility else None,
+            int(record.made_for_kids) if record.made_for_kids is not None else None,
+            record.processing_state.value,
+            record.first_seen_at,
+            record.last_seen_at,
+            int(record.deleted)
+        )
+
+    @staticmethod
+    def __from_row(row: tuple) -> VideoRecord:
+        return VideoRecord(
+            video_id=row[0],
+            channel_id=row[1],
+            title=row[2],
+            description_snippet_hash=row[3],
+            visibility=Visibility[row[4]] if row[4] else None,
+            made_for_kids=bool(row[5]) if row[5] is not None else None,
+            processing_state=ProcessingState(row[6]),
+            first_seen_at=row[7],
+            last_seen_at=row[8],
+            deleted=bool(row[9])
+        )
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
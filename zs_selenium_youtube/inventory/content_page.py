@@ -0,0 +1,90 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional
+
+# Pip
+from kcu import strings
+from lxml import html
+
+# Local
+from .video_record import VideoRecord
+from ..enums.visibility import Visibility
+from ..enums.processing_state import ProcessingState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+ROW_XPATH           = '//ytcp-video-row'
+ANCHOR_XPATH        = './/a[@id="thumbnail-anchor"]/@href'
+TITLE_XPATH         = './/*[@id="video-title"]'
+DESCRIPTION_XPATH   = './/*[@id="description"]'
+VISIBILITY_XPATH    = './/*[contains(concat(" ", normalize-space(@class), " "), " tablecell-visibility ")]'
+PROGRESS_XPATH      = './/ytcp-video-upload-progress'
+RESTRICTIONS_XPATH  = './/*[contains(concat(" ", normalize-space(@class), " "), " tablecell-restrictions ")]'
+
+MADE_FOR_KIDS_TEXT  = 'made for kids'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# the rows of one page of the studio content list
+def parse_content_page(page_source: str, channel_id: Optional[str] = None) -> List[VideoRecord]:
+    if not page_source:
+        return []
+
+    records = []
+
+    for row in html.fromstring(page_source).xpath(ROW_XPATH):
+        hrefs = row.xpath(ANCHOR_XPATH)
+        video_id = strings.between(hrefs[0], '/video/', '/') if hrefs else None
+
+        if not video_id:
+            continue
+
+        visibility_text = _text(row, VISIBILITY_XPATH).lower()
+        restrictions_text = _text(row, RESTRICTIONS_XPATH).lower()
+
+        records.append(VideoRecord(
+            video_id=video_id,
+            channel_id=channel_id,
+            title=_text(row, TITLE_XPATH) or None,
+            description_snippet_hash=VideoRecord.hash_snippet(_text(row, DESCRIPTION_XPATH)),
+            visibility=_visibility(visibility_text),
+            made_for_kids=MADE_FOR_KIDS_TEXT in restrictions_text if restrictions_text else None,
+            processing_state=_processing_state(visibility_text, bool(row.xpath(PROGRESS_XPATH)))
+        ))
+
+    return records
+
+
+# ----------------------------------------------------------- Private methods ------------------------------------------------------------ #
+
+def _text(element, xpath: str) -> str:
+    found = element.xpath(xpath)
+
+    return ' '.join(found[0].text_content().split()) if found else ''
+
+def _visibility(text: str) -> Optional[Visibility]:
+    for visibility in Visibility:
+        if visibility.name.lower() in text:
+            return visibility
+
+    return None
+
+def _processing_state(visibility_text: str, has_progress: bool) -> ProcessingState:
+    if 'abandoned' in visibility_text or 'failed' in visibility_text:
+        return ProcessingState.FAILED
+
+    if has_progress or 'processing' in visibility_text or 'uploading' in visibility_text:
+        return ProcessingState.PROCESSING
+
+    return ProcessingState.PROCESSED
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,78 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict
+import hashlib, time
+
+# Local
+from ..enums.visibility import Visibility
+from ..enums.processing_state import ProcessingState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: VideoRecord ---------------------------------------------------------- #
+
+class VideoRecord:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        video_id: str,
+        channel_id: Optional[str] = None,
+        title: Optional[str] = None,
+        description_snippet_hash: Optional[str] = None,
+        visibility: Optional[Visibility] = None, # None for drafts, scheduled videos and unrecognized values
+        made_for_kids: Optional[bool] = None,
+        processing_state: ProcessingState = ProcessingState.UNKNOWN,
+        first_seen_at: Optional[float] = None,
+        last_seen_at: Optional[float] = None,
+        deleted: bool = False
+    ):
+        self.video_id = video_id
+        self.channel_id = channel_id
+        self.title = title
+        self.description_snippet_hash = description_snippet_hash
+        self.visibility = visibility
+        self.made_for_kids = made_for_kids
+        self.processing_state = processing_state
+        self.first_seen_at = first_seen_at or time.time()
+        self.last_seen_at = last_seen_at or self.first_seen_at
+        self.deleted = deleted
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # the content list only shows the start of the description, so this tells apart snippets, not full descriptions
+    @staticmethod
+    def hash_snippet(snippet: Optional[str]) -> Optional[str]:
+        return hashlib.sha1(snippet.strip().encode()).hexdigest() if snippet is not None else None
+
+    # the fields that come from studio, the timestamps are ignored
+    def same_content(self, other: 'VideoRecord') -> bool:
+        return self.content_tuple() == other.content_tuple()
+
+    def content_tuple(self) -> tuple:
+        return (self.video_id, self.title, self.description_snippet_hash, self.visibility, self.made_for_kids, self.processing_state, self.deleted)
+
+    def to_dict(self) -> Dict:
+        return {
+            'video_id': self.video_id,
+            'channel_id': self.channel_id,
+            'title': self.title,
+            'description_snippet_hash': self.description_snippet_hash,
+            'visibility': self.visibility.name if self.visibility else None,
+            'made_for_kids': self.made_for_kids,
+            'processing_state': self.processing_state.value,
+            'first_seen_at': self.first_seen_at,
+            'last_seen_at': self.last_seen_at,
+            'deleted': self.deleted
+        }
+
+    def __repr__(self) -> str:
+        return 'VideoRecord({}, {}, {}, {})'.format(self.video_id, self.visibility.name if self.visibility else None, self.processing_state.value, repr(self.title))
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
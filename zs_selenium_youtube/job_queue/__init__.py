@@ -0,0 +1,5 @@
+from .job_queue import JobQueue
+from .queued_job import QueuedJob
+from .sqlite_job_queue import SqliteJobQueue
+from .file_system_job_queue import FileSystemJobQueue
+from .queue_worker import QueueWorker
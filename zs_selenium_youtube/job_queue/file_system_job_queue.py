@@ -0,0 +1,360 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Any
+import json, time, os, uuid, hashlib
+
+# Local
+from .job_queue import JobQueue
+from .queued_job import QueuedJob
+from ..enums.job_state import JobState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+PENDING_FOLDER_NAME     = 'pending'
+LEASED_FOLDER_NAME      = 'leased'
+SUCCEEDED_FOLDER_NAME   = 'succeeded'
+FAILED_FOLDER_NAME      = 'failed'
+KEYS_FOLDER_NAME        = 'keys'
+TMP_FOLDER_NAME         = 'tmp'
+
+OWNER_SEPARATOR         = '@'
+
+# a file can only stay in tmp for the few milliseconds between a take and a put, older ones were left by a crashed process
+STALE_TMP_SECONDS       = 60
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------ class: FileSystemJobQueue ------------------------------------------------------- #
+
+# A queue in a folder shared between the hosts (nfs, smb, ...), one json file per job
+# The folder of a job file is its state, a leased job's file name also holds its owner
+# Every change 'takes' the file first by renaming it into tmp, rename is atomic, so only one process can take it,
+# then writes it and renames it into its new folder. Whoever loses the rename race sees a missing file and backs off.
+class FileSystemJobQueue(JobQueue):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, folder_path: str):
+        self.folder_path = folder_path
+
+        for folder_name in [PENDING_FOLDER_NAME, LEASED_FOLDER_NAME, SUCCEEDED_FOLDER_NAME, FAILED_FOLDER_NAME, KEYS_FOLDER_NAME, TMP_FOLDER_NAME]:
+            os.makedirs(self.__folder(folder_name), exist_ok=True)
+
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def enqueue(self, job: QueuedJob) -> QueuedJob:
+        job.state = JobState.PENDING
+        tmp_path = self.__tmp_path(job.job_id)
+        self.__write(tmp_path, job)
+
+        if job.idempotency_key is not None:
+            key_tmp_path = self.__tmp_path('key', extension='.key')
+
+            with open(key_tmp_path, 'w') as f:
+                f.write(job.job_id)
+
+            try:
+                # link fails if the key exists, and unlike open(O_EXCL) the key file never exists without its content
+                os.link(key_tmp_path, self.__key_path(job.idempotency_key))
+            except FileExistsError:
+                os.remove(tmp_path)
+
+                with open(self.__key_path(job.idempotency_key)) as f:
+                    existing_job_id = f.read().strip()
+
+                return self.__wait_for_job(existing_job_id)
+            finally:
+                os.remove(key_tmp_path)
+
+        os.rename(tmp_path, self.__path(PENDING_FOLDER_NAME, job.job_id))
+
+        return job
+
+    def claim(self, worker_id: str, lease_seconds: float, account_ids: Optional[List[str]] = None) -> Optional[QueuedJob]:
+        if account_ids is not None and not account_ids:
+            return None
+
+        worker_id = worker_id.replace(OWNER_SEPARATOR, '_').replace(os.sep, '_')
+        now = time.time()
+        self.__reassign_expired(now)
+        self.__recover_stale_tmp(now)
+
+        candidates = []
+
+        for file_name in os.listdir(self.__folder(PENDING_FOLDER_NAME)):
+            job = self.__read(os.path.join(self.__folder(PENDING_FOLDER_NAME), file_name))
+
+            if job and job.available_at <= now and (account_ids is None or job.account_id in account_ids):
+                candidates.append(job)
+
+        for candidate in sorted(candidates, key=lambda job: (-job.priority, job.available_at)):
+            tmp_path = self.__take(self.__path(PENDING_FOLDER_NAME, candidate.job_id))
+
+            if not tmp_path:
+                continue
+
+            job = self.__read(tmp_path)
+
+            if not job:
+                continue
+
+            job.state = JobState.LEASED
+            job.lease_owner = worker_id
+            job.lease_expires_at = time.time() + lease_seconds
+            job.attempts += 1
+            job.updated_at = time.time()
+            self.__put(tmp_path, job, self.__leased_path(job.job_id, worker_id))
+
+            return job
+
+        return None
+
+    def renew(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        tmp_path, job = self.__take_owned(job_id, worker_id)
+
+        if not job:
+            return False
+
+        job.lease_expires_at = time.time() + lease_seconds
+        self.__put(tmp_path, job, self.__leased_path(job_id, job.lease_owner))
+
+        return True
+
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        tmp_path, job = self.__take_owned(job_id, worker_id)
+
+        if not job:
+            return False
+
+        self.__to_finished(tmp_path, job, JobState.SUCCEEDED, result=result)
+
+        return True
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True, retry_delay_seconds: float = 0, payload: Optional[Dict[str, Any]] = None) -> bool:
+        tmp_path, job = self.__take_owned(job_id, worker_id)
+
+        if not job:
+            return False
+
+        if payload is not None:
+            job.payload = payload
+
+        if retry and job.attempts < job.max_attempts:
+            self.__to_pending(tmp_path, job, available_at=time.time() + retry_delay_seconds, error=error)
+        else:
+            self.__to_finished(tmp_path, job, JobState.FAILED, error=error)
+
+        return True
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        tmp_path, job = self.__take_owned(job_id, worker_id)
+
+        if not job:
+            return False
+
+        job.attempts = max(job.attempts - 1, 0)
+        self.__to_pending(tmp_path, job)
+
+        return True
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        # the file might move between the folders while looking for it
+        for _ in range(3):
+            for folder_name in [PENDING_FOLDER_NAME, SUCCEEDED_FOLDER_NAME, FAILED_FOLDER_NAME]:
+                job = self.__read(self.__path(folder_name, job_id))
+
+                if job:
+                    return job
+
+            for folder_name in [LEASED_FOLDER_NAME, TMP_FOLDER_NAME]:
+                for file_name in os.listdir(self.__folder(folder_name)):
+                    if file_name.split(OWNER_SEPARATOR)[0].split('.')[0] == job_id:
+                        job = self.__read(os.path.join(self.__folder(folder_name), file_name))
+
+                        if job:
+                            return job
+
+        return None
+
+    def counts(self) -> Dict[str, int]:
+        counts = {}
+
+        for state, folder_name in [
+            (JobState.PENDING, PENDING_FOLDER_NAME),
+            (JobState.LEASED, LEASED_FOLDER_NAME),
+            (JobState.SUCCEEDED, SUCCEEDED_FOLDER_NAME),
+            (JobState.FAILED, FAILED_FOLDER_NAME)
+        ]:
+            count = len([file_name for file_name in os.listdir(self.__folder(folder_name)) if file_name.endswith('.json')])
+
+            if count:
+                counts[state.value] = count
+
+        return counts
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __reassign_expired(self, now: float) -> None:
+        for file_name in os.listdir(self.__folder(LEASED_FOLDER_NAME)):
+            path = os.path.join(self.__folder(LEASED_FOLDER_NAME), file_name)
+            job = self.__read(path)
+
+            if not job or not job.lease_expired(now):
+                continue
+
+            tmp_path = self.__take(path)
+
+            if not tmp_path:
+                continue
+
+            # it might have been renewed between the read and the take
+            job = self.__read(tmp_path)
+
+            if not job:
+                continue
+
+            if not job.lease_expired(now):
+                self.__put(tmp_path, job, path)
+            elif job.attempts < job.max_attempts:
+                self.__to_pending(tmp_path, job, available_at=now, error='lease of {} expired'.format(job.lease_owner))
+            else:
+                self.__to_finished(tmp_path, job, JobState.FAILED, error='lease of {} expired, out of attempts'.format(job.lease_owner))
+
+    def __recover_stale_tmp(self, now: float) -> None:
+        for file_name in os.listdir(self.__folder(TMP_FOLDER_NAME)):
+            path = os.path.join(self.__folder(TMP_FOLDER_NAME), file_name)
+
+            try:
+                if now - os.path.getmtime(path) < STALE_TMP_SECONDS:
+                    continue
+            except FileNotFoundError:
+                continue
+
+            if not file_name.endswith('.json'):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+                continue
+
+            # several processes might find the same stale file
+            tmp_path = self.__take(path)
+            job = self.__read(tmp_path) if tmp_path else None
+
+            if not job:
+                continue
+
+            if not job.is_finished:
+                self.__to_pending(tmp_path, job, error='recovered after a crash')
+            else:
+                self.__put(tmp_path, job, self.__path(SUCCEEDED_FOLDER_NAME if job.state == JobState.SUCCEEDED else FAILED_FOLDER_NAME, job.job_id))
+
+    def __take_owned(self, job_id: str, worker_id: str) -> (Optional[str], Optional[QueuedJob]):
+        path = self.__leased_path(job_id, worker_id.replace(OWNER_SEPARATOR, '_').replace(os.sep, '_'))
+        tmp_path = self.__take(path)
+
+        if not tmp_path:
+            return None, None
+
+        job = self.__read(tmp_path)
+
+        if not job:
+            return None, None
+
+        # an expired lease is lost even if nobody claimed the job since
+        if job.lease_expired():
+            self.__put(tmp_path, job, path)
+
+            return None, None
+
+        return tmp_path, job
+
+    def __to_pending(self, tmp_path: str, job: QueuedJob, available_at: Optional[float] = None, error: Optional[str] = None) -> None:
+        job.state = JobState.PENDING
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.available_at = available_at or time.time()
+        job.error = error or job.error
+        job.updated_at = time.time()
+        self.__put(tmp_path, job, self.__path(PENDING_FOLDER_NAME, job.job_id))
+
+    def __to_finished(self, tmp_path: str, job: QueuedJob, state: JobState, result: Any = None, error: Optional[str] = None) -> None:
+        job.state = state
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.result = result
+        job.error = error
+        job.updated_at = time.time()
+        self.__put(tmp_path, job, self.__path(SUCCEEDED_FOLDER_NAME if state == JobState.SUCCEEDED else FAILED_FOLDER_NAME, job.job_id))
+
+    def __wait_for_job(self, job_id: str, timeout: float = 5) -> QueuedJob:
+        start_time = time.time()
+
+        while True:
+            job = self.get(job_id)
+
+            if job or time.time() - start_time > timeout:
+                return job
+
+            time.sleep(0.05)
+
+    # the path of the file in tmp, None if someone else moved it first
+    def __take(self, path: str) -> Optional[str]:
+        tmp_path = self.__tmp_path(os.path.basename(path).split(OWNER_SEPARATOR)[0].split('.')[0])
+
+        try:
+            os.rename(path, tmp_path)
+        except FileNotFoundError:
+            return None
+
+        # the mtime tells the crash recovery how long it's been in tmp
+        os.utime(tmp_path)
+
+        return tmp_path
+
+    def __put(self, tmp_path: str, job: QueuedJob, path: str) -> None:
+        self.__write(tmp_path, job)
+        os.rename(tmp_path, path)
+
+    @staticmethod
+    def __write(path: str, job: QueuedJob) -> None:
+        with open(path, 'w') as f:
+            json.dump(job.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def __read(path: str) -> Optional[QueuedJob]:
+        try:
+            with open(path, 'r') as f:
+                return QueuedJob.from_dict(json.load(f))
+        except (FileNotFoundError, ValueError, TypeError, KeyError):
+            return None
+
+    def __folder(self, folder_name: str) -> str:
+        return os.path.join(self.folder_path, folder_name)
+
+    def __path(self, folder_name: str, job_id: str) -> str:
+        return os.path.join(self.__folder(folder_name), job_id + '.json')
+
+    def __leased_path(self, job_id: str, worker_id: str) -> str:
+        return os.path.join(self.__folder(LEASED_FOLDER_NAME), job_id + OWNER_SEPARATOR + worker_id + '.json')
+
+    def __tmp_path(self, name: str, extension: str = '.json') -> str:
+        return os.path.join(self.__folder(TMP_FOLDER_NAME), '{}.{}{}'.format(name, uuid.uuid4().hex, extension))
+
+    def __key_path(self, idempotency_key: str) -> str:
+        return os.path.join(self.__folder(KEYS_FOLDER_NAME), hashlib.sha1(idempotency_key.encode()).hexdigest())
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,67 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Any
+from abc import abstractmethod
+
+# Local
+from .queued_job import QueuedJob
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: JobQueue ------------------------------------------------------------ #
+
+# Storage for jobs shared by the workers of several hosts
+#
+# - claim is atomic: a job is leased to exactly one worker at a time
+# - a lease has to be renewed while the job runs, an expired lease puts the job back to pending (or failed, if out of attempts)
+# - renew/complete/fail/release only succeed for the current lease owner, so a worker that lost its lease can not overwrite the new owner's outcome
+# - delivery is at-least-once, idempotency keys make enqueueing the same work twice a no-op
+#
+# lease expiry compares wall clocks, the hosts sharing a queue need synced clocks (ntp)
+class JobQueue:
+
+    # ------------------------------------------------------- Abstract methods ------------------------------------------------------- #
+
+    # returns the existing job if one with the same idempotency key exists
+    @abstractmethod
+    def enqueue(self, job: QueuedJob) -> QueuedJob:
+        pass
+
+    # account_ids None means any account
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float, account_ids: Optional[List[str]] = None) -> Optional[QueuedJob]:
+        pass
+
+    @abstractmethod
+    def renew(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        pass
+
+    # retry puts the job back to pending (after retry_delay_seconds) if it has attempts left
+    # payload replaces the job's payload, so the retry can pick up where this attempt stopped
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True, retry_delay_seconds: float = 0, payload: Optional[Dict[str, Any]] = None) -> bool:
+        pass
+
+    # gives back a job that was claimed but not started, without counting it as an attempt
+    @abstractmethod
+    def release(self, job_id: str, worker_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        pass
+
+    # state -> count
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        pass
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,263 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Callable, Any
+import threading, socket, json, time, os, uuid
+
+# Local
+from .job_queue import JobQueue
+from .queued_job import QueuedJob
+from ..enums.action_type import ActionType
+from ..enums.visibility import Visibility
+from ..enums.html_parser_engine import HtmlParserEngine
+from ..enums.analytics_tab import AnalyticsTab
+from ..enums.analytics_period import AnalyticsPeriod
+from ..upload_state import UploadState
+from ..scheduler import JobScheduler
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# the Youtube method a job calls when there's no handler for its action and its payload has no 'method'
+DEFAULT_METHOD_NAMES = {
+    ActionType.UPLOAD:  'upload',
+    ActionType.COMMENT: 'comment_on_video',
+    ActionType.LIKE:    'like',
+    ActionType.WATCH:   'watch_video'
+}
+
+# the enum kwargs of the Youtube methods, given by their names in the json payloads
+ENUM_KWARGS = {
+    'visibility':       Visibility,
+    'parser_engine':    HtmlParserEngine,
+    'tab':              AnalyticsTab,
+    'period':           AnalyticsPeriod
+}
+
+# kept up to date in the payload of an upload job, so a retry on any host resumes the upload instead of sending the file again
+UPLOAD_STATE_KEY = 'upload_state'
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: QueueWorker ---------------------------------------------------------- #
+
+# Claims jobs of a shared JobQueue for the accounts of this host and runs them on a local JobScheduler
+# The leases of the claimed jobs are renewed for as long as they are queued or running in the scheduler,
+# so a long upload or bulk job keeps its lease, while the jobs of a crashed host get reassigned once their leases expire.
+#
+# a job's payload is either
+#   {'method': 'bulk_reset_videos', 'args': [...], 'kwargs': {...}} - any Youtube method
+#   or the kwargs of the default method of its action (eg. the kwargs of upload for ActionType.UPLOAD)
+# enum kwargs (see ENUM_KWARGS) are given by their names, eg. {'visibility': 'PRIVATE'}
+# a result of False or (False, ...) counts as failed, just like an exception
+class QueueWorker:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        job_queue: JobQueue,
+        scheduler: JobScheduler,
+        account_ids: Optional[List[str]] = None, # the accounts whose cookies are on this host, None means any
+        worker_id: Optional[str] = None,
+        handlers: Optional[Dict[ActionType, Callable[['Youtube', Dict], Any]]] = None,
+        lease_seconds: float = 300,
+        max_in_flight: Optional[int] = None, # claimed, not yet finished jobs, defaults to the scheduler's worker count
+        poll_interval_seconds: float = 2,
+        retry_delay_seconds: float = 60
+    ):
+        self.job_queue = job_queue
+        self.scheduler = scheduler
+        self.account_ids = account_ids
+        self.worker_id = worker_id or '{}-{}-{}'.format(socket.gethostname(), os.getpid(), uuid.uuid4().hex[:6])
+        self.handlers = handlers or {}
+        self.lease_seconds = lease_seconds
+        self.max_in_flight = max_in_flight or scheduler.max_workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.retry_delay_seconds = retry_delay_seconds
+
+        self.lost_lease_job_ids = set()
+        self.__in_flight = {} # job_id -> (QueuedJob, scheduler Job)
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def start(self) -> 'QueueWorker':
+        if self.__thread:
+            return self
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__loop, name='QueueWorker-{}'.format(self.worker_id), daemon=True)
+        self.__thread.start()
+
+        return self
+
+    # stops claiming new jobs, the claimed ones are finished (and renewed meanwhile) if wait is True,
+    # otherwise the ones that did not start yet are given back to the queue
+    def stop(self, wait: bool = True) -> None:
+        self.__stop_event.set()
+
+        if not wait:
+            for _, scheduler_job in self.__in_flight_items():
+                scheduler_job.future.cancel()
+
+        if self.__thread:
+            self.__thread.join()
+            self.__thread = None
+
+    @property
+    def in_flight_job_ids(self) -> List[str]:
+        with self.__lock:
+            return list(self.__in_flight.keys())
+
+    def __enter__(self) -> 'QueueWorker':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop(wait=exc_type is None)
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __loop(self) -> None:
+        renew_interval = self.lease_seconds / 3
+        last_renewed_at = time.time()
+
+        while True:
+            stopping = self.__stop_event.is_set()
+
+            if stopping and not self.in_flight_job_ids:
+                return
+
+            if time.time() - last_renewed_at >= renew_interval:
+                self.__renew_leases()
+                last_renewed_at = time.time()
+
+            if not stopping and len(self.in_flight_job_ids) < self.max_in_flight:
+                try:
+                    job = self.job_queue.claim(self.worker_id, self.lease_seconds, account_ids=self.account_ids)
+                except Exception as e:
+                    print('QueueWorker: claim failed:', e)
+                    job = None
+
+                if job:
+                    self.__dispatch(job)
+
+                    continue
+
+            if stopping:
+                # the event stays set, wait() would return right away
+                time.sleep(min(self.poll_interval_seconds, renew_interval))
+            else:
+                self.__stop_event.wait(min(self.poll_interval_seconds, renew_interval))
+
+    def __dispatch(self, job: QueuedJob) -> None:
+        scheduler_job = self.scheduler.submit(
+            job.account_id,
+            lambda session: self.__handle(session, job),
+            action=job.action,
+            priority=job.priority
+        )
+
+        with self.__lock:
+            self.__in_flight[job.job_id] = (job, scheduler_job)
+
+        scheduler_job.future.add_done_callback(lambda future: self.__finished(job, future))
+
+    def __handle(self, session: 'Youtube', job: QueuedJob) -> Any:
+        handler = self.handlers.get(job.action)
+
+        if handler:
+            result = handler(session, job.payload)
+        elif 'method' in job.payload:
+            result = getattr(session, job.payload['method'])(*job.payload.get('args', []), **self.__decode_kwargs(job.payload.get('kwargs', {})))
+        elif job.action == ActionType.UPLOAD:
+            result = self.__upload(session, job)
+        elif job.action in DEFAULT_METHOD_NAMES:
+            result = getattr(session, DEFAULT_METHOD_NAMES[job.action])(**self.__decode_kwargs(job.payload))
+        else:
+            raise ValueError('No handler for {} and no \'method\' in the payload'.format(job.action.value))
+
+        if result is False or (isinstance(result, (tuple, list)) and result and result[0] is False):
+            raise RuntimeError('{} returned {}'.format(job.action.value, result))
+
+        return result
+
+    # resumes from the state of the previous attempt, whichever host ran it
+    def __upload(self, session: 'Youtube', job: QueuedJob) -> Any:
+        kwargs = self.__decode_kwargs(job.payload)
+
+        if kwargs.get(UPLOAD_STATE_KEY):
+            kwargs[UPLOAD_STATE_KEY] = UploadState.from_dict(kwargs[UPLOAD_STATE_KEY])
+
+        try:
+            return getattr(session, DEFAULT_METHOD_NAMES[ActionType.UPLOAD])(**kwargs)
+        finally:
+            upload_state = session.last_upload_state
+
+            # handed to the queue with the outcome of this attempt
+            if upload_state and upload_state.video_path == kwargs.get('video_path'):
+                job.payload = dict(job.payload, **{UPLOAD_STATE_KEY: upload_state.to_dict()})
+
+    def __finished(self, job: QueuedJob, future) -> None:
+        with self.__lock:
+            self.__in_flight.pop(job.job_id, None)
+
+        try:
+            if future.cancelled():
+                done = self.job_queue.release(job.job_id, self.worker_id)
+            elif future.exception() is not None:
+                done = self.job_queue.fail(job.job_id, self.worker_id, repr(future.exception()), retry_delay_seconds=self.retry_delay_seconds, payload=job.payload)
+            else:
+                done = self.job_queue.complete(job.job_id, self.worker_id, result=self.__serializable(future.result()))
+        except Exception as e:
+            print('QueueWorker: could not report {}: {}'.format(job.job_id, e))
+            done = False
+
+        if not done:
+            # the lease expired meanwhile, the job might have been given to another worker
+            self.__lost_lease(job)
+
+    def __renew_leases(self) -> None:
+        for job, _ in self.__in_flight_items():
+            try:
+                renewed = self.job_queue.renew(job.job_id, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                print('QueueWorker: renew failed:', e)
+                renewed = True # will be tried again next time, it's not lost yet
+
+            if not renewed:
+                self.__lost_lease(job)
+
+    def __lost_lease(self, job: QueuedJob) -> None:
+        if job.job_id not in self.lost_lease_job_ids:
+            self.lost_lease_job_ids.add(job.job_id)
+            print('QueueWorker: lost the lease of', job.job_id)
+
+    def __in_flight_items(self) -> List[tuple]:
+        with self.__lock:
+            return list(self.__in_flight.values())
+
+    @staticmethod
+    def __decode_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: ENUM_KWARGS[k][v] if k in ENUM_KWARGS and isinstance(v, str) else v for k, v in kwargs.items()}
+
+    @staticmethod
+    def __serializable(result: Any) -> Any:
+        try:
+            json.dumps(result)
+
+            return result
+        except (TypeError, ValueError):
+            return repr(result)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
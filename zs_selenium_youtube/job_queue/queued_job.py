@@ -0,0 +1,112 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict, Any
+from enum import Enum
+import time, uuid
+
+# Local
+from ..enums.action_type import ActionType
+from ..enums.job_state import JobState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: QueuedJob ----------------------------------------------------------- #
+
+# a job as stored in a JobQueue, everything in it has to be json serializable
+class QueuedJob:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        account_id: str,
+        action: ActionType,
+        payload: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None, # enqueueing the same key again returns the existing job
+        priority: int = 0, # higher runs first
+        max_attempts: int = 3,
+        job_id: Optional[str] = None,
+        state: JobState = JobState.PENDING,
+        attempts: int = 0,
+        lease_owner: Optional[str] = None,
+        lease_expires_at: Optional[float] = None,
+        available_at: Optional[float] = None,
+        result: Any = None,
+        error: Optional[str] = None,
+        created_at: Optional[float] = None,
+        updated_at: Optional[float] = None
+    ):
+        self.job_id = job_id or uuid.uuid4().hex
+        self.account_id = account_id
+        self.action = action
+        # enums are stored by their names, the QueueWorker turns them back for the kwargs it knows
+        self.payload = self.__by_name(payload or {})
+        self.idempotency_key = idempotency_key
+        self.priority = priority
+        self.max_attempts = max_attempts
+        self.state = state
+        self.attempts = attempts
+        self.lease_owner = lease_owner
+        self.lease_expires_at = lease_expires_at
+        self.created_at = created_at or time.time()
+        self.available_at = available_at or self.created_at
+        self.updated_at = updated_at or self.created_at
+        self.result = result
+        self.error = error
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in [JobState.SUCCEEDED, JobState.FAILED]
+
+    def lease_expired(self, now: Optional[float] = None) -> bool:
+        return self.state == JobState.LEASED and (self.lease_expires_at or 0) < (now or time.time())
+
+    def to_dict(self) -> Dict:
+        return {
+            'job_id': self.job_id,
+            'account_id': self.account_id,
+            'action': self.action.value,
+            'payload': self.payload,
+            'idempotency_key': self.idempotency_key,
+            'priority': self.priority,
+            'max_attempts': self.max_attempts,
+            'state': self.state.value,
+            'attempts': self.attempts,
+            'lease_owner': self.lease_owner,
+            'lease_expires_at': self.lease_expires_at,
+            'available_at': self.available_at,
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'QueuedJob':
+        return cls(**dict(d, action=ActionType(d['action']), state=JobState(d['state'])))
+
+    def __repr__(self) -> str:
+        return 'QueuedJob({}, {}, {}, {}, attempts={})'.format(self.job_id, self.account_id, self.action.value, self.state.value, self.attempts)
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    @classmethod
+    def __by_name(cls, value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value.name
+        elif isinstance(value, dict):
+            return {k: cls.__by_name(v) for k, v in value.items()}
+        elif isinstance(value, (list, tuple)):
+            return [cls.__by_name(v) for v in value]
+
+        return value
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
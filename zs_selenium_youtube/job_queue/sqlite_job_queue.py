@@ -0,0 +1,280 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Any
+import sqlite3, threading, json, time, os
+
+# Local
+from .job_queue import JobQueue
+from .queued_job import QueuedJob
+from ..enums.job_state import JobState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id              TEXT PRIMARY KEY,
+    idempotency_key     TEXT UNIQUE,
+    account_id          TEXT NOT NULL,
+    state               TEXT NOT NULL,
+    priority            INTEGER NOT NULL,
+    available_at        REAL NOT NULL,
+    lease_owner         TEXT,
+    lease_expires_at    REAL,
+    attempts            INTEGER NOT NULL,
+    max_attempts        INTEGER NOT NULL,
+    data                TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (state, priority DESC, available_at);
+CREATE INDEX IF NOT EXISTS jobs_lease ON jobs (state, lease_expires_at);
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SqliteJobQueue --------------------------------------------------------- #
+
+# The default backend, every host opens the same database file
+# claims run in 'BEGIN IMMEDIATE' transactions, so only one connection can claim at a time
+# fine on a local disk, on network filesystems with unreliable locking use FileSystemJobQueue
+class SqliteJobQueue(JobQueue):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, db_path: str, busy_timeout_seconds: float = 30):
+        folder_path = os.path.dirname(db_path)
+
+        if folder_path:
+            os.makedirs(folder_path, exist_ok=True)
+
+        self.db_path = db_path
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(db_path, timeout=busy_timeout_seconds, isolation_level=None, check_same_thread=False)
+        self.__connection.executescript(SCHEMA)
+
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def enqueue(self, job: QueuedJob) -> QueuedJob:
+        with self.__transaction():
+            if job.idempotency_key is not None:
+                existing = self.__fetch('idempotency_key = ?', (job.idempotency_key,))
+
+                if existing:
+                    return existing
+
+            job.state = JobState.PENDING
+            self.__save(job, insert=True)
+
+        return job
+
+    def claim(self, worker_id: str, lease_seconds: float, account_ids: Optional[List[str]] = None) -> Optional[QueuedJob]:
+        if account_ids is not None and not account_ids:
+            return None
+
+        now = time.time()
+
+        with self.__transaction():
+            self.__reassign_expired(now)
+
+            condition = 'state = ? AND available_at <= ?'
+            params = [JobState.PENDING.value, now]
+
+            if account_ids is not None:
+                condition += ' AND account_id IN ({})'.format(', '.join('?' * len(account_ids)))
+                params.extend(account_ids)
+
+            job = self.__fetch(condition + ' ORDER BY priority DESC, available_at LIMIT 1', params)
+
+            if not job:
+                return None
+
+            job.state = JobState.LEASED
+            job.lease_owner = worker_id
+            job.lease_expires_at = now + lease_seconds
+            job.attempts += 1
+            job.updated_at = now
+            self.__save(job)
+
+        return job
+
+    def renew(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        with self.__transaction():
+            job = self.__owned(job_id, worker_id)
+
+            if not job:
+                return False
+
+            job.lease_expires_at = time.time() + lease_seconds
+            self.__save(job)
+
+        return True
+
+    def complete(self, job_id: str, worker_id: str, result: Any = None) -> bool:
+        return self.__finish(job_id, worker_id, JobState.SUCCEEDED, result=result)
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True, retry_delay_seconds: float = 0, payload: Optional[Dict[str, Any]] = None) -> bool:
+        with self.__transaction():
+            job = self.__owned(job_id, worker_id)
+
+            if not job:
+                return False
+
+            if payload is not None:
+                job.payload = payload
+
+            if retry and job.attempts < job.max_attempts:
+                self.__to_pending(job, available_at=time.time() + retry_delay_seconds, error=error)
+            else:
+                self.__to_finished(job, JobState.FAILED, error=error)
+
+        return True
+
+    def release(self, job_id: str, worker_id: str) -> bool:
+        with self.__transaction():
+            job = self.__owned(job_id, worker_id)
+
+            if not job:
+                return False
+
+            job.attempts = max(job.attempts - 1, 0)
+            self.__to_pending(job)
+
+        return True
+
+    def get(self, job_id: str) -> Optional[QueuedJob]:
+        with self.__lock:
+            return self.__fetch('job_id = ?', (job_id,))
+
+    def counts(self) -> Dict[str, int]:
+        with self.__lock:
+            return dict(self.__connection.execute('SELECT state, COUNT(*) FROM jobs GROUP BY state').fetchall())
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __transaction(self) -> '_Transaction':
+        return _Transaction(self.__lock, self.__connection)
+
+    def __fetch(self, condition: str, params) -> Optional[QueuedJob]:
+        row = self.__connection.execute('SELECT data FROM jobs WHERE ' + condition, params).fetchone()
+
+        return QueuedJob.from_dict(json.loads(row[0])) if row else None
+
+    def __owned(self, job_id: str, worker_id: str) -> Optional[QueuedJob]:
+        job = self.__fetch('job_id = ? AND state = ? AND lease_owner = ?', (job_id, JobState.LEASED.value, worker_id))
+
+        # an expired lease is lost even if nobody claimed the job since
+        return job if job and not job.lease_expired() else None
+
+    def __reassign_expired(self, now: float) -> None:
+        rows = self.__connection.execute(
+            'SELECT data FROM jobs WHERE state = ? AND lease_expires_at < ?',
+            (JobState.LEASED.value, now)
+        ).fetchall()
+
+        for row in rows:
+            job = QueuedJob.from_dict(json.loads(row[0]))
+
+            if job.attempts < job.max_attempts:
+                self.__to_pending(job, available_at=now, error='lease of {} expired'.format(job.lease_owner))
+            else:
+                self.__to_finished(job, JobState.FAILED, error='lease of {} expired, out of attempts'.format(job.lease_owner))
+
+    def __finish(self, job_id: str, worker_id: str, state: JobState, result: Any = None, error: Optional[str] = None) -> bool:
+        with self.__transaction():
+            job = self.__owned(job_id, worker_id)
+
+            if not job:
+                return False
+
+            self.__to_finished(job, state, result=result, error=error)
+
+        return True
+
+    def __to_pending(self, job: QueuedJob, available_at: Optional[float] = None, error: Optional[str] = None) -> None:
+        job.state = JobState.PENDING
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.available_at = available_at or time.time()
+        job.error = error or job.error
+        job.updated_at = time.time()
+        self.__save(job)
+
+    def __to_finished(self, job: QueuedJob, state: JobState, result: Any = None, error: Optional[str] = None) -> None:
+        job.state = state
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.result = result
+        job.error = error
+        job.updated_at = time.time()
+        self.__save(job)
+
+    def __save(self, job: QueuedJob, insert: bool = False) -> None:
+        values = (
+            job.account_id, job.state.value, job.priority, job.available_at, job.lease_owner,
+            job.lease_expires_at, job.attempts, job.max_attempts, json.dumps(job.to_dict())
+        )
+
+        if insert:
+            self.__connection.execute(
+                'INSERT INTO jobs (account_id, state, priority, available_at, lease_owner, lease_expires_at, attempts, max_attempts, data, job_id, idempotency_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                values + (job.job_id, job.idempotency_key)
+            )
+        else:
+            self.__connection.execute(
+                'UPDATE jobs SET account_id = ?, state = ?, priority = ?, available_at = ?, lease_owner = ?, lease_expires_at = ?, attempts = ?, max_attempts = ?, data = ? WHERE job_id = ?',
+                values + (job.job_id,)
+            )
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: _Transaction ---------------------------------------------------------- #
+
+# 'BEGIN IMMEDIATE' takes the database write lock right away, so a select-then-update can not interleave with another connection's
+class _Transaction:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, lock: threading.Lock, connection: sqlite3.Connection):
+        self.lock = lock
+        self.connection = connection
+
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def __enter__(self) -> '_Transaction':
+        self.lock.acquire()
+
+        try:
+            self.connection.execute('BEGIN IMMEDIATE')
+        except BaseException:
+            self.lock.release()
+
+            raise
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.connection.execute('COMMIT' if exc_type is None else 'ROLLBACK')
+        finally:
+            self.lock.release()
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
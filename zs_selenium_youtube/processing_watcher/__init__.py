@@ -0,0 +1,4 @@
+from .follow_up import FollowUp
+from .follow_up_result import FollowUpResult
+from .pending_video import PendingVideo
+from .processing_watcher import ProcessingWatcher
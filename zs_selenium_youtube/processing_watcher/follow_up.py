@@ -0,0 +1,57 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Callable, Optional
+
+# Local
+from ..enums.visibility import Visibility
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: FollowUp ------------------------------------------------------------ #
+
+# an action to run on a video once it finished processing
+# stateless, the same one can be shared between videos, the watcher counts the attempts per video
+class FollowUp:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        name: str,
+        action: Callable[['Youtube', str], bool], # (youtube, video_id) -> succeeded
+        max_attempts: int = 3,
+        is_ready: Optional[Callable[['Youtube', str], bool]] = None # (youtube, video_id) -> ready, checked after processed, not ready is not an attempt
+    ):
+        self.name = name
+        self.action = action
+        self.max_attempts = max_attempts
+        self.is_ready = is_ready
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @classmethod
+    def endscreen(cls, max_attempts: int = 3) -> 'FollowUp':
+        return cls(
+            'endscreen',
+            lambda youtube, video_id: youtube.add_endscreen(video_id),
+            max_attempts=max_attempts,
+            is_ready=lambda youtube, video_id: youtube.is_endscreen_editor_enabled(video_id)
+        )
+
+    @classmethod
+    def pinned_comment(cls, comment: str, max_attempts: int = 3) -> 'FollowUp':
+        return cls('pinned_comment', lambda youtube, video_id: all(youtube.comment_on_video(video_id, comment, pinned=True)), max_attempts=max_attempts)
+
+    @classmethod
+    def visibility(cls, visibility: Visibility, max_attempts: int = 3) -> 'FollowUp':
+        return cls('visibility_' + visibility.name.lower(), lambda youtube, video_id: youtube.set_video_visibility(video_id, visibility), max_attempts=max_attempts)
+
+    def __repr__(self) -> str:
+        return 'FollowUp({}, max_attempts={})'.format(self.name, self.max_attempts)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
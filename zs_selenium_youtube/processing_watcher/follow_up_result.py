@@ -0,0 +1,55 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Dict
+import time
+
+# Local
+from ..enums.processing_state import ProcessingState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: FollowUpResult --------------------------------------------------------- #
+
+class FollowUpResult:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        video_id: str,
+        name: str,
+        succeeded: bool,
+        processing_state: ProcessingState,
+        attempts: int,
+        waited_seconds: float
+    ):
+        self.time = time.time()
+        self.video_id = video_id
+        self.name = name
+        self.succeeded = succeeded
+        self.processing_state = processing_state
+        self.attempts = attempts
+        self.waited_seconds = waited_seconds
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def to_dict(self) -> Dict:
+        return {
+            'time': self.time,
+            'video_id': self.video_id,
+            'name': self.name,
+            'succeeded': self.succeeded,
+            'processing_state': self.processing_state.value,
+            'attempts': self.attempts,
+            'waited_seconds': self.waited_seconds
+        }
+
+    def __repr__(self) -> str:
+        return 'FollowUpResult({}, {}, {})'.format(self.video_id, self.name, 'ok' if self.succeeded else 'failed')
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
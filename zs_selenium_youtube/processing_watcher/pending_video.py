@@ -0,0 +1,48 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List
+import time
+
+# Local
+from .follow_up import FollowUp
+from ..enums.processing_state import ProcessingState
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: PendingVideo ---------------------------------------------------------- #
+
+class PendingVideo:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        video_id: str,
+        follow_ups: List[FollowUp]
+    ):
+        self.video_id = video_id
+        self.follow_ups = follow_ups
+        self.processing_state = ProcessingState.UNKNOWN
+
+        self.added_at = time.time()
+        self.last_checked_at = None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def waited_seconds(self) -> float:
+        return time.time() - self.added_at
+
+    @property
+    def is_done(self) -> bool:
+        return not self.follow_ups
+
+    def __repr__(self) -> str:
+        return 'PendingVideo({}, {}, {})'.format(self.video_id, self.processing_state.value, [follow_up.name for follow_up in self.follow_ups])
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,209 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Callable, Dict
+import threading, time
+
+# Local
+from .follow_up import FollowUp
+from .follow_up_result import FollowUpResult
+from .pending_video import PendingVideo
+from ..enums.processing_state import ProcessingState
+from ..utils import deadline
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: ProcessingWatcher ------------------------------------------------------- #
+
+# Tracks the processing state of many uploaded videos at once and runs their follow-ups as each one gets ready
+# One poll reads the states of every pending video from the studio content list,
+# only the ones not found there get a probe of their own
+class ProcessingWatcher:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        poll_interval_seconds: float = 30,
+        max_wait_seconds: float = 60*60*3,
+        max_probes_per_poll: int = 3,
+        on_result: Optional[Callable[[FollowUpResult], None]] = None
+    ):
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.max_probes_per_poll = max_probes_per_poll
+        self.on_result = on_result
+
+        self.results = []
+        self.__pending = {}
+        self.__attempts = {} # (video_id, follow_up) -> attempts
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def watch(self, video_id: str, *follow_ups: FollowUp) -> None:
+        with self.__lock:
+            pending_video = self.__pending.get(video_id)
+
+            if pending_video:
+                pending_video.follow_ups.extend(follow_ups)
+            else:
+                self.__pending[video_id] = PendingVideo(video_id, list(follow_ups))
+
+    def unwatch(self, video_id: str) -> Optional[PendingVideo]:
+        with self.__lock:
+            for key in [key for key in self.__attempts if key[0] == video_id]:
+                del self.__attempts[key]
+
+            return self.__pending.pop(video_id, None)
+
+    def attempts(self, video_id: str, follow_up: FollowUp) -> int:
+        with self.__lock:
+            return self.__attempts.get((video_id, follow_up), 0)
+
+    @property
+    def pending(self) -> List[PendingVideo]:
+        with self.__lock:
+            return list(self.__pending.values())
+
+    @property
+    def pending_video_ids(self) -> List[str]:
+        return [pending_video.video_id for pending_video in self.pending]
+
+    # one round: refresh the states, then run the follow-ups of the videos that are ready
+    def poll(self, youtube: 'Youtube') -> List[FollowUpResult]:
+        # the ones checked the longest time ago come first, so probes rotate between the videos missing from the content list
+        pending = sorted(self.pending, key=lambda pending_video: pending_video.last_checked_at or 0)
+
+        if not pending:
+            return []
+
+        states = youtube.get_processing_states([pending_video.video_id for pending_video in pending], max_probes=self.max_probes_per_poll) or {}
+        results = []
+
+        for pending_video in pending:
+            if pending_video.video_id in states:
+                pending_video.processing_state = states[pending_video.video_id]
+                pending_video.last_checked_at = time.time()
+
+            # processed can still wait for the readiness of a follow-up (eg. the endscreen editor), so the timeout applies to it too
+            if pending_video.processing_state == ProcessingState.FAILED or pending_video.waited_seconds > self.max_wait_seconds:
+                results.extend(self.__give_up(pending_video))
+            elif pending_video.processing_state == ProcessingState.PROCESSED:
+                results.extend(self.__run_follow_ups(youtube, pending_video))
+
+            if pending_video.is_done:
+                self.unwatch(pending_video.video_id)
+
+        return results
+
+    # polls until every video is done or timeout is reached
+    # between_polls is the useful work the session should do while the videos are processing
+    # without it, it sleeps until the next poll
+    def run(
+        self,
+        youtube: 'Youtube',
+        timeout: Optional[float] = None,
+        between_polls: Optional[Callable[[], None]] = None
+    ) -> List[FollowUpResult]:
+        start_time = time.time()
+        results = []
+
+        while True:
+            poll_started_at = time.time()
+            results.extend(self.poll(youtube))
+
+            if not self.__pending or (timeout is not None and time.time() - start_time >= timeout):
+                return results
+
+            if between_polls:
+                between_polls()
+
+            remaining = self.poll_interval_seconds - (time.time() - poll_started_at)
+
+            if timeout is not None:
+                remaining = min(remaining, timeout - (time.time() - start_time))
+
+            if remaining > 0:
+                deadline.sleep(remaining)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {}
+
+        for pending_video in self.pending:
+            counts[pending_video.processing_state.value] = counts.get(pending_video.processing_state.value, 0) + 1
+
+        return counts
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __run_follow_ups(self, youtube: 'Youtube', pending_video: PendingVideo) -> List[FollowUpResult]:
+        results = []
+
+        for follow_up in list(pending_video.follow_ups):
+            # not ready yet is not a failed attempt, the rest waits for it until the next poll
+            if follow_up.is_ready and not self.__is_ready(youtube, pending_video, follow_up):
+                break
+
+            with self.__lock:
+                key = (pending_video.video_id, follow_up)
+                self.__attempts[key] = self.__attempts.get(key, 0) + 1
+                exhausted = self.__attempts[key] >= follow_up.max_attempts
+
+            try:
+                succeeded = bool(follow_up.action(youtube, pending_video.video_id))
+            except Exception as e:
+                print('ProcessingWatcher: {} on {} failed: {}'.format(follow_up.name, pending_video.video_id, e))
+                succeeded = False
+
+            if succeeded or exhausted:
+                pending_video.follow_ups.remove(follow_up)
+                results.append(self.__result(pending_video, follow_up, succeeded))
+            else:
+                # the rest most likely depends on this one (eg. visibility after endscreen), try them all again on the next poll
+                break
+
+        return results
+
+    def __is_ready(self, youtube: 'Youtube', pending_video: PendingVideo, follow_up: FollowUp) -> bool:
+        try:
+            return bool(follow_up.is_ready(youtube, pending_video.video_id))
+        except Exception as e:
+            print('ProcessingWatcher: readiness of {} on {} failed: {}'.format(follow_up.name, pending_video.video_id, e))
+
+            return False
+
+    def __give_up(self, pending_video: PendingVideo) -> List[FollowUpResult]:
+        results = [self.__result(pending_video, follow_up, False) for follow_up in pending_video.follow_ups]
+        pending_video.follow_ups = []
+
+        return results
+
+    def __result(self, pending_video: PendingVideo, follow_up: FollowUp, succeeded: bool) -> FollowUpResult:
+        with self.__lock:
+            attempts = self.__attempts.pop((pending_video.video_id, follow_up), 0)
+
+        result = FollowUpResult(
+            video_id=pending_video.video_id,
+            name=follow_up.name,
+            succeeded=succeeded,
+            processing_state=pending_video.processing_state,
+            attempts=attempts,
+            waited_seconds=pending_video.waited_seconds
+        )
+        self.results.append(result)
+
+        if self.on_result:
+            try:
+                self.on_result(result)
+            except Exception as e:
+                print('ProcessingWatcher: on_result failed:', e)
+
+        return result
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
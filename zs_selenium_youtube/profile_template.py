@@ -0,0 +1,255 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Dict, Optional, Union
+import os, json, time, shutil, hashlib
+
+# Pip
+from selenium_uploader_account import BaseAddonInstallSettings
+from selenium_firefox.firefox import Firefox
+from selenium.webdriver import Firefox as FirefoxWebDriver
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+# Local
+from .utils.file_clone import clone_tree, CloneStats
+from .utils.file_lock import FileLock
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+TEMPLATE_READY_FILE_NAME = '.template_ready'
+TEMPLATE_LOCK_FILE_NAME  = '.template.lock'
+USER_JS_FILE_NAME        = 'user.js'
+
+# never written in place by firefox, safe to share between profiles
+HARDLINKABLE_EXTENSIONS  = ('.xpi', '.so', '.dll', '.dylib', '.info')
+HARDLINKABLE_FOLDERS     = ('extensions', 'features', 'gmp-gmpopenh264', 'gmp-widevinecdm')
+
+# belongs to the running instance or to the account, not to the template
+IGNORED_FILE_NAMES       = ('lock', '.parentlock', 'parent.lock', TEMPLATE_READY_FILE_NAME, TEMPLATE_LOCK_FILE_NAME)
+IGNORED_FILE_PREFIXES    = ('cookies.sqlite', 'sessionstore', 'sessionCheckpoints')
+IGNORED_FOLDERS          = ('sessionstore-backups', 'crashes', 'minidumps', 'cache2', 'startupCache', 'shader-cache')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: ProfileTemplate -------------------------------------------------------- #
+
+# Firefox profile with addons installed and prefs set, built once and cloned for every account
+class ProfileTemplate:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        templates_folder_path: str,
+        profiles_folder_path: Optional[str] = None,
+
+        # addons
+        addons_folder_path: Optional[str] = None,
+        addon_settings: Optional[List[BaseAddonInstallSettings]] = None,
+
+        # prefs shared by every profile
+        prefs: Optional[Dict[str, Union[str, int, bool]]] = None,
+
+        # build
+        geckodriver_path: Optional[str] = None,
+        firefox_binary_path: Optional[str] = None,
+        language: str = 'en-us',
+        headless: bool = True,
+        build_wait_seconds: float = 2
+    ):
+        self.templates_folder_path = templates_folder_path
+        self.profiles_folder_path = profiles_folder_path or os.path.join(templates_folder_path, 'profiles')
+        self.addons_folder_path = addons_folder_path
+        self.addon_settings = addon_settings
+        self.prefs = prefs or {}
+        self.geckodriver_path = geckodriver_path
+        self.firefox_binary_path = firefox_binary_path
+        self.language = language
+        self.headless = headless
+        self.build_wait_seconds = build_wait_seconds
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # changes whenever the addons or the shared prefs change, so stale templates are never reused
+    @property
+    def key(self) -> str:
+        h = hashlib.sha1()
+        h.update(json.dumps(self.prefs, sort_keys=True, default=str).encode())
+        h.update(self.language.encode())
+
+        if self.addons_folder_path and os.path.exists(self.addons_folder_path):
+            for file_name in sorted(os.listdir(self.addons_folder_path)):
+                stat = os.stat(os.path.join(self.addons_folder_path, file_name))
+                h.update('{}:{}:{}'.format(file_name, stat.st_size, int(stat.st_mtime)).encode())
+
+        for addon_setting in self.addon_settings or []:
+            h.update(json.dumps(getattr(addon_setting, '__dict__', str(addon_setting)), sort_keys=True, default=str).encode())
+
+        return h.hexdigest()[:16]
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.templates_folder_path, self.key)
+
+    @property
+    def is_built(self) -> bool:
+        return os.path.exists(os.path.join(self.path, TEMPLATE_READY_FILE_NAME))
+
+    def build(self, force: bool = False) -> str:
+        path = self.path
+
+        with FileLock(os.path.join(self.templates_folder_path, self.key + TEMPLATE_LOCK_FILE_NAME)):
+            # another process might have built it while we were waiting for the lock
+            if self.is_built and not force:
+                return path
+
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+            self.__build(path)
+
+        return path
+
+    # returns the path of the account's profile, only per-account files are written if the template was already built
+    def create_profile(
+        self,
+        profile_id: str,
+        prefs: Optional[Dict[str, Union[str, int, bool]]] = None,
+        stats: Optional[CloneStats] = None
+    ) -> str:
+        template_path = self.path if self.is_built else self.build()
+        profile_path = os.path.join(self.profiles_folder_path, profile_id)
+        template_link_path = os.path.join(profile_path, TEMPLATE_READY_FILE_NAME)
+
+        if not self.__is_cloned_from(profile_path, template_path):
+            if os.path.exists(profile_path):
+                shutil.rmtree(profile_path)
+
+            clone_stats = clone_tree(template_path, profile_path, can_hardlink=self.__can_hardlink, ignore=self.__ignore)
+
+            with open(template_link_path, 'w') as f:
+                f.write(template_path)
+
+            if stats is not None:
+                stats.add(clone_stats)
+
+        if prefs:
+            written = self.__write_user_js(profile_path, dict(self.prefs, **prefs))
+
+            if stats is not None:
+                stats.bytes_written += written
+
+        return profile_path
+
+    def remove_profile(self, profile_id: str) -> None:
+        shutil.rmtree(os.path.join(self.profiles_folder_path, profile_id), ignore_errors=True)
+
+    # webdriver class for selenium_firefox, that creates the profile when the browser starts and runs firefox on it directly
+    # selenium would copy a FirefoxProfile into a temp folder and send it zipped to geckodriver instead
+    def webdriver_class(
+        self,
+        profile_id: str,
+        prefs: Optional[Dict[str, Union[str, int, bool]]] = None,
+        stats: Optional[CloneStats] = None
+    ) -> type:
+        template = self
+
+        class ClonedProfileFirefox(FirefoxWebDriver):
+            def __init__(self, firefox_profile=None, firefox_options=None, options=None, **kwargs):
+                options = options or firefox_options or FirefoxOptions()
+                profile_prefs = {}
+
+                # the prefs selenium_firefox set (user agent, language, proxy...) go into the clone's user.js
+                if firefox_profile is not None:
+                    profile_prefs.update(firefox_profile.default_preferences)
+                    shutil.rmtree(firefox_profile.path, ignore_errors=True)
+
+                profile_prefs.update(template.prefs)
+                profile_prefs.update(prefs or {})
+                profile_path = template.create_profile(profile_id, prefs=profile_prefs, stats=stats)
+
+                options.add_argument('-profile')
+                options.add_argument(profile_path)
+
+                super().__init__(options=options, **kwargs)
+
+        return ClonedProfileFirefox
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __build(self, path: str) -> None:
+        browser = Firefox(
+            addons_folder_path=self.addons_folder_path,
+            addon_settings=self.addon_settings,
+            geckodriver_path=self.geckodriver_path,
+            firefox_binary_path=self.firefox_binary_path,
+            language=self.language,
+            headless=self.headless
+        )
+
+        try:
+            # let firefox flush addon installs and prefs into the profile
+            time.sleep(self.build_wait_seconds)
+
+            clone_tree(browser.driver.capabilities['moz:profile'], path, ignore=self.__ignore, use_reflink=False)
+        finally:
+            browser.driver.quit()
+
+        self.__write_user_js(path, self.prefs)
+
+        with open(os.path.join(path, TEMPLATE_READY_FILE_NAME), 'w') as f:
+            f.write(str(time.time()))
+
+    @staticmethod
+    def __is_cloned_from(profile_path: str, template_path: str) -> bool:
+        try:
+            with open(os.path.join(profile_path, TEMPLATE_READY_FILE_NAME), 'r') as f:
+                return f.read().strip() == template_path
+        except OSError:
+            return False
+
+    @staticmethod
+    def __write_user_js(profile_path: str, prefs: Dict[str, Union[str, int, bool]]) -> int:
+        content = ''.join('user_pref({}, {});\n'.format(json.dumps(k), json.dumps(v)) for k, v in sorted(prefs.items()))
+        user_js_path = os.path.join(profile_path, USER_JS_FILE_NAME)
+
+        try:
+            with open(user_js_path, 'r') as f:
+                if f.read() == content:
+                    return 0
+        except OSError:
+            pass
+
+        # user.js might be a hardlink or reflink to the template's, never write through it
+        if os.path.exists(user_js_path):
+            os.remove(user_js_path)
+
+        with open(user_js_path, 'w') as f:
+            f.write(content)
+
+        return len(content.encode())
+
+    @staticmethod
+    def __can_hardlink(rel_path: str) -> bool:
+        parts = rel_path.split(os.sep)
+
+        return parts[-1].endswith(HARDLINKABLE_EXTENSIONS) or parts[0] in HARDLINKABLE_FOLDERS
+
+    @staticmethod
+    def __ignore(rel_path: str) -> bool:
+        parts = rel_path.split(os.sep)
+
+        return parts[-1] in IGNORED_FILE_NAMES \
+            or parts[-1].startswith(IGNORED_FILE_PREFIXES) \
+            or any(part in IGNORED_FOLDERS for part in parts[:-1])
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
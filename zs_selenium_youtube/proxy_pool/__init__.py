@@ -0,0 +1,2 @@
+from .proxy_pool import ProxyPool
+from .proxy_stats import ProxyStats
@@ -0,0 +1,347 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Union
+import urllib.request, threading, time
+
+# Pip
+from selenium_uploader_account import Proxy
+
+# Local
+from .proxy_stats import ProxyStats
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+DEFAULT_PROBE_URL   = 'https://www.youtube.com/generate_204'
+MAX_PROBE_BYTES     = 2 * 1024 * 1024
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: ProxyPool ----------------------------------------------------------- #
+
+# Hands out proxies by health score, measured from real traffic (report_*/measure) and from active probes
+# An account keeps its proxy for as long as it's healthy, a new proxy gets the fewest accounts among the good ones.
+# Proxies failing too often are quarantined, after the quarantine a successful probe puts them back in service.
+class ProxyPool:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        proxies: Optional[List[Union[Proxy, str]]] = None,
+        probe_url: str = DEFAULT_PROBE_URL, # an empty response is enough for latency
+        throughput_probe_url: Optional[str] = None, # a few hundred kb, to measure throughput too
+        probe_timeout_seconds: float = 10,
+        probe_interval_seconds: float = 60,
+        quarantine_seconds: float = 60*5,
+        max_quarantine_seconds: float = 60*60,
+        max_consecutive_failures: int = 3,
+        max_error_rate: float = 0.5,
+        min_samples: int = 5, # before the error rate is trusted
+        load_penalty: float = 0.25 # score multiplier per sticky account
+    ):
+        self.probe_url = probe_url
+        self.throughput_probe_url = throughput_probe_url
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.probe_interval_seconds = probe_interval_seconds
+        self.quarantine_seconds = quarantine_seconds
+        self.max_quarantine_seconds = max_quarantine_seconds
+        self.max_consecutive_failures = max_consecutive_failures
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.load_penalty = load_penalty
+
+        self.__proxies = {} # proxy_id -> Proxy
+        self.__stats = {} # proxy_id -> ProxyStats
+        self.__assignments = {} # account_id -> proxy_id
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__probe_thread = None
+
+        for proxy in proxies or []:
+            self.add(proxy)
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # the id used in the metrics, it never contains the password
+    @staticmethod
+    def proxy_id(proxy: Proxy) -> str:
+        return '{}@{}:{}'.format(proxy.username, proxy.host, proxy.port) if proxy.username else '{}:{}'.format(proxy.host, proxy.port)
+
+    def add(self, proxy: Union[Proxy, str]) -> Optional[str]:
+        proxy = Proxy.from_str(proxy) if isinstance(proxy, str) else proxy
+
+        if not proxy:
+            return None
+
+        proxy_id = self.proxy_id(proxy)
+
+        with self.__lock:
+            self.__proxies[proxy_id] = proxy
+            self.__stats.setdefault(proxy_id, ProxyStats(proxy_id))
+
+        return proxy_id
+
+    def remove(self, proxy: Proxy) -> None:
+        proxy_id = self.proxy_id(proxy)
+
+        with self.__lock:
+            self.__proxies.pop(proxy_id, None)
+            self.__stats.pop(proxy_id, None)
+
+            for account_id in [a for a, p in self.__assignments.items() if p == proxy_id]:
+                del self.__assignments[account_id]
+
+    # with an account_id the proxy sticks to the account while it's healthy, without one it's the best one for a single call
+    def acquire(self, account_id: Optional[str] = None) -> Optional[Proxy]:
+        proxy = self.__acquire(account_id)
+
+        if proxy is None:
+            # everything is quarantined, the ones whose quarantine is over get a chance right away
+            if self.probe_all(only_expired_quarantine=True):
+                proxy = self.__acquire(account_id)
+
+        return proxy
+
+    def release(self, account_id: str) -> None:
+        with self.__lock:
+            self.__assignments.pop(account_id, None)
+
+    def assigned_proxy(self, account_id: str) -> Optional[Proxy]:
+        with self.__lock:
+            return self.__proxies.get(self.__assignments.get(account_id))
+
+    def is_healthy(self, proxy: Proxy) -> bool:
+        with self.__lock:
+            stats = self.__stats.get(self.proxy_id(proxy))
+
+            return stats is not None and not stats.is_quarantined
+
+    # real traffic reports request_seconds, latency_seconds is for round trips, that only measure the proxy (probes)
+    def report_success(
+        self,
+        proxy: Proxy,
+        latency_seconds: Optional[float] = None,
+        bytes_transferred: int = 0,
+        duration_seconds: Optional[float] = None,
+        request_seconds: Optional[float] = None
+    ) -> None:
+        with self.__lock:
+            stats = self.__stats.get(self.proxy_id(proxy))
+
+            if stats:
+                stats.add_success(latency_seconds, bytes_transferred, duration_seconds, request_seconds)
+
+    def report_failure(self, proxy: Proxy, error: Optional[str] = None) -> None:
+        with self.__lock:
+            stats = self.__stats.get(self.proxy_id(proxy))
+
+            if not stats:
+                return
+
+            stats.add_failure(error)
+
+            if not stats.is_quarantined and (
+                stats.consecutive_failures >= self.max_consecutive_failures
+                or (stats.samples >= self.min_samples and stats.error_rate > self.max_error_rate)
+            ):
+                stats.quarantine(self.quarantine_seconds, self.max_quarantine_seconds)
+
+    # with pool.measure(proxy): ... - reports the duration of the block as request time, or an exception in it as failure
+    def measure(self, proxy: Optional[Proxy]) -> '_Measurement':
+        return _Measurement(self, proxy)
+
+    def probe(self, proxy: Proxy) -> bool:
+        with self.__lock:
+            stats = self.__stats.get(self.proxy_id(proxy))
+
+        if not stats:
+            return False
+
+        stats.last_probed_at = time.time()
+        proxy_url = 'http://' + proxy.string
+        opener = urllib.request.build_opener(urllib.request.ProxyHandler({'http': proxy_url, 'https': proxy_url}))
+
+        try:
+            start_time = time.time()
+
+            with opener.open(self.probe_url, timeout=self.probe_timeout_seconds) as response:
+                latency_seconds = time.time() - start_time
+                response.read(MAX_PROBE_BYTES)
+
+            bytes_transferred, duration_seconds = 0, None
+
+            if self.throughput_probe_url:
+                start_time = time.time()
+
+                with opener.open(self.throughput_probe_url, timeout=self.probe_timeout_seconds) as response:
+                    # the first byte would only measure the latency again
+                    first_byte_at = time.time() if response.read(1) else None
+                    bytes_transferred = len(response.read(MAX_PROBE_BYTES))
+                    duration_seconds = time.time() - (first_byte_at or start_time)
+        except Exception as e:
+            self.report_failure(proxy, 'probe: {}'.format(e))
+
+            with self.__lock:
+                if stats.quarantine_expired:
+                    stats.quarantine(self.quarantine_seconds, self.max_quarantine_seconds)
+
+            return False
+
+        with self.__lock:
+            if stats.is_quarantined:
+                if not stats.quarantine_expired:
+                    # the sample counts, but it stays out until the quarantine is over
+                    stats.add_success(latency_seconds, bytes_transferred, duration_seconds)
+
+                    return True
+
+                stats.readmit()
+
+            stats.add_success(latency_seconds, bytes_transferred, duration_seconds)
+
+        return True
+
+    # the healthy ones and the ones whose quarantine is over
+    def probe_all(self, only_expired_quarantine: bool = False) -> Dict[str, bool]:
+        with self.__lock:
+            proxies = [
+                (proxy_id, proxy) for proxy_id, proxy in self.__proxies.items()
+                if self.__stats[proxy_id].quarantine_expired or (not only_expired_quarantine and not self.__stats[proxy_id].is_quarantined)
+            ]
+
+        results = {}
+        threads = [threading.Thread(target=lambda p=p, i=i: results.__setitem__(i, self.probe(p)), daemon=True) for i, p in proxies]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    def start_probing(self) -> 'ProxyPool':
+        if self.__probe_thread:
+            return self
+
+        self.__stop_event.clear()
+        self.__probe_thread = threading.Thread(target=self.__probe_loop, name='ProxyPool-probe', daemon=True)
+        self.__probe_thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+
+        if self.__probe_thread:
+            self.__probe_thread.join()
+            self.__probe_thread = None
+
+    def metrics(self) -> Dict[str, Dict]:
+        with self.__lock:
+            accounts = self.__account_counts()
+
+            return {
+                proxy_id: dict(stats.to_dict(), accounts=accounts.get(proxy_id, 0))
+                for proxy_id, stats in self.__stats.items()
+            }
+
+    def __enter__(self) -> 'ProxyPool':
+        return self.start_probing()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __acquire(self, account_id: Optional[str]) -> Optional[Proxy]:
+        with self.__lock:
+            if account_id is not None:
+                proxy_id = self.__assignments.get(account_id)
+
+                if proxy_id in self.__proxies and not self.__stats[proxy_id].is_quarantined:
+                    return self.__proxies[proxy_id]
+
+            proxy_id = self.__best_proxy_id()
+
+            if proxy_id is None:
+                return None
+
+            if account_id is not None:
+                self.__assignments[account_id] = proxy_id
+
+            return self.__proxies[proxy_id]
+
+    def __best_proxy_id(self) -> Optional[str]:
+        accounts = self.__account_counts()
+        candidates = [
+            (stats.score() * (1 + self.load_penalty * accounts.get(proxy_id, 0)), proxy_id)
+            for proxy_id, stats in self.__stats.items()
+            if not stats.is_quarantined
+        ]
+
+        return min(candidates)[1] if candidates else None
+
+    def __account_counts(self) -> Dict[str, int]:
+        counts = {}
+
+        for proxy_id in self.__assignments.values():
+            counts[proxy_id] = counts.get(proxy_id, 0) + 1
+
+        return counts
+
+    def __probe_loop(self) -> None:
+        while not self.__stop_event.is_set():
+            try:
+                self.probe_all()
+            except Exception as e:
+                print('ProxyPool: probe failed:', e)
+
+            self.__stop_event.wait(self.probe_interval_seconds)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: _Measurement ---------------------------------------------------------- #
+
+class _Measurement:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, pool: ProxyPool, proxy: Optional[Proxy]):
+        self.pool = pool
+        self.proxy = proxy
+        self.bytes_transferred = 0 # can be set inside the block, to measure throughput too
+
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    def __enter__(self) -> '_Measurement':
+        self.start_time = time.time()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self.proxy:
+            return
+
+        duration_seconds = time.time() - self.start_time
+
+        if exc_type is None:
+            self.pool.report_success(self.proxy, bytes_transferred=self.bytes_transferred, duration_seconds=duration_seconds, request_seconds=duration_seconds)
+        elif issubclass(exc_type, Exception):
+            self.pool.report_failure(self.proxy, repr(exc_value))
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
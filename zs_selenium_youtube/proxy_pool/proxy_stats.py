@@ -0,0 +1,142 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict
+import time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+EWMA_ALPHA                  = 0.3
+
+# the size of the transfer a score estimates the time of
+REFERENCE_BYTES             = 512 * 1024
+
+# assumed for proxies without latency samples yet, low enough that new ones get tried
+UNKNOWN_LATENCY_SECONDS     = 1.0
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: ProxyStats ----------------------------------------------------------- #
+
+# Health of one proxy, from real traffic and from probes
+# the latency only comes from the probes, real requests take as long as what they load, so they only count for the errors
+class ProxyStats:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, proxy_id: str):
+        self.proxy_id = proxy_id
+
+        self.latency_seconds = None # ewma, probe round trips only
+        self.bytes_per_second = None # ewma
+        self.request_seconds = None # ewma of the durations of real requests, not scored
+        self.error_rate = 0.0 # ewma of 0 (success) / 1 (failure)
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.last_used_at = None
+        self.last_probed_at = None
+
+        self.quarantined_at = None
+        self.quarantined_until = None
+        self.quarantine_count = 0
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def samples(self) -> int:
+        return self.successes + self.failures
+
+    @property
+    def is_quarantined(self) -> bool:
+        return self.quarantined_at is not None
+
+    # quarantined, but it can be probed to get back in service
+    @property
+    def quarantine_expired(self) -> bool:
+        return self.is_quarantined and time.time() >= self.quarantined_until
+
+    def add_success(
+        self,
+        latency_seconds: Optional[float] = None,
+        bytes_transferred: int = 0,
+        duration_seconds: Optional[float] = None,
+        request_seconds: Optional[float] = None
+    ) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.error_rate = self.__ewma(self.error_rate, 0.0)
+        self.last_used_at = time.time()
+
+        if latency_seconds is not None:
+            self.latency_seconds = self.__ewma(self.latency_seconds, latency_seconds)
+
+        if bytes_transferred and duration_seconds:
+            self.bytes_per_second = self.__ewma(self.bytes_per_second, bytes_transferred / duration_seconds)
+
+        if request_seconds is not None:
+            self.request_seconds = self.__ewma(self.request_seconds, request_seconds)
+
+    def add_failure(self, error: Optional[str] = None) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.error_rate = self.__ewma(self.error_rate, 1.0)
+        self.last_error = error
+        self.last_used_at = time.time()
+
+    # every quarantine in a row lasts twice as long as the one before, up to max_seconds
+    def quarantine(self, seconds: float, max_seconds: float) -> None:
+        self.quarantined_at = time.time()
+        self.quarantined_until = self.quarantined_at + min(seconds * 2**self.quarantine_count, max_seconds)
+        self.quarantine_count += 1
+
+    def readmit(self) -> None:
+        self.quarantined_at = None
+        self.quarantined_until = None
+        self.consecutive_failures = 0
+        self.error_rate = 0.0
+
+    # expected seconds of a REFERENCE_BYTES transfer, counting retries of failed attempts, lower is better
+    def score(self) -> float:
+        seconds = self.latency_seconds if self.latency_seconds is not None else UNKNOWN_LATENCY_SECONDS
+
+        if self.bytes_per_second:
+            seconds += REFERENCE_BYTES / self.bytes_per_second
+
+        return seconds / max(1 - self.error_rate, 0.05)
+
+    def to_dict(self) -> Dict:
+        return {
+            'latency_seconds': self.latency_seconds,
+            'bytes_per_second': self.bytes_per_second,
+            'request_seconds': self.request_seconds,
+            'error_rate': self.error_rate,
+            'successes': self.successes,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'last_error': self.last_error,
+            'last_used_at': self.last_used_at,
+            'last_probed_at': self.last_probed_at,
+            'quarantined': self.is_quarantined,
+            'quarantined_until': self.quarantined_until,
+            'quarantine_count': self.quarantine_count,
+            'score': self.score()
+        }
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    @staticmethod
+    def __ewma(current: Optional[float], value: float) -> float:
+        return value if current is None else current + EWMA_ALPHA * (value - current)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,4 @@
+from .reaper import Reaper
+from .reap_report import ReapReport
+from .session_record import SessionRecord
+from .session_registry import SessionRegistry
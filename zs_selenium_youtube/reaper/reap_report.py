@@ -0,0 +1,62 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Dict
+import time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: ReapReport ----------------------------------------------------------- #
+
+class ReapReport:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self):
+        self.time = time.time()
+        self.killed_pids = []
+        self.freed_rss_bytes = 0
+        self.removed_paths = []
+        self.freed_disk_bytes = 0
+        self.removed_session_ids = []
+        self.duration_seconds = 0
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.killed_pids and not self.removed_paths and not self.removed_session_ids
+
+    def add(self, other: 'ReapReport') -> None:
+        self.killed_pids.extend(other.killed_pids)
+        self.freed_rss_bytes += other.freed_rss_bytes
+        self.removed_paths.extend(other.removed_paths)
+        self.freed_disk_bytes += other.freed_disk_bytes
+        self.removed_session_ids.extend(other.removed_session_ids)
+        self.duration_seconds += other.duration_seconds
+
+    def to_dict(self) -> Dict:
+        return {
+            'time': self.time,
+            'killed_pids': self.killed_pids,
+            'freed_rss_bytes': self.freed_rss_bytes,
+            'removed_paths': self.removed_paths,
+            'freed_disk_bytes': self.freed_disk_bytes,
+            'removed_session_ids': self.removed_session_ids,
+            'duration_seconds': self.duration_seconds
+        }
+
+    def __repr__(self) -> str:
+        return 'ReapReport(killed={}, freed_rss={:.1f}MB, removed_paths={}, freed_disk={:.1f}MB, sessions={})'.format(
+            len(self.killed_pids),
+            self.freed_rss_bytes / 1024 / 1024,
+            len(self.removed_paths),
+            self.freed_disk_bytes / 1024 / 1024,
+            len(self.removed_session_ids)
+        )
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
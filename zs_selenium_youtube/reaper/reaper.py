@@ -0,0 +1,228 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Callable, Set
+import os, shutil, tempfile, threading, time
+
+# Local
+from .session_registry import SessionRegistry
+from .session_record import SessionRecord
+from .reap_report import ReapReport
+from ..utils.process import is_same_process, may_be_same_process, process_tree_pids, process_tree_rss, kill_process_tree, process_name, parent_pid, pid_exists, all_pids
+from ..utils.file_clone import tree_size
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# geckodriver's copies of the profile, and the folders of selenium's FirefoxProfile
+TEMP_PROFILE_PREFIXES   = ('rust_mozprofile', 'tmp')
+PROFILE_MARKER_NAMES    = ('prefs.js', 'user.js', 'times.json', 'webdriver-py-profilecopy')
+
+BROWSER_PROCESS_NAMES   = ('geckodriver', 'firefox', 'firefox-bin', 'firefox-esr')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: Reaper ------------------------------------------------------------- #
+
+# Kills the browsers and removes the profiles of the sessions whose owner process is gone
+#
+# The sessions are known from the SessionRegistry, which every Youtube with a session_registry writes to,
+# the temp folder sweep and the orphan kill also catch what was left before the registry existed, or by a crash before registering.
+# The same process start time check is done for the owners and for the browsers, so a reused pid is never mistaken for them.
+class Reaper:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        registry: SessionRegistry,
+        interval_seconds: float = 60*10,
+        sweep_temp_profiles: bool = True,
+        temp_folder_path: Optional[str] = None,
+        min_temp_profile_age_seconds: float = 60*60, # younger ones might belong to a session that is just starting
+        kill_unregistered_orphans: bool = False, # geckodriver/firefox processes reparented to init, that no live session owns
+        on_report: Optional[Callable[[ReapReport], None]] = None
+    ):
+        self.registry = registry
+        self.interval_seconds = interval_seconds
+        self.sweep_temp_profiles = sweep_temp_profiles
+        self.temp_folder_path = temp_folder_path or tempfile.gettempdir()
+        self.min_temp_profile_age_seconds = min_temp_profile_age_seconds
+        self.kill_unregistered_orphans = kill_unregistered_orphans
+        self.on_report = on_report
+
+        self.total = ReapReport()
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def reap(self) -> ReapReport:
+        with self.__lock:
+            report = ReapReport()
+            start_time = time.time()
+            live_records = []
+
+            for record in self.registry.records():
+                # an owner, that can not be told apart from a reused pid, is never reaped
+                if record.owner_started_at is None or may_be_same_process(record.owner_pid, record.owner_started_at):
+                    live_records.append(record)
+                else:
+                    self.__reap_record(record, report)
+
+            if self.kill_unregistered_orphans:
+                self.__kill_orphans(self.__protected_pids(live_records), report)
+
+            if self.sweep_temp_profiles:
+                self.__sweep_temp_profiles(self.__protected_paths(live_records), report)
+
+            report.duration_seconds = time.time() - start_time
+            self.total.add(report)
+
+        if self.on_report and not report.is_empty:
+            try:
+                self.on_report(report)
+            except Exception as e:
+                print('Reaper: on_report failed:', e)
+
+        return report
+
+    # reaps right away (what the last run of the host left behind), then every interval_seconds
+    def start(self) -> 'Reaper':
+        if self.__thread:
+            return self
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__loop, name='Reaper', daemon=True)
+        self.__thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.__stop_event.set()
+
+        if self.__thread:
+            self.__thread.join()
+            self.__thread = None
+
+    def __enter__(self) -> 'Reaper':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __loop(self) -> None:
+        while not self.__stop_event.is_set():
+            try:
+                self.reap()
+            except Exception as e:
+                print('Reaper: reap failed:', e)
+
+            self.__stop_event.wait(self.interval_seconds)
+
+    def __reap_record(self, record: SessionRecord, report: ReapReport) -> None:
+        for pid, started_at in record.browser_pids.items():
+            if is_same_process(pid, started_at):
+                self.__kill(pid, report)
+
+        for path in record.profile_paths:
+            self.__remove(path, report)
+
+        self.registry.unregister(record.session_id)
+        report.removed_session_ids.append(record.session_id)
+
+    def __kill_orphans(self, protected_pids: Set[int], report: ReapReport) -> None:
+        for pid in all_pids():
+            if pid in protected_pids or pid == os.getpid() or process_name(pid) not in BROWSER_PROCESS_NAMES:
+                continue
+
+            if parent_pid(pid) == 1:
+                self.__kill(pid, report)
+
+    def __sweep_temp_profiles(self, protected_paths: Set[str], report: ReapReport) -> None:
+        try:
+            file_names = os.listdir(self.temp_folder_path)
+        except OSError:
+            return
+
+        now = time.time()
+
+        for file_name in file_names:
+            if not file_name.startswith(TEMP_PROFILE_PREFIXES):
+                continue
+
+            path = os.path.realpath(os.path.join(self.temp_folder_path, file_name))
+
+            try:
+                if not os.path.isdir(path) or now - os.path.getmtime(path) < self.min_temp_profile_age_seconds:
+                    continue
+            except OSError:
+                continue
+
+            if path in protected_paths or not self.__is_profile(path) or self.__is_locked_by_live_browser(path):
+                continue
+
+            self.__remove(path, report)
+
+    def __kill(self, pid: int, report: ReapReport) -> None:
+        report.freed_rss_bytes += process_tree_rss(pid)
+        report.killed_pids.extend(kill_process_tree(pid))
+
+    def __remove(self, path: str, report: ReapReport) -> None:
+        if not os.path.exists(path):
+            return
+
+        size = tree_size(path)
+        shutil.rmtree(path, ignore_errors=True)
+
+        if not os.path.exists(path):
+            report.removed_paths.append(path)
+            report.freed_disk_bytes += size
+
+    @staticmethod
+    def __protected_pids(live_records: List[SessionRecord]) -> Set[int]:
+        pids = set()
+
+        for record in live_records:
+            for pid, started_at in record.browser_pids.items():
+                if may_be_same_process(pid, started_at):
+                    pids.update(process_tree_pids(pid))
+
+        return pids
+
+    @staticmethod
+    def __protected_paths(live_records: List[SessionRecord]) -> Set[str]:
+        return {os.path.realpath(path) for record in live_records for path in record.profile_paths}
+
+    @staticmethod
+    def __is_profile(path: str) -> bool:
+        try:
+            return any(name in PROFILE_MARKER_NAMES for name in os.listdir(path))
+        except OSError:
+            return False
+
+    # firefox keeps a 'lock' symlink to 'ip:+pid' in the profile it runs in (linux and mac)
+    @staticmethod
+    def __is_locked_by_live_browser(path: str) -> bool:
+        try:
+            target = os.readlink(os.path.join(path, 'lock'))
+        except OSError:
+            return False
+
+        try:
+            return pid_exists(int(target.rsplit('+', 1)[1]))
+        except (IndexError, ValueError):
+            return True
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,62 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict
+import time, socket
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: SessionRecord --------------------------------------------------------- #
+
+# what one browser session owns, stored in the SessionRegistry
+class SessionRecord:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        session_id: str,
+        owner_pid: int,
+        owner_started_at: Optional[float],
+        browser_pids: Optional[Dict[int, Optional[float]]] = None, # pid -> started_at
+        profile_paths: Optional[List[str]] = None,
+        cookies_id: Optional[str] = None,
+        host_name: Optional[str] = None,
+        created_at: Optional[float] = None
+    ):
+        self.session_id = session_id
+        self.owner_pid = owner_pid
+        self.owner_started_at = owner_started_at
+        self.browser_pids = browser_pids or {}
+        self.profile_paths = profile_paths or []
+        self.cookies_id = cookies_id
+        self.host_name = host_name or socket.gethostname()
+        self.created_at = created_at or time.time()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def to_dict(self) -> Dict:
+        return {
+            'session_id': self.session_id,
+            'owner_pid': self.owner_pid,
+            'owner_started_at': self.owner_started_at,
+            # json keys are strings
+            'browser_pids': {str(pid): started_at for pid, started_at in self.browser_pids.items()},
+            'profile_paths': self.profile_paths,
+            'cookies_id': self.cookies_id,
+            'host_name': self.host_name,
+            'created_at': self.created_at
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'SessionRecord':
+        return cls(**dict(d, browser_pids={int(pid): started_at for pid, started_at in (d.get('browser_pids') or {}).items()}))
+
+    def __repr__(self) -> str:
+        return 'SessionRecord({}, owner={}, browser_pids={}, profiles={})'.format(self.session_id, self.owner_pid, list(self.browser_pids.keys()), len(self.profile_paths))
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
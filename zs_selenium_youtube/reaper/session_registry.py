@@ -0,0 +1,88 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional
+import os, json, tempfile, socket
+
+# Local
+from .session_record import SessionRecord
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+DEFAULT_FOLDER_PATH = os.path.join(tempfile.gettempdir(), 'zs_selenium_youtube_sessions')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SessionRegistry -------------------------------------------------------- #
+
+# One json file per session, written with an atomic replace, so it survives the crash of the process that owns the session
+class SessionRegistry:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, folder_path: str = DEFAULT_FOLDER_PATH):
+        self.folder_path = folder_path
+
+        os.makedirs(folder_path, exist_ok=True)
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def register(self, record: SessionRecord) -> None:
+        path = self.__path(record.session_id)
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+
+        with open(tmp_path, 'w') as f:
+            json.dump(record.to_dict(), f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(tmp_path, path)
+
+    def unregister(self, session_id: str) -> None:
+        try:
+            os.remove(self.__path(session_id))
+        except FileNotFoundError:
+            pass
+
+    def get(self, session_id: str) -> Optional[SessionRecord]:
+        return self.__read(self.__path(session_id))
+
+    # only the ones of this host, a registry folder can be shared, but pids only mean something on their own host
+    def records(self) -> List[SessionRecord]:
+        records = []
+        host_name = socket.gethostname()
+
+        for file_name in os.listdir(self.folder_path):
+            if not file_name.endswith('.json'):
+                continue
+
+            record = self.__read(os.path.join(self.folder_path, file_name))
+
+            if record and record.host_name == host_name:
+                records.append(record)
+
+        return records
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __path(self, session_id: str) -> str:
+        return os.path.join(self.folder_path, session_id + '.json')
+
+    @staticmethod
+    def __read(path: str) -> Optional[SessionRecord]:
+        try:
+            with open(path, 'r') as f:
+                return SessionRecord.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,53 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Callable
+
+# Local
+from .enums.recycle_reason import RecycleReason
+from .session_metrics import SessionMetrics, RecycleEvent
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: RecyclePolicy --------------------------------------------------------- #
+
+class RecyclePolicy:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        max_rss_mb: Optional[float] = None,
+        max_jobs: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+        on_recycle: Optional[Callable[[RecycleEvent], None]] = None
+    ):
+        self.max_rss_mb = max_rss_mb
+        self.max_jobs = max_jobs
+        self.max_age_seconds = max_age_seconds
+        self.on_recycle = on_recycle
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # returns the first threshold crossed or None
+    def recycle_reason(self, metrics: SessionMetrics) -> Optional[RecycleReason]:
+        if self.max_jobs is not None and metrics.job_count >= self.max_jobs:
+            return RecycleReason.JOB_COUNT
+
+        if self.max_age_seconds is not None and metrics.age_seconds >= self.max_age_seconds:
+            return RecycleReason.AGE
+
+        if self.max_rss_mb is not None and metrics.rss_bytes >= self.max_rss_mb * 1024 * 1024:
+            return RecycleReason.RSS
+
+        return None
+
+    @property
+    def measures_rss(self) -> bool:
+        return self.max_rss_mb is not None
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,5 @@
+from .job import Job
+from .job_scheduler import JobScheduler
+from .rate_limit import RateLimit
+from .scheduler_metrics import SchedulerMetrics
+from .token_bucket import TokenBucket
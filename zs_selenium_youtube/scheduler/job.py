@@ -0,0 +1,51 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Callable, Any
+from concurrent.futures import Future
+import time
+
+# Local
+from ..enums.action_type import ActionType
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------------- class: Job -------------------------------------------------------------- #
+
+class Job:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        account_id: str,
+        func: Callable[['Youtube'], Any],
+        action: ActionType = ActionType.OTHER,
+        priority: int = 0, # higher runs first
+        proxy_id: Optional[str] = None
+    ):
+        self.account_id = account_id
+        self.func = func
+        self.action = action
+        self.priority = priority
+        self.proxy_id = proxy_id
+
+        self.future = Future()
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        return self.started_at - self.submitted_at if self.started_at else None
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        return self.future.result(timeout=timeout)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,285 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Dict, Optional, Callable, Any, Tuple
+import threading, heapq, itertools, time
+
+# Local
+from ..enums.action_type import ActionType
+from .job import Job
+from .rate_limit import RateLimit
+from .token_bucket import TokenBucket
+from .scheduler_metrics import SchedulerMetrics
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# upper bound for a single idle wait, so stop() and new sessions are noticed in time
+MAX_IDLE_WAIT_SECONDS = 1
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: JobScheduler ---------------------------------------------------------- #
+
+# Runs jobs on Youtube sessions from a pool of worker threads.
+# A session only runs one job at a time, while workers pick whichever queued job is runnable right now,
+# so an account waiting for its tokens never blocks the others.
+class JobScheduler:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        session_provider: Callable[[str], 'Youtube'], # account_id -> session, called once per account, from a worker thread
+        max_workers: int = 4,
+        action_rate_limits: Optional[Dict[ActionType, RateLimit]] = None, # per account and action
+        account_rate_limit: Optional[RateLimit] = None, # per account, all actions
+        proxy_rate_limits: Optional[Dict[ActionType, RateLimit]] = None # per proxy and action
+    ):
+        self.session_provider = session_provider
+        self.max_workers = max_workers
+        self.action_rate_limits = action_rate_limits or {}
+        self.account_rate_limit = account_rate_limit
+        self.proxy_rate_limits = proxy_rate_limits or {}
+        self.metrics = SchedulerMetrics()
+
+        self.__sessions = {}
+        self.__queues = {} # (account_id, action) -> heap of (-priority, seq, job)
+        self.__buckets = {}
+        self.__busy_accounts = set()
+        self.__seq = itertools.count()
+        self.__condition = threading.Condition()
+        self.__workers = []
+        self.__stopped = True
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def start(self) -> 'JobScheduler':
+        with self.__condition:
+            if not self.__stopped:
+                return self
+
+            self.__stopped = False
+            self.__workers = [
+                threading.Thread(target=self.__work, name='JobScheduler-{}'.format(i), daemon=True)
+                for i in range(self.max_workers)
+            ]
+
+        for worker in self.__workers:
+            worker.start()
+
+        return self
+
+    # queued, not yet started jobs are cancelled unless wait is True
+    # the sessions got from session_provider are quit too, unless close_sessions is False
+    def stop(self, wait: bool = True, close_sessions: bool = True) -> None:
+        with self.__condition:
+            if not wait:
+                self.__cancel_queued()
+
+            self.__stopped = True
+            self.__condition.notify_all()
+
+        for worker in self.__workers:
+            worker.join()
+
+        self.__workers = []
+
+        if close_sessions:
+            self.close_sessions()
+
+    # a later job of the account gets a new one from session_provider
+    def close_sessions(self) -> None:
+        with self.__condition:
+            sessions = list(self.__sessions.items())
+            self.__sessions = {}
+
+        for account_id, session in sessions:
+            try:
+                session.quit()
+            except Exception as e:
+                print('JobScheduler: quitting the session of {} failed: {}'.format(account_id, e))
+
+    def submit(
+        self,
+        account_id: str,
+        func: Callable[['Youtube'], Any],
+        action: ActionType = ActionType.OTHER,
+        priority: int = 0,
+        proxy_id: Optional[str] = None
+    ) -> Job:
+        job = Job(account_id=account_id, func=func, action=action, priority=priority, proxy_id=proxy_id)
+
+        with self.__condition:
+            heapq.heappush(self.__queues.setdefault((account_id, action), []), (-priority, next(self.__seq), job))
+            self.metrics.submitted += 1
+            self.__update_queue_depth(job, 1)
+            self.__condition.notify()
+
+        return job
+
+    def session(self, account_id: str) -> Optional['Youtube']:
+        return self.__sessions.get(account_id)
+
+    def metrics_dict(self) -> Dict:
+        with self.__condition:
+            return self.metrics.to_dict()
+
+    def __enter__(self) -> 'JobScheduler':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop(wait=exc_type is None)
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __work(self) -> None:
+        while True:
+            with self.__condition:
+                job = None
+
+                while job is None:
+                    if self.__stopped and not self.__has_queued_jobs():
+                        return
+
+                    job, wait_seconds = self.__next_job()
+
+                    if job is None:
+                        self.__condition.wait(min(wait_seconds, MAX_IDLE_WAIT_SECONDS))
+
+                job.started_at = time.time()
+                self.__busy_accounts.add(job.account_id)
+                self.__update_queue_depth(job, -1)
+                self.metrics.add_wait_time(job.wait_seconds)
+                self.metrics.running += 1
+                self.metrics.started += 1
+
+            succeeded = self.__run(job)
+
+            with self.__condition:
+                self.__busy_accounts.discard(job.account_id)
+                self.metrics.running -= 1
+
+                if succeeded:
+                    self.metrics.succeeded += 1
+                else:
+                    self.metrics.failed += 1
+
+                # the account is free again, its other jobs might be runnable now
+                self.__condition.notify_all()
+
+    def __run(self, job: Job) -> bool:
+        if not job.future.set_running_or_notify_cancel():
+            return False
+
+        try:
+            session = self.__sessions.get(job.account_id)
+
+            if session is None:
+                session = self.session_provider(job.account_id)
+                self.__sessions[job.account_id] = session
+
+            result = job.func(session)
+            job.finished_at = time.time()
+            job.future.set_result(result)
+
+            return True
+        except Exception as e:
+            job.finished_at = time.time()
+            job.future.set_exception(e)
+
+            return False
+
+    # (job, 0) if a job can start now, (None, seconds until the earliest throttled job becomes runnable) otherwise
+    def __next_job(self) -> Tuple[Optional[Job], float]:
+        best_key = None
+        best_entry = None
+        min_wait_seconds = float('inf')
+
+        for key, queue in self.__queues.items():
+            if not queue or key[0] in self.__busy_accounts:
+                continue
+
+            entry = queue[0]
+
+            if best_entry is not None and entry[:2] > best_entry[:2]:
+                continue
+
+            wait_seconds = max([b.wait_time() for b in self.__job_buckets(entry[2])] or [0])
+
+            if wait_seconds > 0:
+                min_wait_seconds = min(min_wait_seconds, wait_seconds)
+
+                continue
+
+            best_key = key
+            best_entry = entry
+
+        if best_entry is None:
+            return None, min_wait_seconds
+
+        job = heapq.heappop(self.__queues[best_key])[2]
+
+        if not self.__queues[best_key]:
+            del self.__queues[best_key]
+
+        for bucket in self.__job_buckets(job):
+            bucket.consume()
+
+        return job, 0
+
+    def __job_buckets(self, job: Job) -> List[TokenBucket]:
+        buckets = []
+
+        if self.account_rate_limit:
+            buckets.append(self.__bucket(('account', job.account_id), self.account_rate_limit))
+
+        if job.action in self.action_rate_limits:
+            buckets.append(self.__bucket(('action', job.account_id, job.action), self.action_rate_limits[job.action]))
+
+        if job.proxy_id is not None and job.action in self.proxy_rate_limits:
+            buckets.append(self.__bucket(('proxy', job.proxy_id, job.action), self.proxy_rate_limits[job.action]))
+
+        return buckets
+
+    def __bucket(self, key: tuple, rate_limit: RateLimit) -> TokenBucket:
+        bucket = self.__buckets.get(key)
+
+        if bucket is None:
+            bucket = TokenBucket(rate_per_hour=rate_limit.rate_per_hour, burst=rate_limit.burst)
+            self.__buckets[key] = bucket
+
+        return bucket
+
+    def __has_queued_jobs(self) -> bool:
+        return any(self.__queues.values())
+
+    def __cancel_queued(self) -> None:
+        for queue in self.__queues.values():
+            for _, _, job in queue:
+                job.future.cancel()
+                self.__update_queue_depth(job, -1)
+
+        self.__queues = {}
+
+    def __update_queue_depth(self, job: Job, delta: int) -> None:
+        self.metrics.queue_depth += delta
+
+        for depths, key in [
+            (self.metrics.queue_depth_by_account, job.account_id),
+            (self.metrics.queue_depth_by_action, job.action.value)
+        ]:
+            depths[key] = depths.get(key, 0) + delta
+
+            if depths[key] <= 0:
+                del depths[key]
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
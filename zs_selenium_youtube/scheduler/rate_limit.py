@@ -0,0 +1,16 @@
+# ----------------------------------------------------------- class: RateLimit ----------------------------------------------------------- #
+
+class RateLimit:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        rate_per_hour: float,
+        burst: float = 1
+    ):
+        self.rate_per_hour = rate_per_hour
+        self.burst = burst
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
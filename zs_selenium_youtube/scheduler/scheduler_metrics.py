@@ -0,0 +1,77 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Dict
+from collections import deque
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+WAIT_TIME_WINDOW = 1000
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: SchedulerMetrics -------------------------------------------------------- #
+
+class SchedulerMetrics:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self):
+        self.submitted = 0
+        self.started = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.running = 0
+        self.queue_depth = 0
+        self.queue_depth_by_account = {}
+        self.queue_depth_by_action = {}
+        self.__wait_times = deque(maxlen=WAIT_TIME_WINDOW)
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def add_wait_time(self, seconds: float) -> None:
+        self.__wait_times.append(seconds)
+
+    def wait_time_stats(self) -> Dict[str, float]:
+        wait_times = sorted(self.__wait_times)
+
+        if not wait_times:
+            return {'count': 0, 'mean': 0, 'p50': 0, 'p95': 0, 'max': 0}
+
+        return {
+            'count': len(wait_times),
+            'mean': sum(wait_times) / len(wait_times),
+            'p50': self.__percentile(wait_times, 0.5),
+            'p95': self.__percentile(wait_times, 0.95),
+            'max': wait_times[-1]
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            'submitted': self.submitted,
+            'started': self.started,
+            'succeeded': self.succeeded,
+            'failed': self.failed,
+            'running': self.running,
+            'queue_depth': self.queue_depth,
+            'queue_depth_by_account': dict(self.queue_depth_by_account),
+            'queue_depth_by_action': dict(self.queue_depth_by_action),
+            'wait_time': self.wait_time_stats()
+        }
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    @staticmethod
+    def __percentile(sorted_values: List[float], p: float) -> float:
+        return sorted_values[min(len(sorted_values) - 1, int(p * len(sorted_values)))]
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
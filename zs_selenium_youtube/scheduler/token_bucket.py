@@ -0,0 +1,59 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+import time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: TokenBucket ---------------------------------------------------------- #
+
+# not thread-safe on its own, the scheduler only touches it while holding its lock
+class TokenBucket:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        rate_per_hour: float,
+        burst: float = 1
+    ):
+        self.rate_per_second = rate_per_hour / 3600
+        self.capacity = max(burst, 1)
+        self.tokens = self.capacity
+        self.__last_refill = time.monotonic()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # seconds until the tokens are available, 0 if they are available now
+    def wait_time(self, tokens: float = 1) -> float:
+        self.__refill()
+
+        if self.tokens >= tokens:
+            return 0
+
+        if self.rate_per_second <= 0:
+            return float('inf')
+
+        return (tokens - self.tokens) / self.rate_per_second
+
+    def consume(self, tokens: float = 1) -> bool:
+        if self.wait_time(tokens) > 0:
+            return False
+
+        self.tokens -= tokens
+
+        return True
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.__last_refill) * self.rate_per_second)
+        self.__last_refill = now
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
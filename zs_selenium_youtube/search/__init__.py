@@ -0,0 +1,3 @@
+from .search_result import SearchResult
+from .video_search import VideoSearch
+from .search_page import parse_initial_data, parse_innertube_config, parse_results
@@ -0,0 +1,140 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Tuple, Any
+import json, re
+
+# Local
+from .search_result import SearchResult
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+INITIAL_DATA_MARKERS    = ['var ytInitialData = ', 'window["ytInitialData"] = ']
+INNERTUBE_CONTEXT_KEY   = '"INNERTUBE_CONTEXT":'
+API_KEY_RE              = re.compile(r'"INNERTUBE_API_KEY"\s*:\s*"([^"]+)"')
+CLIENT_VERSION_RE       = re.compile(r'"INNERTUBE_CLIENT_VERSION"\s*:\s*"([^"]+)"')
+
+# not part of the ranked results: ads, shorts and the 'people also watched' like shelves
+SKIPPED_RENDERERS = ['shelfRenderer', 'reelShelfRenderer', 'horizontalCardListRenderer', 'adSlotRenderer', 'promotedSparklesWebRenderer']
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# the ytInitialData object embedded in a search page
+def parse_initial_data(page_source: str) -> Optional[Dict]:
+    for marker in INITIAL_DATA_MARKERS:
+        data = _json_after(page_source, marker)
+
+        if data is not None:
+            return data
+
+    return None
+
+# what the continuation requests need: the api key and the client context of the page ({} if not found)
+def parse_innertube_config(page_source: str) -> Dict[str, Any]:
+    api_key = API_KEY_RE.search(page_source or '')
+
+    if not api_key:
+        return {}
+
+    context = _json_after(page_source, INNERTUBE_CONTEXT_KEY)
+
+    if not context:
+        client_version = CLIENT_VERSION_RE.search(page_source)
+        context = {'client': {'clientName': 'WEB', 'clientVersion': client_version.group(1) if client_version else '2.20240101.00.00'}}
+
+    return {'api_key': api_key.group(1), 'context': context}
+
+# the videos of a search page's initial data or of a continuation response, in page order, and the token of the next page
+def parse_results(data: Optional[Dict], query: Optional[str] = None) -> Tuple[List[SearchResult], Optional[str]]:
+    results = []
+    continuation = [None]
+
+    def walk(node: Any) -> None:
+        if isinstance(node, list):
+            for item in node:
+                walk(item)
+        elif isinstance(node, dict):
+            for key, value in node.items():
+                if key == 'videoRenderer':
+                    result = _result(value, query)
+
+                    if result:
+                        results.append(result)
+                elif key == 'continuationItemRenderer':
+                    continuation[0] = _dig(value, 'continuationEndpoint', 'continuationCommand', 'token') or continuation[0]
+                elif key not in SKIPPED_RENDERERS:
+                    walk(value)
+
+    walk(data)
+
+    return results, continuation[0]
+
+# '1:02:03' -> 3723
+def parse_duration(duration_text: Optional[str]) -> Optional[int]:
+    if not duration_text:
+        return None
+
+    seconds = 0
+
+    try:
+        for component in duration_text.strip().split(':'):
+            seconds = seconds*60 + int(component)
+    except ValueError:
+        return None
+
+    return seconds
+
+
+# ----------------------------------------------------------- Private methods ------------------------------------------------------------ #
+
+def _result(renderer: Dict, query: Optional[str]) -> Optional[SearchResult]:
+    video_id = renderer.get('videoId')
+
+    if not video_id:
+        return None
+
+    title = _dig(renderer, 'title', 'runs', 0, 'text') or _dig(renderer, 'title', 'simpleText')
+    channel_id = _dig(renderer, 'ownerText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId') \
+              or _dig(renderer, 'longBylineText', 'runs', 0, 'navigationEndpoint', 'browseEndpoint', 'browseId')
+
+    return SearchResult(
+        video_id=video_id,
+        channel_id=channel_id,
+        title=title,
+        duration_seconds=parse_duration(_dig(renderer, 'lengthText', 'simpleText')),
+        query=query
+    )
+
+def _dig(node: Any, *path) -> Any:
+    for component in path:
+        try:
+            node = node[component]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    return node
+
+# the page embeds the objects in scripts followed by other code, so they are decoded up to their own end
+def _json_after(page_source: Optional[str], marker: str) -> Optional[Any]:
+    if not page_source:
+        return None
+
+    index = page_source.find(marker)
+
+    if index < 0:
+        return None
+
+    try:
+        return json.JSONDecoder().raw_decode(page_source, index + len(marker))[0]
+    except ValueError:
+        return None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
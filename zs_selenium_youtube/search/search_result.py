@@ -0,0 +1,52 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict
+import time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: SearchResult ---------------------------------------------------------- #
+
+class SearchResult:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        video_id: str,
+        channel_id: Optional[str],
+        title: Optional[str],
+        duration_seconds: Optional[int], # None for live streams
+        query: Optional[str] = None,
+        position: Optional[int] = None
+    ):
+        self.time = time.time()
+        self.video_id = video_id
+        self.channel_id = channel_id
+        self.title = title
+        self.duration_seconds = duration_seconds
+        self.query = query
+        self.position = position
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def to_dict(self) -> Dict:
+        return {
+            'time': self.time,
+            'video_id': self.video_id,
+            'channel_id': self.channel_id,
+            'title': self.title,
+            'duration_seconds': self.duration_seconds,
+            'query': self.query,
+            'position': self.position
+        }
+
+    def __repr__(self) -> str:
+        return 'SearchResult({}, {}, {})'.format(self.video_id, self.channel_id, self.title)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,286 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Iterator, Callable, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
+import threading, time, json
+
+# Pip
+from ksimpleapi import Api
+from selenium_uploader_account import Proxy
+
+# Local
+from .search_result import SearchResult
+from .search_page import parse_initial_data, parse_innertube_config, parse_results
+from ..proxy_pool import ProxyPool
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+DEFAULT_SEARCH_URL  = 'https://www.youtube.com/results?search_query={}'
+SEARCH_API_URL      = 'https://www.youtube.com/youtubei/v1/search?key={}&prettyPrint=false'
+
+# the 'Type: Video' filter of the results page, channels and playlists are left out by youtube already
+VIDEOS_ONLY_PARAM   = '&sp=EgIQAQ%253D%253D'
+
+# without it requests from the eu get the consent page instead of the results
+CONSENT_COOKIES     = {'CONSENT': 'YES+1'}
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: VideoSearch ---------------------------------------------------------- #
+
+# Video search over plain http, without a browser
+#
+# - search() streams: the first page comes from the initial data embedded in the results page, the next ones from continuation requests,
+#   and paging stops as soon as 'limit' results were yielded
+# - the results of a query are cached for 'cache_ttl_seconds', a later search with a higher limit continues from the cached continuation
+# - at most 'max_parallel' requests are in flight at a time, for all searches of the instance together
+class VideoSearch:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        search_url: str = DEFAULT_SEARCH_URL,
+        user_agent: Optional[str] = None,
+        proxy: Optional[Union[Proxy, str]] = None,
+        proxy_pool: Optional[ProxyPool] = None, # each request gets the best proxy of the pool, and reports its outcome to it
+        videos_only: bool = True,
+        cache_ttl_seconds: float = 60*30,
+        max_cached_queries: int = 1000,
+        max_parallel: int = 4,
+        request_timeout_seconds: float = 15
+    ):
+        self.search_url = search_url
+        self.user_agent = user_agent
+        self.proxy = Proxy.from_str(proxy) if isinstance(proxy, str) else proxy
+        self.proxy_pool = proxy_pool
+        self.videos_only = videos_only
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.max_cached_queries = max_cached_queries
+        self.max_parallel = max_parallel
+        self.request_timeout_seconds = request_timeout_seconds
+        self.request_count = 0
+        self.__lock = threading.Lock()
+        self.__request_slots = threading.BoundedSemaphore(max_parallel)
+        # normalized query -> _CachedSearch
+        self.__cache = {}
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def search(self, query: str, limit: Optional[int] = 20) -> Iterator[SearchResult]:
+        entry = self.__entry(query)
+        position = 0
+
+        while limit is None or position < limit:
+            if position < len(entry.results):
+                yield entry.results[position]
+                position += 1
+
+                continue
+
+            if entry.exhausted or not self.__fetch_next_page(entry):
+                return
+
+    # query -> results, the searches run in parallel (bounded by 'max_parallel')
+    def search_many(
+        self,
+        queries: List[str],
+        limit: Optional[int] = 20,
+        on_results: Optional[Callable[[str, List[SearchResult]], None]] = None
+    ) -> Dict[str, List[SearchResult]]:
+        def search(query: str) -> List[SearchResult]:
+            results = list(self.search(query, limit=limit))
+
+            if on_results:
+                try:
+                    on_results(query, results)
+                except Exception as e:
+                    print('VideoSearch - on_results', e)
+
+            return results
+
+        queries = list(dict.fromkeys(queries))
+
+        if not queries:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(queries))) as executor:
+            futures = {query: executor.submit(search, query) for query in queries}
+
+        return {query: future.result() for query, future in futures.items()}
+
+    def clear_cache(self) -> None:
+        with self.__lock:
+            self.__cache = {}
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __entry(self, query: str) -> '_CachedSearch':
+        key = ' '.join(query.lower().split())
+        now = time.time()
+
+        with self.__lock:
+            entry = self.__cache.get(key)
+
+            if entry and now - entry.created_at < self.cache_ttl_seconds:
+                return entry
+
+            self.__cache = {k: e for k, e in self.__cache.items() if now - e.created_at < self.cache_ttl_seconds}
+
+            while len(self.__cache) >= self.max_cached_queries:
+                del self.__cache[min(self.__cache, key=lambda k: self.__cache[k].created_at)]
+
+            entry = _CachedSearch(query)
+            self.__cache[key] = entry
+
+            return entry
+
+    # False if the page could not be fetched, the entry stays resumable then
+    def __fetch_next_page(self, entry: '_CachedSearch') -> bool:
+        result_count = len(entry.results)
+
+        # one page request per query at a time, the others wait for it and read its results
+        with entry.lock:
+            if len(entry.results) > result_count or entry.exhausted:
+                return True
+
+            if not entry.config:
+                page_source = self.__request(lambda scraper: scraper.page(self.__search_page_url(entry.query)))
+                data = parse_initial_data(page_source) if page_source else None
+
+                if data is None:
+                    return False
+
+                entry.config = parse_innertube_config(page_source)
+            else:
+                config = entry.config
+                data = self.__request(lambda scraper: scraper.continuation(
+                    SEARCH_API_URL.format(config['api_key']),
+                    {'context': config['context'], 'continuation': entry.continuation}
+                ))
+
+                if data is None:
+                    return False
+
+            results, continuation = parse_results(data, query=entry.query)
+            entry.add(results)
+            entry.continuation = continuation
+            # a page without new videos would just repeat
+            entry.exhausted = not continuation or not entry.config or len(entry.results) == result_count
+
+        return True
+
+    def __search_page_url(self, query: str) -> str:
+        return self.search_url.format(quote_plus(query)) + (VIDEOS_ONLY_PARAM if self.videos_only else '')
+
+    def __request(self, func: Callable[['_SearchScraper'], Any]) -> Any:
+        proxy = self.proxy_pool.acquire() if self.proxy_pool else self.proxy
+        scraper = _SearchScraper(
+            user_agent=self.user_agent,
+            proxy=proxy.string if proxy else None,
+            default_request_timeout=self.request_timeout_seconds
+        )
+
+        with self.__request_slots:
+            start_time = time.time()
+
+            try:
+                res = func(scraper)
+            except Exception as e:
+                print('VideoSearch - request failed', e)
+                res = None
+
+        with self.__lock:
+            self.request_count += 1
+
+        if self.proxy_pool and proxy:
+            if res is None:
+                self.proxy_pool.report_failure(proxy, 'search request failed')
+            else:
+                self.proxy_pool.report_success(proxy, request_seconds=time.time() - start_time)
+
+        return res
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: _CachedSearch --------------------------------------------------------- #
+
+class _CachedSearch:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, query: str):
+        self.query = query
+        self.created_at = time.time()
+        self.results = []
+        self.video_ids = set()
+        self.config = {}
+        self.continuation = None
+        self.exhausted = False
+        self.lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # the same video can show up on several pages
+    def add(self, results: List[SearchResult]) -> None:
+        for result in results:
+            if result.video_id in self.video_ids:
+                continue
+
+            result.position = len(self.results)
+            self.video_ids.add(result.video_id)
+            self.results.append(result)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: _SearchScraper --------------------------------------------------------- #
+
+class _SearchScraper(Api):
+
+    # ---------------------------------------------------------- Overrides ----------------------------------------------------------- #
+
+    @classmethod
+    def extra_headers(cls) -> Optional[Dict[str, any]]:
+        return {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Language': 'en-US,en;q=0.5'
+        }
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def page(self, url: str) -> Optional[str]:
+        res = self._get(url, extra_cookies=CONSENT_COOKIES)
+
+        return res.text if res is not None and res.status_code == 200 else None
+
+    def continuation(self, url: str, body: Dict) -> Optional[Dict]:
+        res = self._post(
+            url,
+            body=json.dumps(body),
+            extra_headers={'Content-Type': 'application/json'},
+            extra_cookies=CONSENT_COOKIES
+        )
+
+        return res.json() if res is not None and res.status_code == 200 else None
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,121 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict
+import time
+
+# Local
+from .enums.recycle_reason import RecycleReason
+from .utils.process import process_tree_rss
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+MAX_RECYCLE_EVENTS = 100
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: RecycleEvent ---------------------------------------------------------- #
+
+class RecycleEvent:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        reason: RecycleReason,
+        rss_bytes: int,
+        job_count: int,
+        age_seconds: float,
+        duration_seconds: float = 0,
+        succeeded: bool = True
+    ):
+        self.time = time.time()
+        self.reason = reason
+        self.rss_bytes = rss_bytes
+        self.job_count = job_count
+        self.age_seconds = age_seconds
+        self.duration_seconds = duration_seconds
+        self.succeeded = succeeded
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def to_dict(self) -> Dict:
+        return {
+            'time': self.time,
+            'reason': self.reason.value,
+            'rss_bytes': self.rss_bytes,
+            'job_count': self.job_count,
+            'age_seconds': self.age_seconds,
+            'duration_seconds': self.duration_seconds,
+            'succeeded': self.succeeded
+        }
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: SessionMetrics --------------------------------------------------------- #
+
+class SessionMetrics:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self):
+        self.created_at = time.time()
+        self.recycle_events = []
+        self.total_job_count = 0
+        self.restart()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # called every time a new browser is started for the session
+    def restart(self) -> None:
+        self.started_at = time.time()
+        self.job_count = 0
+        self.rss_bytes = 0
+        self.peak_rss_bytes = 0
+
+    def job_finished(self) -> None:
+        self.job_count += 1
+        self.total_job_count += 1
+
+    def update_rss(self, pid: Optional[int]) -> int:
+        self.rss_bytes = process_tree_rss(pid) if pid else 0
+        self.peak_rss_bytes = max(self.peak_rss_bytes, self.rss_bytes)
+
+        return self.rss_bytes
+
+    def add_recycle_event(self, event: RecycleEvent) -> None:
+        self.recycle_events.append(event)
+        self.recycle_events = self.recycle_events[-MAX_RECYCLE_EVENTS:]
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.started_at
+
+    @property
+    def recycle_count(self) -> int:
+        return len(self.recycle_events)
+
+    def to_dict(self) -> Dict:
+        return {
+            'rss_bytes': self.rss_bytes,
+            'peak_rss_bytes': self.peak_rss_bytes,
+            'job_count': self.job_count,
+            'total_job_count': self.total_job_count,
+            'age_seconds': self.age_seconds,
+            'recycle_count': self.recycle_count,
+            'recycle_events': [e.to_dict() for e in self.recycle_events]
+        }
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
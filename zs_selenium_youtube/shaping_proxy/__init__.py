@@ -0,0 +1,4 @@
+from .shaping_proxy import ShapingProxy
+from .session_bandwidth import SessionBandwidth
+from .bandwidth_shaper import BandwidthShaper
+from .throughput_meter import ThroughputMeter
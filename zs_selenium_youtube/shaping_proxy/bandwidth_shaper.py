@@ -0,0 +1,150 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Dict, Optional
+import threading, time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# a session without traffic for this long gives its share back to the others
+ACTIVE_WINDOW_SECONDS = 0.5
+
+# bucket size, in seconds of the session's rate
+BURST_SECONDS = 0.1
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: _SessionState --------------------------------------------------------- #
+
+class _SessionState:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, weight: float, max_bytes_per_second: Optional[float]):
+        self.weight = weight
+        self.max_bytes_per_second = max_bytes_per_second
+        self.rate = float('inf')
+        self.tokens = 0.0
+        self.last_refill = time.monotonic()
+        self.last_active = 0.0
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: BandwidthShaper -------------------------------------------------------- #
+
+# One direction of traffic. The global limit is shared by the active sessions in proportion to their weights (max-min fair),
+# a session never gets more than its own cap, and the share of a capped or idle session goes to the others.
+class BandwidthShaper:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, max_bytes_per_second: Optional[float] = None):
+        self.max_bytes_per_second = max_bytes_per_second
+        self.__sessions = {}
+        self.__active = set()
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def add_session(self, session_id: str, weight: float = 1, max_bytes_per_second: Optional[float] = None) -> None:
+        with self.__lock:
+            self.__sessions[session_id] = _SessionState(weight, max_bytes_per_second)
+            self.__recompute_rates()
+
+    def remove_session(self, session_id: str) -> None:
+        with self.__lock:
+            self.__sessions.pop(session_id, None)
+            self.__active.discard(session_id)
+            self.__recompute_rates()
+
+    def set_max_bytes_per_second(self, max_bytes_per_second: Optional[float]) -> None:
+        with self.__lock:
+            self.max_bytes_per_second = max_bytes_per_second
+            self.__recompute_rates()
+
+    # blocks until the session may send (or has received) size bytes
+    def acquire(self, session_id: str, size: int) -> None:
+        with self.__lock:
+            state = self.__sessions.get(session_id)
+
+            if state is None:
+                return
+
+            now = time.monotonic()
+            state.last_active = now
+            self.__update_active(now)
+
+            if state.rate == float('inf'):
+                return
+
+            state.tokens = min(state.rate * BURST_SECONDS, state.tokens + (now - state.last_refill) * state.rate)
+            state.last_refill = now
+            # the debt is paid by sleeping, so chunks larger than the bucket are fine
+            state.tokens -= size
+            wait_seconds = -state.tokens / state.rate if state.tokens < 0 and state.rate > 0 else 0
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+    def rates(self) -> Dict[str, float]:
+        with self.__lock:
+            return {session_id: state.rate for session_id, state in self.__sessions.items()}
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __update_active(self, now: float) -> None:
+        active = set(session_id for session_id, state in self.__sessions.items() if now - state.last_active <= ACTIVE_WINDOW_SECONDS)
+
+        if active != self.__active:
+            self.__active = active
+            self.__recompute_rates()
+
+    # water-filling over the active sessions, idle ones get the rate they would get if they became active alone
+    def __recompute_rates(self) -> None:
+        for session_id, state in self.__sessions.items():
+            active = self.__active | {session_id}
+            state.rate = self.__fair_rates(active)[session_id]
+
+    def __fair_rates(self, session_ids: set) -> Dict[str, float]:
+        caps = {session_id: self.__sessions[session_id].max_bytes_per_second for session_id in session_ids}
+
+        if self.max_bytes_per_second is None:
+            return {session_id: cap if cap is not None else float('inf') for session_id, cap in caps.items()}
+
+        rates = {}
+        remaining = float(self.max_bytes_per_second)
+        pending = set(session_ids)
+
+        while pending:
+            total_weight = sum(self.__sessions[session_id].weight for session_id in pending) or 1
+            capped = [
+                session_id for session_id in pending
+                if caps[session_id] is not None and caps[session_id] < remaining * self.__sessions[session_id].weight / total_weight
+            ]
+
+            if not capped:
+                for session_id in pending:
+                    rates[session_id] = remaining * self.__sessions[session_id].weight / total_weight
+
+                break
+
+            for session_id in capped:
+                rates[session_id] = caps[session_id]
+                remaining -= caps[session_id]
+                pending.discard(session_id)
+
+        return rates
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,27 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: SessionBandwidth -------------------------------------------------------- #
+
+class SessionBandwidth:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        weight: float = 1, # share of the global limit, relative to the other active sessions
+        max_upload_bytes_per_second: Optional[float] = None,
+        max_download_bytes_per_second: Optional[float] = None
+    ):
+        self.weight = weight
+        self.max_upload_bytes_per_second = max_upload_bytes_per_second
+        self.max_download_bytes_per_second = max_download_bytes_per_second
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
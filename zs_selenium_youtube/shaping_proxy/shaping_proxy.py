@@ -0,0 +1,323 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+import socket, socketserver, threading, base64
+
+# Pip
+from selenium_uploader_account import Proxy
+
+# Local
+from .bandwidth_shaper import BandwidthShaper
+from .throughput_meter import ThroughputMeter
+from .session_bandwidth import SessionBandwidth
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+LOCAL_HOST          = '127.0.0.1'
+CHUNK_SIZE          = 16 * 1024
+MAX_HEADER_SIZE     = 64 * 1024
+CONNECT_TIMEOUT     = 30
+
+HOP_BY_HOP_HEADERS  = ('connection', 'proxy-connection', 'keep-alive', 'proxy-authorization')
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ class: _Server ------------------------------------------------------------ #
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, proxy: 'ShapingProxy', session_id: str, upstream_proxy: Optional[Proxy]):
+        self.proxy = proxy
+        self.session_id = session_id
+        self.upstream_proxy = upstream_proxy
+
+        super().__init__((proxy.host, 0), _Handler)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: _Handler ------------------------------------------------------------ #
+
+class _Handler(socketserver.BaseRequestHandler):
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def handle(self) -> None:
+        head, rest = self.__read_head(self.request)
+
+        if not head:
+            return
+
+        request_line, headers = self.__parse_head(head)
+
+        try:
+            method, target, version = request_line.split(' ', 2)
+        except ValueError:
+            return
+
+        try:
+            if method.upper() == 'CONNECT':
+                upstream = self.__connect_tunnel(target)
+                self.request.sendall(b'HTTP/1.1 200 Connection established\r\n\r\n')
+            else:
+                upstream = self.__forward_request(method, target, version, headers)
+        except OSError:
+            self.request.sendall('HTTP/1.1 502 Bad Gateway\r\nContent-Length: 0\r\nConnection: close\r\n\r\n'.encode())
+
+            return
+
+        if rest:
+            self.__relay_chunk(rest, upstream, upload=True)
+
+        self.__relay(upstream)
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __connect_tunnel(self, target: str) -> socket.socket:
+        upstream_proxy = self.server.upstream_proxy
+
+        if not upstream_proxy:
+            return socket.create_connection(self.__host_port(target, 443), timeout=CONNECT_TIMEOUT)
+
+        upstream = socket.create_connection((upstream_proxy.host, upstream_proxy.port), timeout=CONNECT_TIMEOUT)
+        upstream.sendall('CONNECT {0} HTTP/1.1\r\nHost: {0}\r\n{1}\r\n'.format(target, self.__proxy_auth_header()).encode())
+        head, _ = self.__read_head(upstream)
+
+        if not head or head.split(b' ')[1:2] != [b'200']:
+            upstream.close()
+
+            raise OSError('Upstream proxy refused CONNECT {}: {}'.format(target, head[:100]))
+
+        return upstream
+
+    # plain http, one request per connection, so requests for different hosts never share an upstream connection
+    def __forward_request(self, method: str, target: str, version: str, headers: list) -> socket.socket:
+        upstream_proxy = self.server.upstream_proxy
+        url = urlsplit(target)
+        headers = [(k, v) for k, v in headers if k.lower() not in HOP_BY_HOP_HEADERS] + [('Connection', 'close')]
+
+        if upstream_proxy:
+            upstream = socket.create_connection((upstream_proxy.host, upstream_proxy.port), timeout=CONNECT_TIMEOUT)
+            request_target = target
+
+            if upstream_proxy.needs_auth:
+                headers.append(('Proxy-Authorization', self.__proxy_auth_value()))
+        else:
+            upstream = socket.create_connection(self.__host_port(url.netloc, 80), timeout=CONNECT_TIMEOUT)
+            request_target = (url.path or '/') + ('?' + url.query if url.query else '')
+
+        head = '{} {} {}\r\n'.format(method, request_target, version) + ''.join('{}: {}\r\n'.format(k, v) for k, v in headers) + '\r\n'
+        self.__relay_chunk(head.encode('latin-1'), upstream, upload=True)
+
+        return upstream
+
+    def __relay(self, upstream: socket.socket) -> None:
+        upstream.settimeout(None)
+        self.request.settimeout(None)
+
+        download = threading.Thread(target=self.__pipe, args=(upstream, self.request, False), daemon=True)
+        download.start()
+        self.__pipe(self.request, upstream, True)
+        download.join()
+        upstream.close()
+
+    def __pipe(self, src: socket.socket, dst: socket.socket, upload: bool) -> None:
+        try:
+            while True:
+                chunk = src.recv(CHUNK_SIZE)
+
+                if not chunk:
+                    break
+
+                self.__relay_chunk(chunk, dst, upload)
+        except OSError:
+            pass
+        finally:
+            # lets the other direction finish as well
+            try:
+                dst.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    def __relay_chunk(self, chunk: bytes, dst: socket.socket, upload: bool) -> None:
+        self.server.proxy._account(self.server.session_id, len(chunk), upload)
+        dst.sendall(chunk)
+
+    def __proxy_auth_value(self) -> str:
+        upstream_proxy = self.server.upstream_proxy
+
+        return 'Basic ' + base64.b64encode('{}:{}'.format(upstream_proxy.username, upstream_proxy.password).encode()).decode()
+
+    def __proxy_auth_header(self) -> str:
+        return 'Proxy-Authorization: {}\r\n'.format(self.__proxy_auth_value()) if self.server.upstream_proxy.needs_auth else ''
+
+    @staticmethod
+    def __host_port(netloc: str, default_port: int) -> Tuple[str, int]:
+        host, _, port = netloc.rpartition(':')
+
+        if not host or not port.isdigit():
+            return netloc.strip('[]'), default_port
+
+        return host.strip('[]'), int(port)
+
+    @staticmethod
+    def __read_head(sock: socket.socket) -> Tuple[bytes, bytes]:
+        data = b''
+
+        while b'\r\n\r\n' not in data:
+            if len(data) > MAX_HEADER_SIZE:
+                return b'', b''
+
+            chunk = sock.recv(CHUNK_SIZE)
+
+            if not chunk:
+                return b'', b''
+
+            data += chunk
+
+        head, _, rest = data.partition(b'\r\n\r\n')
+
+        return head, rest
+
+    @staticmethod
+    def __parse_head(head: bytes) -> Tuple[str, list]:
+        lines = head.decode('latin-1').split('\r\n')
+        headers = []
+
+        for line in lines[1:]:
+            key, _, value = line.partition(':')
+
+            if key:
+                headers.append((key.strip(), value.strip()))
+
+        return lines[0], headers
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------- class: ShapingProxy ---------------------------------------------------------- #
+
+# Local forward proxy (plain http and CONNECT tunnels), shared by the sessions of the host.
+# Every session gets its own local port, so its traffic can be told apart and shaped without proxy authentication.
+class ShapingProxy:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        max_upload_bytes_per_second: Optional[float] = None,
+        max_download_bytes_per_second: Optional[float] = None,
+        host: str = LOCAL_HOST
+    ):
+        self.host = host
+        self.upload_shaper = BandwidthShaper(max_upload_bytes_per_second)
+        self.download_shaper = BandwidthShaper(max_download_bytes_per_second)
+        self.upload_meter = ThroughputMeter()
+        self.download_meter = ThroughputMeter()
+
+        self.__servers = {}
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    # returns the local proxy the session's browser should use
+    def register_session(
+        self,
+        session_id: str,
+        upstream_proxy: Optional[Proxy] = None,
+        bandwidth: Optional[SessionBandwidth] = None
+    ) -> Proxy:
+        bandwidth = bandwidth or SessionBandwidth()
+
+        with self.__lock:
+            server = self.__servers.get(session_id)
+
+            if server is None:
+                server = _Server(self, session_id, upstream_proxy)
+                threading.Thread(target=server.serve_forever, name='ShapingProxy-{}'.format(session_id), daemon=True).start()
+                self.__servers[session_id] = server
+            else:
+                server.upstream_proxy = upstream_proxy
+
+        self.upload_shaper.add_session(session_id, bandwidth.weight, bandwidth.max_upload_bytes_per_second)
+        self.download_shaper.add_session(session_id, bandwidth.weight, bandwidth.max_download_bytes_per_second)
+
+        return Proxy(self.host, server.server_address[1])
+
+    def unregister_session(self, session_id: str) -> None:
+        with self.__lock:
+            server = self.__servers.pop(session_id, None)
+
+        if server:
+            server.shutdown()
+            server.server_close()
+
+        self.upload_shaper.remove_session(session_id)
+        self.download_shaper.remove_session(session_id)
+        self.upload_meter.remove_session(session_id)
+        self.download_meter.remove_session(session_id)
+
+    def stop(self) -> None:
+        for session_id in list(self.__servers.keys()):
+            self.unregister_session(session_id)
+
+    # live per-session throughput
+    def throughput(self) -> Dict[str, Dict[str, float]]:
+        upload_rates = self.upload_shaper.rates()
+        download_rates = self.download_shaper.rates()
+
+        return {
+            session_id: {
+                'upload_bytes_per_second': self.upload_meter.bytes_per_second(session_id),
+                'download_bytes_per_second': self.download_meter.bytes_per_second(session_id),
+                'uploaded_bytes': self.upload_meter.total_bytes(session_id),
+                'downloaded_bytes': self.download_meter.total_bytes(session_id),
+                'upload_rate_limit': upload_rates.get(session_id),
+                'download_rate_limit': download_rates.get(session_id)
+            }
+            for session_id in list(self.__servers.keys())
+        }
+
+    def __enter__(self) -> 'ShapingProxy':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+    # ------------------------------------------------------ Protected methods ------------------------------------------------------- #
+
+    # called by the handlers for every relayed chunk, blocks while the session is over its share
+    # connections still open after unregister_session keep relaying, they are not metered, so the session is not added back
+    def _account(self, session_id: str, size: int, upload: bool) -> None:
+        metered = session_id in self.__servers
+
+        if upload:
+            self.upload_shaper.acquire(session_id, size)
+
+            if metered:
+                self.upload_meter.add(session_id, size)
+        else:
+            self.download_shaper.acquire(session_id, size)
+
+            if metered:
+                self.download_meter.add(session_id, size)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,79 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List
+from collections import deque
+import threading, time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+WINDOW_SECONDS = 5
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# -------------------------------------------------------- class: ThroughputMeter -------------------------------------------------------- #
+
+class ThroughputMeter:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, window_seconds: float = WINDOW_SECONDS):
+        self.window_seconds = window_seconds
+        self.__totals = {}
+        self.__samples = {}
+        self.__lock = threading.Lock()
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def add(self, session_id: str, size: int) -> None:
+        now = time.monotonic()
+
+        with self.__lock:
+            self.__totals[session_id] = self.__totals.get(session_id, 0) + size
+            samples = self.__samples.setdefault(session_id, deque())
+            samples.append((now, size))
+            self.__drop_old(samples, now)
+
+    def total_bytes(self, session_id: str) -> int:
+        with self.__lock:
+            return self.__totals.get(session_id, 0)
+
+    # over the last window_seconds
+    def bytes_per_second(self, session_id: str) -> float:
+        now = time.monotonic()
+
+        with self.__lock:
+            samples = self.__samples.get(session_id)
+
+            if not samples:
+                return 0
+
+            self.__drop_old(samples, now)
+
+            return sum(size for _, size in samples) / self.window_seconds
+
+    def remove_session(self, session_id: str) -> None:
+        with self.__lock:
+            self.__totals.pop(session_id, None)
+            self.__samples.pop(session_id, None)
+
+    def session_ids(self) -> List[str]:
+        with self.__lock:
+            return list(self.__totals.keys())
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __drop_old(self, samples: deque, now: float) -> None:
+        while samples and now - samples[0][0] > self.window_seconds:
+            samples.popleft()
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,76 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# Replaces the content of an input, textarea or contenteditable element in one call.
+# For contenteditables execCommand('insertText') is used, because it fires the same beforeinput/input events as typing,
+# which is what Polymer and the Studio textboxes listen to. The value that landed is returned for verification.
+SET_TEXT_JS = '''
+var element = arguments[0], text = arguments[1];
+element.focus();
+
+if (element.isContentEditable) {
+    var selection = window.getSelection(), range = document.createRange();
+    range.selectNodeContents(element);
+    selection.removeAllRanges();
+    selection.addRange(range);
+
+    if (!document.execCommand('insertText', false, text) || element.innerText.replace(/\\s+$/, '') !== text.replace(/\\s+$/, '')) {
+        element.textContent = text;
+        element.dispatchEvent(new InputEvent('input', {bubbles: true, composed: true, inputType: 'insertText', data: text}));
+    }
+
+    element.dispatchEvent(new Event('change', {bubbles: true, composed: true}));
+
+    return element.innerText;
+}
+
+var proto = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+// the native setter, so frameworks tracking the value property notice the change
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, text);
+element.dispatchEvent(new InputEvent('input', {bubbles: true, composed: true, inputType: 'insertText', data: text}));
+element.dispatchEvent(new Event('change', {bubbles: true, composed: true}));
+
+return element.value;
+'''
+
+GET_TEXT_JS = '''
+var element = arguments[0];
+
+return element.isContentEditable ? element.innerText : element.value;
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# True if the element ended up containing exactly the text
+def set_text(driver, element, text: str) -> bool:
+    try:
+        return normalized(driver.execute_script(SET_TEXT_JS, element, text)) == normalized(text)
+    except Exception:
+        return False
+
+def get_text(driver, element) -> Optional[str]:
+    try:
+        return driver.execute_script(GET_TEXT_JS, element)
+    except Exception:
+        return None
+
+# innerText adds trailing newlines and uses nbsp-s and \r\n depending on the browser
+def normalized(text: Optional[str]) -> Optional[str]:
+    if text is None:
+        return None
+
+    return text.replace('\r\n', '\n').replace('\xa0', ' ').rstrip()
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,83 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict
+
+# Local
+from .enums.upload_event_type import UploadEventType
+from .enums.upload_status import UploadStatus
+from .enums.upload_stage import UploadStage
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: UploadEvent ---------------------------------------------------------- #
+
+class UploadEvent:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        type: UploadEventType,
+        time: float, # when it happened in the page, not when it got to python
+        status: UploadStatus = UploadStatus.UNIDENTIFIED,
+        stage: UploadStage = UploadStage.NOT_STARTED,
+        percent: Optional[float] = None,
+        bytes_sent: Optional[int] = None,
+        total_bytes: Optional[int] = None,
+        bytes_per_second: Optional[float] = None,
+        eta_seconds: Optional[float] = None,
+        video_id: Optional[str] = None,
+        label: Optional[str] = None,
+        succeeded: Optional[bool] = None
+    ):
+        self.type = type
+        self.time = time
+        self.status = status
+        self.stage = stage
+        self.percent = percent
+        self.bytes_sent = bytes_sent
+        self.total_bytes = total_bytes
+        self.bytes_per_second = bytes_per_second
+        self.eta_seconds = eta_seconds
+        self.video_id = video_id
+        self.label = label
+        self.succeeded = succeeded
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def to_dict(self) -> Dict:
+        return {
+            'type': self.type.value,
+            'time': self.time,
+            'status': self.status.name,
+            'stage': self.stage.name,
+            'percent': self.percent,
+            'bytes_sent': self.bytes_sent,
+            'total_bytes': self.total_bytes,
+            'bytes_per_second': self.bytes_per_second,
+            'eta_seconds': self.eta_seconds,
+            'video_id': self.video_id,
+            'label': self.label,
+            'succeeded': self.succeeded
+        }
+
+    def __repr__(self) -> str:
+        if self.type == UploadEventType.PROGRESS:
+            details = '{}%'.format(self.percent)
+        elif self.type == UploadEventType.STATUS:
+            details = self.status.name
+        elif self.type == UploadEventType.STAGE:
+            details = self.stage.name
+        elif self.type == UploadEventType.DONE:
+            details = 'ok' if self.succeeded else 'failed'
+        else:
+            details = self.video_id
+
+        return 'UploadEvent({}, {})'.format(self.type.value, details)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,198 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional, Dict, Callable, Iterator
+import threading, queue, time, os
+
+# Local
+from .upload_event import UploadEvent
+from .enums.upload_event_type import UploadEventType
+from .enums.upload_status import UploadStatus
+from .enums.upload_stage import UploadStage
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# weight of the newest sample in the transfer rate estimate
+RATE_SMOOTHING = 0.3
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: UploadEventStream ------------------------------------------------------- #
+
+# The events of one upload, pass it to Youtube.upload
+#
+# the snapshots come from an observer inside the page (see upload_progress), they carry the page's own timestamps,
+# so rates and the video id's assignment time are right even if python only gets them at the next step of the upload flow
+# they are handed over at every wait of the upload flow (settles, pauses, element lookups), so they arrive at most about a step late
+#
+# the observer lives in the upload dialog, it ends with the publish, the processing after it is not followed,
+# the last status is the one the dialog showed when the video got published (usually processing SD)
+# to act on the finished processing, use ProcessingWatcher with the video id of the DONE event
+#
+# consume it with 'on_event', or by iterating it from another thread, the iteration ends after the DONE event
+class UploadEventStream:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, on_event: Optional[Callable[[UploadEvent], None]] = None):
+        self.on_event = on_event
+        self.events = []
+        self.total_bytes = None
+        self.status = UploadStatus.UNIDENTIFIED
+        self.stage = UploadStage.NOT_STARTED
+        self.percent = None
+        self.bytes_per_second = None
+        self.video_id = None
+        self.video_id_assigned_at = None
+        self.started_at = None
+        self.finished_at = None
+        self.__last_progress = None # (time, bytes_sent)
+        self.__lock = threading.Lock()
+        self.__queue = queue.Queue()
+        self.__closed = False
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def start(self, video_path: str) -> None:
+        try:
+            self.total_bytes = os.path.getsize(video_path)
+        except OSError:
+            self.total_bytes = None
+
+        self.started_at = time.time()
+
+    def add_snapshots(self, snapshots: List[Dict]) -> None:
+        for snapshot in snapshots:
+            self.__add_snapshot(snapshot)
+
+    def stage_changed(self, stage: UploadStage) -> None:
+        with self.__lock:
+            self.stage = stage
+
+        self.__emit(UploadEventType.STAGE, time.time())
+
+    def finish(self, succeeded: bool, video_id: Optional[str] = None) -> None:
+        if self.__closed:
+            return
+
+        with self.__lock:
+            self.video_id = self.video_id or video_id
+            self.finished_at = time.time()
+
+        self.__emit(UploadEventType.DONE, self.finished_at, succeeded=succeeded)
+        self.__closed = True
+        self.__queue.put(None)
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        if not self.bytes_per_second or self.percent is None or not self.total_bytes:
+            return None
+
+        return self.total_bytes * (100 - self.percent) / 100 / self.bytes_per_second
+
+    def __iter__(self) -> Iterator[UploadEvent]:
+        while True:
+            event = self.__queue.get()
+
+            if event is None:
+                return
+
+            yield event
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __add_snapshot(self, snapshot: Dict) -> None:
+        event_time = snapshot.get('time') or time.time()
+        status = UploadStatus.from_flags(
+            uploading=bool(snapshot.get('uploading')),
+            processing=bool(snapshot.get('processing')),
+            processed=bool(snapshot.get('processed'))
+        )
+        video_url = snapshot.get('video_url')
+        video_id = video_url.rstrip('/').split('/')[-1] if video_url else None
+        label = snapshot.get('label')
+
+        if video_id and not self.video_id:
+            with self.__lock:
+                self.video_id = video_id
+                self.video_id_assigned_at = event_time
+
+            self.__emit(UploadEventType.VIDEO_ID, event_time, label=label)
+
+        if status == UploadStatus.UPLOADING and snapshot.get('percent') is not None:
+            self.__progress(event_time, min(float(snapshot['percent']), 100), label)
+        elif self.status == UploadStatus.UPLOADING and status != UploadStatus.UPLOADING and status != UploadStatus.UNIDENTIFIED:
+            # the bar switches to the processing progress, the transfer itself is done
+            self.__progress(event_time, 100.0, label)
+
+        if status != self.status:
+            with self.__lock:
+                self.status = status
+
+            self.__emit(UploadEventType.STATUS, event_time, label=label)
+
+    def __progress(self, event_time: float, percent: float, label: Optional[str]) -> None:
+        if percent == self.percent:
+            return
+
+        with self.__lock:
+            self.percent = percent
+            bytes_sent = int(self.total_bytes * percent / 100) if self.total_bytes else None
+
+            if bytes_sent is not None and self.__last_progress:
+                last_time, last_bytes_sent = self.__last_progress
+
+                if event_time > last_time and bytes_sent >= last_bytes_sent:
+                    rate = (bytes_sent - last_bytes_sent) / (event_time - last_time)
+                    self.bytes_per_second = rate if self.bytes_per_second is None else RATE_SMOOTHING*rate + (1 - RATE_SMOOTHING)*self.bytes_per_second
+
+            self.__last_progress = (event_time, bytes_sent) if bytes_sent is not None else None
+
+        self.__emit(UploadEventType.PROGRESS, event_time, bytes_sent=bytes_sent, label=label)
+
+    def __emit(
+        self,
+        type: UploadEventType,
+        event_time: float,
+        bytes_sent: Optional[int] = None,
+        label: Optional[str] = None,
+        succeeded: Optional[bool] = None
+    ) -> None:
+        if self.__closed:
+            return
+
+        with self.__lock:
+            event = UploadEvent(
+                type=type,
+                time=event_time,
+                status=self.status,
+                stage=self.stage,
+                percent=self.percent,
+                bytes_sent=bytes_sent,
+                total_bytes=self.total_bytes,
+                bytes_per_second=self.bytes_per_second,
+                eta_seconds=self.eta_seconds if type == UploadEventType.PROGRESS else None,
+                video_id=self.video_id,
+                label=label,
+                succeeded=succeeded
+            )
+            self.events.append(event)
+
+        self.__queue.put(event)
+
+        if self.on_event:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                print('UploadEventStream - on_event', e)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,193 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Dict, Optional
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# Records the state of the upload dialog every time it changes, with the page's timestamp.
+# A MutationObserver on the document only looks for the dialog to show up (or get replaced),
+# a second one on the dialog itself catches the changes of ytcp-video-upload-progress (its status attributes, the bar and the label)
+# and of ytcp-video-info (the video link, once the id is assigned). The changes of one task are recorded as one snapshot.
+# Returns True if it was installed now, False if the document already had it.
+OBSERVE_UPLOAD_PROGRESS_JS = '''
+if (window.__uploadProgress) {
+    return false;
+}
+
+var state = window.__uploadProgress = {events: [], last: null, waiters: [], dialog: null, scheduled: false};
+
+function text(element) {
+    return element ? (element.textContent || '').replace(/\\s+/g, ' ').trim() : '';
+}
+
+function snapshot() {
+    var dialog = state.dialog || document;
+    var progress = dialog.querySelector('ytcp-video-upload-progress');
+    var link = dialog.querySelector('ytcp-video-info a[href*="youtu"]');
+    var s = {uploading: false, processing: false, processed: false, percent: null, label: '', video_url: link ? link.href : null};
+
+    if (progress) {
+        s.uploading = progress.hasAttribute('uploading');
+        s.processing = progress.hasAttribute('processing');
+        s.processed = progress.hasAttribute('checks-can-start');
+        s.label = text(progress.querySelector('.progress-label') || progress);
+
+        var bar = progress.querySelector('[aria-valuenow]');
+        var percent = bar ? parseFloat(bar.getAttribute('aria-valuenow')) : NaN;
+
+        if (isNaN(percent)) {
+            var match = s.label.match(/(\\d+(?:[.,]\\d+)?)\\s*%/);
+            percent = match ? parseFloat(match[1].replace(',', '.')) : NaN;
+        }
+
+        s.percent = isNaN(percent) ? null : percent;
+    }
+
+    return s;
+}
+
+function record() {
+    state.scheduled = false;
+
+    var s = snapshot();
+    var key = JSON.stringify(s);
+
+    if (key === state.last) {
+        return;
+    }
+
+    state.last = key;
+    s.time = Date.now() / 1000;
+    state.events.push(s);
+
+    if (state.events.length > 1000) {
+        state.events.shift();
+    }
+
+    var waiters = state.waiters;
+    state.waiters = [];
+    waiters.forEach(function (waiter) {
+        waiter();
+    });
+}
+
+function schedule() {
+    if (!state.scheduled) {
+        state.scheduled = true;
+        Promise.resolve().then(record);
+    }
+}
+
+var dialogObserver = new MutationObserver(schedule);
+
+function attach() {
+    var dialog = document.querySelector('ytcp-uploads-dialog');
+
+    if (dialog === state.dialog) {
+        return;
+    }
+
+    dialogObserver.disconnect();
+    state.dialog = dialog;
+
+    if (dialog) {
+        dialogObserver.observe(dialog, {subtree: true, childList: true, attributes: true, characterData: true});
+    }
+
+    schedule();
+}
+
+new MutationObserver(attach).observe(document.documentElement, {subtree: true, childList: true});
+attach();
+record();
+
+return true;
+'''
+
+# returns the recorded snapshots and empties the queue, null if the observer is not installed in this document
+DRAIN_JS = '''
+var state = window.__uploadProgress;
+
+if (!state) {
+    return null;
+}
+
+var events = state.events;
+state.events = [];
+
+return events;
+'''
+
+# async: calls back as soon as there is a recorded snapshot, or after arguments[0] seconds with []
+WAIT_JS = '''
+var done = arguments[arguments.length - 1];
+var timeout = arguments[0] * 1000;
+var state = window.__uploadProgress;
+
+if (!state) {
+    done(null);
+
+    return;
+}
+
+function drain() {
+    var events = state.events;
+    state.events = [];
+    done(events);
+}
+
+if (state.events.length) {
+    drain();
+
+    return;
+}
+
+var timer = null;
+var waiter = function () {
+    clearTimeout(timer);
+    drain();
+};
+
+timer = setTimeout(function () {
+    state.waiters = state.waiters.filter(function (w) {
+        return w !== waiter;
+    });
+    drain();
+}, timeout);
+
+state.waiters.push(waiter);
+'''
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# True if it was installed into the current document now
+def observe(driver) -> bool:
+    try:
+        return bool(driver.execute_script(OBSERVE_UPLOAD_PROGRESS_JS))
+    except Exception:
+        return False
+
+# None if the observer is not installed in the current document
+def drain(driver) -> Optional[List[Dict]]:
+    try:
+        return driver.execute_script(DRAIN_JS)
+    except Exception:
+        return None
+
+# blocks in the page until the observer records a change, so the caller wakes up right away instead of at its next poll
+def wait(driver, timeout: float) -> Optional[List[Dict]]:
+    try:
+        return driver.execute_async_script(WAIT_JS, timeout)
+    except Exception:
+        return None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,80 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Dict, Callable
+import time
+
+# Local
+from .enums.upload_stage import UploadStage
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: UploadState ---------------------------------------------------------- #
+
+# how far an upload got, so a retry can finish it on the video's studio page instead of sending the file again
+class UploadState:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        video_path: str,
+        video_id: Optional[str] = None,
+        stage: UploadStage = UploadStage.NOT_STARTED,
+        transfer_complete: bool = False,
+        updated_at: Optional[float] = None
+    ):
+        self.video_path = video_path
+        self.video_id = video_id
+        self.__stage = stage
+        # the file finishes sending independently of the form stages, set once the status leaves UploadStatus.UPLOADING
+        self.transfer_complete = transfer_complete
+        self.updated_at = updated_at or time.time()
+        # not saved, set for the time of an upload (see UploadEventStream)
+        self.on_stage_change: Optional[Callable[[UploadStage], None]] = None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def stage(self) -> UploadStage:
+        return self.__stage
+
+    @stage.setter
+    def stage(self, stage: UploadStage) -> None:
+        self.__stage = stage
+        self.updated_at = time.time()
+
+        if self.on_stage_change:
+            self.on_stage_change(stage)
+
+    def reached(self, stage: UploadStage) -> bool:
+        return self.__stage.value >= stage.value
+
+    @property
+    def is_resumable(self) -> bool:
+        return self.video_id is not None and self.transfer_complete and not self.reached(UploadStage.PUBLISHED)
+
+    def to_dict(self) -> Dict:
+        return {
+            'video_path': self.video_path,
+            'video_id': self.video_id,
+            'stage': self.__stage.name,
+            'transfer_complete': self.transfer_complete,
+            'updated_at': self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'UploadState':
+        return cls(
+            video_path=d['video_path'],
+            video_id=d.get('video_id'),
+            stage=UploadStage[d.get('stage', UploadStage.NOT_STARTED.name)],
+            transfer_complete=d.get('transfer_complete', False),
+            updated_at=d.get('updated_at')
+        )
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
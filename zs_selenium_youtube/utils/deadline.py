@@ -0,0 +1,202 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Callable
+from functools import wraps
+import threading, time
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# how long a blocked WebDriver call may overrun the deadline before the browser is killed
+DEFAULT_HARD_TIMEOUT_GRACE_SECONDS = 30
+
+# longest single sleep, so an expired deadline is noticed
+MAX_SLEEP_SLICE_SECONDS = 0.25
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------- class: DeadlineExceeded -------------------------------------------------------- #
+
+# BaseException on purpose, so the broad 'except Exception' blocks of the flows can not swallow it
+class DeadlineExceeded(BaseException):
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, name: str, timeout: float):
+        super().__init__('{} timed out after {}s'.format(name, timeout))
+
+        self.name = name
+        self.timeout = timeout
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: Deadline ------------------------------------------------------------ #
+
+class Deadline:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self, name: str, timeout: float):
+        self.name = name
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.cancelled = False
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    @property
+    def remaining(self) -> float:
+        return max(0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.cancelled or time.monotonic() >= self.expires_at
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def check(self) -> None:
+        if self.expired:
+            raise DeadlineExceeded(self.name, self.timeout)
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+_local = threading.local()
+
+def current() -> Optional[Deadline]:
+    deadlines = getattr(_local, 'deadlines', None)
+
+    return deadlines[-1] if deadlines else None
+
+def check() -> None:
+    deadline = current()
+
+    if deadline:
+        deadline.check()
+
+# bounds a timeout to what is left of the current deadline
+def bound(timeout: Optional[float]) -> Optional[float]:
+    deadline = current()
+
+    if not deadline:
+        return timeout
+
+    return deadline.remaining if timeout is None else min(timeout, deadline.remaining)
+
+# wait point: time.sleep, that raises DeadlineExceeded as soon as the current deadline expires
+def sleep(seconds: float) -> None:
+    deadline = current()
+
+    if not deadline:
+        time.sleep(seconds)
+
+        return
+
+    end = time.monotonic() + seconds
+
+    while True:
+        deadline.check()
+        left = end - time.monotonic()
+
+        if left <= 0:
+            return
+
+        time.sleep(min(left, MAX_SLEEP_SLICE_SECONDS))
+
+def push(deadline: Deadline) -> None:
+    outer = current()
+
+    # a nested deadline can never outlive the outer one
+    if outer and outer.expires_at < deadline.expires_at:
+        deadline.expires_at = outer.expires_at
+
+    if not hasattr(_local, 'deadlines'):
+        _local.deadlines = []
+
+    _local.deadlines.append(deadline)
+
+def pop() -> None:
+    _local.deadlines.pop()
+
+# runs the code without any deadline, for cleanup after expiry
+class suspended:
+    def __enter__(self):
+        self.__deadlines = getattr(_local, 'deadlines', [])
+        _local.deadlines = []
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _local.deadlines = self.__deadlines
+
+# Thread-safe replacement of signal based timeouts.
+# The deadline is enforced at the wait points (sleep, check) of the decorated method.
+# If a WebDriver call blocks past the deadline, self._kill_for_timeout() is called from a watchdog thread after the grace period.
+# On expiry self._deadline_exceeded(hard_killed) restores a known state and the exception is returned instead of raised.
+def timeoutable(name: str, hard_timeout_grace_seconds: float = DEFAULT_HARD_TIMEOUT_GRACE_SECONDS) -> Callable:
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, timeout: Optional[float] = None, **kwargs):
+            if timeout is None:
+                return func(self, *args, timeout=timeout, **kwargs)
+
+            deadline = Deadline(name, timeout)
+            push(deadline)
+
+            finished = threading.Event()
+            hard_killed = threading.Event()
+
+            def watchdog():
+                if not finished.wait(deadline.remaining + hard_timeout_grace_seconds):
+                    hard_killed.set()
+                    self._kill_for_timeout()
+
+            watchdog_thread = threading.Thread(target=watchdog, name='{}-watchdog'.format(name), daemon=True)
+            watchdog_thread.start()
+
+            try:
+                try:
+                    res = func(self, *args, timeout=timeout, **kwargs)
+                except Exception:
+                    # after the kill any WebDriver call errors, that is the timeout, not an error of the flow
+                    if not hard_killed.is_set():
+                        raise
+
+                    res = None
+
+                finished.set()
+
+                # a WebDriver call that errored because of the kill reports it as a failure, not as a timeout
+                if hard_killed.is_set():
+                    raise DeadlineExceeded(name, timeout)
+
+                return res
+            except DeadlineExceeded as e:
+                finished.set()
+
+                with suspended():
+                    self._deadline_exceeded(hard_killed.is_set())
+
+                return e
+            finally:
+                finished.set()
+                pop()
+
+        return wrapper
+
+    return decorator
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,26 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Callable
+from functools import wraps
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+# marks a public Youtube method as a job, so the session can account for it and recycle the browser between jobs
+def session_job(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._job_started()
+
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self._job_finished()
+
+    return wrapper
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,143 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional, Callable
+import os, shutil
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+# linux/fs.h - _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ---------------------------------------------------------- class: CloneStats ----------------------------------------------------------- #
+
+class CloneStats:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(self):
+        self.files_reflinked = 0
+        self.files_hardlinked = 0
+        self.files_copied = 0
+        self.bytes_written = 0
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def add(self, other: 'CloneStats') -> None:
+        self.files_reflinked += other.files_reflinked
+        self.files_hardlinked += other.files_hardlinked
+        self.files_copied += other.files_copied
+        self.bytes_written += other.bytes_written
+
+    def __repr__(self) -> str:
+        return 'CloneStats(reflinked={}, hardlinked={}, copied={}, bytes_written={})'.format(
+            self.files_reflinked, self.files_hardlinked, self.files_copied, self.bytes_written
+        )
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+def reflink(src: str, dst: str) -> bool:
+    if fcntl is None:
+        return False
+
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+        shutil.copystat(src, dst)
+
+        return True
+    except (OSError, IOError):
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+
+        return False
+
+def hardlink(src: str, dst: str) -> bool:
+    try:
+        os.link(src, dst)
+
+        return True
+    except (OSError, AttributeError):
+        return False
+
+# reflink (copy-on-write) is always safe, hardlinks only for files that are never written in place (can_hardlink)
+def clone_tree(
+    src: str,
+    dst: str,
+    can_hardlink: Optional[Callable[[str], bool]] = None,
+    ignore: Optional[Callable[[str], bool]] = None,
+    use_reflink: bool = True
+) -> CloneStats:
+    stats = CloneStats()
+
+    for root, dir_names, file_names in os.walk(src):
+        rel_root = os.path.relpath(root, src)
+        dst_root = os.path.normpath(os.path.join(dst, rel_root))
+        os.makedirs(dst_root, exist_ok=True)
+
+        for file_name in file_names:
+            rel_path = os.path.normpath(os.path.join(rel_root, file_name))
+
+            if ignore and ignore(rel_path):
+                continue
+
+            src_path = os.path.join(root, file_name)
+            dst_path = os.path.join(dst_root, file_name)
+
+            if os.path.islink(src_path):
+                os.symlink(os.readlink(src_path), dst_path)
+
+                continue
+
+            if use_reflink and reflink(src_path, dst_path):
+                stats.files_reflinked += 1
+
+                continue
+
+            # the filesystem does not support it, no need to try it for every file
+            use_reflink = False
+
+            if can_hardlink and can_hardlink(rel_path) and hardlink(src_path, dst_path):
+                stats.files_hardlinked += 1
+            else:
+                shutil.copy2(src_path, dst_path)
+                stats.files_copied += 1
+                stats.bytes_written += os.path.getsize(dst_path)
+
+    return stats
+
+def tree_size(path: str) -> int:
+    size = 0
+
+    for root, _, file_names in os.walk(path):
+        for file_name in file_names:
+            file_path = os.path.join(root, file_name)
+
+            if not os.path.islink(file_path):
+                size += os.path.getsize(file_path)
+
+    return size
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -0,0 +1,110 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import Optional
+import os, time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ----------------------------------------------------------- class: FileLock ------------------------------------------------------------ #
+
+# cross-process exclusive lock based on a lock file next to the protected resource
+class FileLock:
+
+    # ------------------------------------------------------------- Init ------------------------------------------------------------- #
+
+    def __init__(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.05
+    ):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.__fd = None
+
+
+    # -------------------------------------------------------- Public methods -------------------------------------------------------- #
+
+    def acquire(self) -> bool:
+        if self.__fd is not None:
+            return True
+
+        folder_path = os.path.dirname(self.path)
+
+        if folder_path:
+            os.makedirs(folder_path, exist_ok=True)
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        start_time = time.time()
+
+        while True:
+            if self.__try_lock(fd):
+                self.__fd = fd
+
+                return True
+
+            if self.timeout is not None and time.time() - start_time >= self.timeout:
+                os.close(fd)
+
+                return False
+
+            time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        if self.__fd is None:
+            return
+
+        try:
+            if fcntl is not None:
+                fcntl.flock(self.__fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(self.__fd, 0, os.SEEK_SET)
+                msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self.__fd)
+            self.__fd = None
+
+    @property
+    def is_locked(self) -> bool:
+        return self.__fd is not None
+
+    def __enter__(self) -> 'FileLock':
+        if not self.acquire():
+            raise TimeoutError('Could not acquire lock: {}'.format(self.path))
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+    # ------------------------------------------------------- Private methods -------------------------------------------------------- #
+
+    def __try_lock(self, fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+            return True
+        except OSError:
+            return False
+
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
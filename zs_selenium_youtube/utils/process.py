@@ -0,0 +1,203 @@
+# --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
+
+# System
+from typing import List, Optional
+import os, signal
+
+# Pip
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# --------------------------------------------------------------- Defines ---------------------------------------------------------------- #
+
+PROC_PATH = '/proc'
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
+
+
+
+# ------------------------------------------------------------ Public methods ------------------------------------------------------------ #
+
+def pid_exists(pid: int) -> bool:
+    if psutil is not None:
+        return psutil.pid_exists(pid)
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+
+    return True
+
+# the pid itself, followed by all of its (transitive) children
+def process_tree_pids(pid: int) -> List[int]:
+    if psutil is not None:
+        try:
+            return [pid] + [p.pid for p in psutil.Process(pid).children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    if not pid_exists(pid):
+        return []
+
+    children = {}
+
+    for ppid, child_pid in _parent_child_pairs():
+        children.setdefault(ppid, []).append(child_pid)
+
+    pids = [pid]
+    i = 0
+
+    while i < len(pids):
+        pids.extend(children.get(pids[i], []))
+        i += 1
+
+    return pids
+
+# bytes, 0 if not available
+def process_rss(pid: int) -> int:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return 0
+
+    try:
+        with open(os.path.join(PROC_PATH, str(pid), 'statm'), 'r') as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        return 0
+
+# bytes
+def process_tree_rss(pid: int) -> int:
+    return sum(process_rss(p) for p in process_tree_pids(pid))
+
+# children first, so none of them gets reparented and missed; returns the killed pids
+def kill_process_tree(pid: int) -> List[int]:
+    killed = []
+
+    for p in reversed(process_tree_pids(pid)):
+        try:
+            os.kill(p, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            killed.append(p)
+        except OSError:
+            pass
+
+    return killed
+
+def process_name(pid: int) -> Optional[str]:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).name()
+        except psutil.Error:
+            return None
+
+    try:
+        with open(os.path.join(PROC_PATH, str(pid), 'comm'), 'r') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+# epoch seconds, together with the pid it identifies a process, even after the pid got reused
+def process_started_at(pid: int) -> Optional[float]:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).create_time()
+        except psutil.Error:
+            return None
+
+    stat_fields = _stat_fields(pid)
+    boot_time = _boot_time()
+
+    if not stat_fields or boot_time is None:
+        return None
+
+    return boot_time + int(stat_fields[19]) / CLOCK_TICKS
+
+def parent_pid(pid: int) -> Optional[int]:
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).ppid()
+        except psutil.Error:
+            return None
+
+    stat_fields = _stat_fields(pid)
+
+    return int(stat_fields[1]) if stat_fields else None
+
+# the same process is still running, the start times of psutil and /proc can differ by rounding
+# False if the start time can not be read, so it is safe to decide what to kill with it
+def is_same_process(pid: int, started_at: Optional[float]) -> bool:
+    current_started_at = process_started_at(pid)
+
+    if current_started_at is None:
+        return False
+
+    return started_at is None or abs(current_started_at - started_at) < 1
+
+# the lenient counterpart of is_same_process, for deciding what to keep
+# without a readable start time (no psutil and no /proc, eg. mac) a live pid counts as the process
+def may_be_same_process(pid: int, started_at: Optional[float]) -> bool:
+    if process_started_at(pid) is None:
+        return pid_exists(pid)
+
+    return is_same_process(pid, started_at)
+
+def all_pids() -> List[int]:
+    if psutil is not None:
+        return psutil.pids()
+
+    try:
+        return [int(p) for p in os.listdir(PROC_PATH) if p.isdigit()]
+    except OSError:
+        return []
+
+
+# ----------------------------------------------------------- Private methods ------------------------------------------------------------ #
+
+# the fields of /proc/<pid>/stat after the command name, starting with the state
+def _stat_fields(pid: int) -> Optional[List[str]]:
+    try:
+        with open(os.path.join(PROC_PATH, str(pid), 'stat'), 'r') as f:
+            stat = f.read()
+
+        # the command name can contain spaces and parentheses, the fields we need come after the last ')'
+        return stat[stat.rindex(')') + 2:].split()
+    except (OSError, ValueError):
+        return None
+
+def _boot_time() -> Optional[float]:
+    try:
+        with open(os.path.join(PROC_PATH, 'stat'), 'r') as f:
+            for line in f:
+                if line.startswith('btime'):
+                    return float(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return None
+
+def _parent_child_pairs() -> List[tuple]:
+    pairs = []
+
+    for pid in all_pids():
+        stat_fields = _stat_fields(pid)
+
+        if stat_fields and len(stat_fields) > 1:
+            pairs.append((int(stat_fields[1]), pid))
+
+    return pairs
+
+# ---------------------------------------------------------------------------------------------------------------------------------------- #
@@ -1,27 +1,45 @@
 # --------------------------------------------------------------- Imports ---------------------------------------------------------------- #
 
 # System
-from typing import List, Dict, Optional, Tuple, Callable, Union
-import time, json
+from typing import List, Dict, Optional, Tuple, Callable, Union, Any, Iterator
+import time, json, os, shutil, uuid
 from sys import platform
 
 # Pip
 from selenium_uploader_account import SeleniumUploaderAccount, Proxy, BaseAddonInstallSettings
 from noraise import noraise
 from kcu import strings
-from kstopit import signal_timeoutable
 from kyoutubescraper import YoutubeScraper, ChannelAboutData
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 
-from bs4 import BeautifulSoup as bs
-
 # Local
 from .enums.visibility import Visibility
 from .enums.upload_status import UploadStatus
 from .enums.analytics_period import AnalyticsPeriod
 from .enums.analytics_tab import AnalyticsTab
+from .enums.recycle_reason import RecycleReason
+from .enums.upload_stage import UploadStage
+from .enums.html_parser_engine import HtmlParserEngine
+from .enums.processing_state import ProcessingState
+from .recycle_policy import RecyclePolicy
+from .session_metrics import SessionMetrics, RecycleEvent
+from .profile_template import ProfileTemplate
+from .upload_state import UploadState
+from .upload_event_stream import UploadEventStream
+from .shaping_proxy import ShapingProxy, SessionBandwidth
+from .proxy_pool import ProxyPool
+from .cookie_store import CookieStore, FileCookieStore
+from .account_result import AccountResult
+from .search import VideoSearch, SearchResult
+from .channel_grid import extract_video_ids, DEFAULT_ENGINE as DEFAULT_GRID_PARSER_ENGINE
+from .inventory import ContentInventory, VideoRecord, parse_content_page
+from .utils.decorators import session_job
+from .utils.process import kill_process_tree, process_tree_pids, process_started_at, is_same_process
+from .reaper import SessionRegistry, SessionRecord
+from .utils import deadline
+from . import text_entry, animation_suppression, account_isolation, upload_progress
 
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
 
@@ -46,6 +64,15 @@ MAX_TAG_CHAR_LEN            = 30
 
 LOGIN_INFO_COOKIE_NAME = 'LOGIN_INFO'
 
+# leaving the upload page aborts the transfer, so a failed upload waits for it until it stops moving for this long
+STALLED_TRANSFER_TIMEOUT = 60
+
+# after the upload timed out, it is waited for at most this long, it has to end before the watchdog kills the browser (hard timeout grace)
+TIMED_OUT_TRANSFER_WAIT_SECONDS = 20
+
+# longest single wait in the page for the upload progress, well below the script timeout of geckodriver (30s)
+MAX_UPLOAD_PROGRESS_WAIT_SECONDS = 5
+
 # ---------------------------------------------------------------------------------------------------------------------------------------- #
 
 
@@ -63,12 +90,19 @@ class Youtube(SeleniumUploaderAccount):
         cookies_folder_path: Optional[str] = None,
         cookies_id: Optional[str] = None,
         pickle_cookies: bool = False,
+        # cookies - kept in memory and only written when they change, the files above are still read if the store has none
+        cookie_store: Optional[CookieStore] = None,
 
         # proxy
         proxy: Optional[Union[Proxy, str]] = None,
         # proxy - legacy (kept for convenience)
         host: Optional[str] = None,
         port: Optional[int] = None,
+        # proxy - local bandwidth shaping, the proxy above is used as its upstream
+        shaping_proxy: Optional[ShapingProxy] = None,
+        session_bandwidth: Optional[SessionBandwidth] = None,
+        # proxy - picked from the pool by health score, if none is given above, the pool also gets the measurements of this session
+        proxy_pool: Optional[ProxyPool] = None,
 
         # addons
         addons_folder_path: Optional[str] = None,
@@ -80,6 +114,7 @@ class Youtube(SeleniumUploaderAccount):
         geckodriver_path: Optional[str] = None,
         firefox_binary_path: Optional[str] = None,
         profile_path: Optional[str] = None,
+        profile_template: Optional[ProfileTemplate] = None,
 
         # profile settings
         private: bool = False,
@@ -100,52 +135,130 @@ class Youtube(SeleniumUploaderAccount):
         # login
         prompt_user_input_login: bool = True,
         login_prompt_callback: Optional[Callable[[str], None]] = None,
-        login_prompt_timeout_seconds: int = 60*5
+        login_prompt_timeout_seconds: int = 60*5,
+
+        # recycling
+        recycle_policy: Optional[RecyclePolicy] = None,
+
+        # cleanup - the browser processes and profiles of the session are recorded, so a Reaper can clean up after a crash
+        session_registry: Optional[SessionRegistry] = None,
+
+        # text entry
+        fast_text_entry: bool = True, # set texts with one script call, falls back to typing, if the text did not land
+
+        # animations
+        suppress_animations: bool = False, # transitions, animations and smooth scrolling finish instantly, the flows only wait for them briefly
+
+        # search - pass the same one to several sessions, to share its cache and its limit of parallel requests
+        video_search: Optional[VideoSearch] = None
     ):
-        super().__init__(
+        self.recycle_policy = recycle_policy
+        self.cookie_store = cookie_store
+        self.session_registry = session_registry
+        self.session_id = None
+        self.fast_text_entry = fast_text_entry
+        self.suppress_animations = suppress_animations
+        self.session_metrics = SessionMetrics()
+        self.__channel_id = None
+        self.__active_account_id = None
+        self.__job_depth = 0
+        self.last_upload_state = None
+        # the stream of the upload in progress, the waits of the upload flow keep feeding it
+        self.__upload_events = None
+        self.proxy_pool = proxy_pool
+        self.pool_proxy = None
+        self.__pool_account_id = cookies_id or uuid.uuid4().hex
+        # the pool counts the account towards its proxy's load until quit() releases it
+        self.__pool_assigned = False
+        self.__pool_released = False
+        self.__shaping_proxy = shaping_proxy
+        self.__shaping_upstream_proxy = None
+        self.__session_bandwidth = session_bandwidth
+
+        if proxy_pool:
+            if not proxy and not (host and port):
+                proxy = proxy_pool.acquire(self.__pool_account_id)
+                self.__pool_assigned = proxy is not None
+
+            self.pool_proxy = Proxy.from_str(proxy) if isinstance(proxy, str) else proxy
+
+        if shaping_proxy:
+            upstream_proxy = Proxy.from_str(proxy) if isinstance(proxy, str) else proxy
+
+            if not upstream_proxy and host and port:
+                upstream_proxy = Proxy(host, port)
+
+            # sessions of the same account must not share a port
+            self.shaping_session_id = '{}-{}'.format(cookies_id, uuid.uuid4().hex[:8]) if cookies_id else uuid.uuid4().hex
+            self.__shaping_upstream_proxy = upstream_proxy
+            proxy = self.__register_shaping_session()
+            host = None
+            port = None
+
+        # every session gets its own clone, created when the browser starts and removed when it quits
+        self.__profile_template = profile_template if not profile_path else None
+        self.__profile_id = uuid.uuid4().hex
+        webdriver_class = None
+
+        if self.__profile_template:
+            webdriver_class = profile_template.webdriver_class(self.__profile_id, prefs=animation_suppression.prefs() if suppress_animations else None)
+
+            # already installed in the template
+            addons_folder_path = None
+            addon_settings = None
+            extensions_folder_path = None
+
+        # kept, so the browser can be restarted with the same settings
+        self.__init_kwargs = {
             # cookies
-            cookies_folder_path=cookies_folder_path,
-            cookies_id=cookies_id,
-            pickle_cookies=pickle_cookies,
+            'cookies_folder_path': cookies_folder_path,
+            'cookies_id': cookies_id,
+            'pickle_cookies': pickle_cookies,
 
             # proxy
-            proxy=proxy,
+            'proxy': proxy,
             # proxy - legacy (kept for convenience)
-            host=host,
-            port=port,
+            'host': host,
+            'port': port,
 
             # addons
-            addons_folder_path=addons_folder_path,
-            addon_settings=addon_settings,
+            'addons_folder_path': addons_folder_path,
+            'addon_settings': addon_settings,
             # addons - legacy (kept for convenience)
-            extensions_folder_path=extensions_folder_path,
+            'extensions_folder_path': extensions_folder_path,
 
             # other paths
-            geckodriver_path=geckodriver_path,
-            firefox_binary_path=firefox_binary_path,
-            profile_path=profile_path,
+            'geckodriver_path': geckodriver_path,
+            'firefox_binary_path': firefox_binary_path,
+            'profile_path': profile_path,
+            # other paths - starts firefox on the profile template's clone
+            'webdriver_class': webdriver_class,
 
             # profile settings
-            private=private,
-            full_screen=full_screen,
-            language=language,
-            user_agent=user_agent,
-            disable_images=disable_images,
+            'private': private,
+            'full_screen': full_screen,
+            'language': language,
+            'user_agent': user_agent,
+            'disable_images': disable_images,
 
             # option settings
-            screen_size=screen_size,
-            headless=headless,
-            mute_audio=mute_audio,
-            home_page_url=home_page_url,
+            'screen_size': screen_size,
+            'headless': headless,
+            'mute_audio': mute_audio,
+            'home_page_url': home_page_url,
 
             # find function
-            default_find_func_timeout=default_find_func_timeout,
+            'default_find_func_timeout': default_find_func_timeout,
 
             # login
-            prompt_user_input_login=prompt_user_input_login,
-            login_prompt_callback=login_prompt_callback,
-            login_prompt_timeout_seconds=login_prompt_timeout_seconds,
-        )
+            'prompt_user_input_login': prompt_user_input_login,
+            'login_prompt_callback': login_prompt_callback,
+            'login_prompt_timeout_seconds': login_prompt_timeout_seconds
+        }
+
+        super().__init__(**self.__init_kwargs)
+        self.__register_session()
+        self.video_search = video_search or VideoSearch(search_url=YT_SEARCH_URL, user_agent=self.user_agent, proxy=self.proxy, proxy_pool=proxy_pool)
 
         if not self.did_log_in_at_init:
             self.__dismiss_alerts()
@@ -160,7 +273,10 @@ class Youtube(SeleniumUploaderAccount):
         return YT_URL
 
     def _get_current_user_id(self) -> Optional[str]:
-        return self.get_current_channel_id()
+        if not self.__channel_id:
+            self.__channel_id = self.get_current_channel_id()
+
+        return self.__channel_id
 
     def _profile_url_format(self) -> Optional[str]:
         return YT_PROFILE_URL
@@ -168,11 +284,271 @@ class Youtube(SeleniumUploaderAccount):
     def _login_via_cookies_needed_cookie_names(self) -> Union[str, List[str]]:
         return LOGIN_INFO_COOKIE_NAME
 
+    # the stored cookies are added before the browser looks for its own cookie files
+    def login_via_cookies(
+        self,
+        prompt_user_input_login: bool = True,
+        login_prompt_callback: Optional[Callable[[str], None]] = None,
+        login_prompt_timeout_seconds: Optional[float] = None,
+        save_cookies: bool = True
+    ) -> bool:
+        if self.cookie_store:
+            self.__restore_stored_cookies()
+
+        return super().login_via_cookies(
+            prompt_user_input_login=prompt_user_input_login,
+            login_prompt_callback=login_prompt_callback,
+            login_prompt_timeout_seconds=login_prompt_timeout_seconds,
+            save_cookies=save_cookies
+        )
+
+    # called on every upload, with a cookie store it only writes if the cookies changed since the last save
+    def save_cookies(self) -> None:
+        if not self.cookie_store:
+            return super().save_cookies()
+
+        self.cookie_store.save(self.__cookie_account_id(), self.browser.driver.current_url, self.browser.driver.get_cookies())
+
+    # wait point for the deadlines of the timeoutable flows
+    def get(self, url: str, *args, **kwargs):
+        deadline.check()
+        res = self.__get_measured(url, *args, **kwargs)
+
+        if self.suppress_animations:
+            animation_suppression.suppress(self.browser.driver)
+
+        return res
+
+    # called from the watchdog thread, when a WebDriver call blocks past the deadline
+    def _kill_for_timeout(self) -> None:
+        pid = self.browser_pid
+
+        if pid:
+            self.print('Killing blocked browser', kill_process_tree(pid))
+
+    # leaves the session in a known state: on the home page, or with a fresh browser, if the old one is unusable
+    def _deadline_exceeded(self, hard_killed: bool) -> None:
+        if self.proxy_pool and self.pool_proxy:
+            self.proxy_pool.report_failure(self.pool_proxy, 'deadline exceeded')
+
+        if not hard_killed:
+            try:
+                self.get(YT_URL)
+
+                return
+            except Exception as e:
+                self.print(e)
+
+        self.recycle(RecycleReason.TIMEOUT)
+
+    # ends the session, recycle only restarts the browser and keeps what belongs to the session
+    def quit(self) -> bool:
+        try:
+            return self.__quit_browser()
+        finally:
+            if self.__shaping_proxy:
+                self.__shaping_proxy.unregister_session(self.shaping_session_id)
+
+            if self.__pool_assigned:
+                self.proxy_pool.release(self.__pool_account_id)
+                self.__pool_assigned = False
+                self.__pool_released = True
+
+    def _job_started(self) -> None:
+        if self.__job_depth == 0:
+            # with a shaping proxy only its upstream changes, otherwise the browser needs a restart for the new proxy
+            if self.__replace_unhealthy_pool_proxy() and not self.__shaping_proxy:
+                self.recycle(RecycleReason.PROXY)
+            else:
+                self.recycle_if_needed()
+
+        self.__job_depth += 1
+
+    def _job_finished(self) -> None:
+        self.__job_depth -= 1
+
+        if self.__job_depth == 0:
+            self.session_metrics.job_finished()
+
 
     # -------------------------------------------------------- Public methods -------------------------------------------------------- #
 
+    @property
+    def browser_pid(self) -> Optional[int]:
+        try:
+            # geckodriver, firefox and its content processes are all its children
+            return self.browser.driver.service.process.pid
+        except:
+            return None
+
+    def memory_metrics(self) -> Dict:
+        self.session_metrics.update_rss(self.browser_pid)
+
+        return self.session_metrics.to_dict()
+
+    def recycle_if_needed(self) -> bool:
+        if not self.recycle_policy:
+            return False
+
+        if self.recycle_policy.measures_rss:
+            self.session_metrics.update_rss(self.browser_pid)
+
+        reason = self.recycle_policy.recycle_reason(self.session_metrics)
+
+        if not reason:
+            return False
+
+        return self.recycle(reason)
+
+    # saves cookies, quits and starts a new browser with the same settings, restoring login and the cached channel id
+    def recycle(self, reason: RecycleReason = RecycleReason.MANUAL) -> bool:
+        self.print('Recycling browser, reason:', reason.value)
+
+        start_time = time.time()
+        rss_bytes = self.session_metrics.update_rss(self.browser_pid)
+        job_count = self.session_metrics.job_count
+        age_seconds = self.session_metrics.age_seconds
+        was_logged_in = self.is_logged_in
+        channel_id = self.__channel_id
+
+        if was_logged_in:
+            try:
+                self.save_cookies()
+            except Exception as e:
+                self.print(e)
+
+        try:
+            self.__quit_browser()
+        except Exception as e:
+            self.print(e)
+
+        succeeded = False
+        self.__replace_unhealthy_pool_proxy()
+
+        if self.__shaping_proxy:
+            # the same port, unless quit() gave it up
+            self.__init_kwargs['proxy'] = self.__register_shaping_session()
+
+        try:
+            # no one is there to answer a login prompt between jobs
+            super().__init__(**dict(self.__init_kwargs, prompt_user_input_login=False))
+            self.__register_session()
+            succeeded = self.is_logged_in or not was_logged_in
+        except Exception as e:
+            self.print(e)
+
+        self.__channel_id = channel_id
+        self.session_metrics.restart()
+
+        if succeeded and not self.did_log_in_at_init:
+            self.__dismiss_alerts()
+
+        event = RecycleEvent(
+            reason=reason,
+            rss_bytes=rss_bytes,
+            job_count=job_count,
+            age_seconds=age_seconds,
+            duration_seconds=time.time() - start_time,
+            succeeded=succeeded
+        )
+        self.session_metrics.add_recycle_event(event)
+
+        if self.recycle_policy and self.recycle_policy.on_recycle:
+            try:
+                self.recycle_policy.on_recycle(event)
+            except Exception as e:
+                self.print(e)
+
+        return succeeded
+
+    # Moves this browser to another account: saves the current account's cookies, clears everything the session left
+    # on the youtube and google origins, then logs in with the stored cookies of 'account_id' (None is the session's own account).
+    # Without a cookie store, the default FileCookieStore is used, it finds the cookies saved by single-account sessions by their 'cookies_id'.
+    def switch_account(self, account_id: Optional[str] = None) -> bool:
+        if not self.cookie_store:
+            self.cookie_store = FileCookieStore()
+
+        if self.is_logged_in:
+            try:
+                self.save_cookies()
+            except Exception as e:
+                self.print(e)
+
+        self.__active_account_id = account_id
+        self.__channel_id = None
+        self.current_user_id = None
+
+        if not self.__clear_session_state():
+            self.print('Could not clear the session state, not switching to', account_id)
+
+            return False
+
+        if not self.__restore_stored_cookies():
+            self.print('No stored cookies for', account_id)
+
+            return False
+
+        self.get(YT_URL)
+
+        if not self.is_logged_in:
+            self.print('Stored cookies of', account_id, 'did not log in')
+
+            return False
+
+        self.current_user_id = self._get_current_user_id()
+
+        return True
+
+    # Runs 'job' (a callable taking this Youtube, or the name of a method without arguments) for each account in this one browser,
+    # instead of starting a browser per account. Meant for light checks (get_violations, get_current_channel_id, check_analytics, like),
+    # all accounts share this session's proxy and browser fingerprint.
+    @session_job
+    def sweep_accounts(
+        self,
+        account_ids: List[str],
+        job: Union[str, Callable[['Youtube'], Any]],
+        restore_account: bool = True,
+        on_result: Optional[Callable[[AccountResult], None]] = None
+    ) -> List[AccountResult]:
+        results = []
+        original_account_id = self.__active_account_id
+
+        for i, account_id in enumerate(account_ids):
+            # the sweep is a single job, the policy is checked between its accounts too
+            if i > 0:
+                self.recycle_if_needed()
+
+            result = self.__sweep_account(account_id, job)
+            results.append(result)
+
+            if on_result:
+                try:
+                    on_result(result)
+                except Exception as e:
+                    self.print(e)
+
+        if restore_account and account_ids:
+            try:
+                switched_back = self.switch_account(original_account_id)
+            except Exception as e:
+                self.print(e)
+                switched_back = False
+
+            if not switched_back:
+                self.print('Could not switch back to', original_account_id or 'the session\'s own account')
+
+        return results
+
+    # streams the videos found for 'query' over http, no browser involved, see VideoSearch
+    def search_videos(self, query: str, limit: Optional[int] = 20) -> Iterator[SearchResult]:
+        return self.video_search.search(query, limit=limit)
+
+    # query -> results, searched in parallel
+    def search_videos_many(self, queries: List[str], limit: Optional[int] = 20) -> Dict[str, List[SearchResult]]:
+        return self.video_search.search_many(queries, limit=limit)
+
     def get_sub_and_video_count(self, channel_id: str) -> Optional[Tuple[int, int]]:
-        return YoutubeScraper(user_agent=self.user_agent, proxy=self.proxy.string).get_sub_and_video_count(channel_id=channel_id)
+        return self.__scrape(lambda scraper: scraper.get_sub_and_video_count(channel_id=channel_id))
 
     def get_channel_about_data(
         self,
@@ -180,12 +556,13 @@ class Youtube(SeleniumUploaderAccount):
         channel_id: Optional[str] = None,
         channel_url_name: Optional[str] = None
     ) -> Optional[ChannelAboutData]:
-        return YoutubeScraper(user_agent=self.user_agent, proxy=self.proxy.string).get_channel_about_data(
+        return self.__scrape(lambda scraper: scraper.get_channel_about_data(
             user_name=user_name,
             channel_id=channel_id,
             channel_url_name=channel_url_name
-        )
+        ))
 
+    @session_job
     def watch_video(
         self,
         video_id: str,
@@ -202,7 +579,7 @@ class Youtube(SeleniumUploaderAccount):
 
             if play_button and play_button.is_displayed():
                 play_button.click()
-                time.sleep(1)
+                deadline.sleep(1)
 
             while True:
                 ad = self.browser.find_by('div', class_='video-ads ytp-ad-module', timeout=0.5)
@@ -210,14 +587,14 @@ class Youtube(SeleniumUploaderAccount):
                 if not ad or not ad.is_displayed():
                     break
 
-                time.sleep(0.1)
+                deadline.sleep(0.1)
 
             watched = True
             seconds_to_watch = percent_to_watch / 100 * length_s if percent_to_watch >= 0 else length_s
 
             if seconds_to_watch > 0:
                 self.print('Goinng to watch', seconds_to_watch)
-                time.sleep(seconds_to_watch)
+                deadline.sleep(seconds_to_watch)
 
             return watched, self.like(video_id) if like and self.is_logged_in else False
         except Exception as e:
@@ -225,6 +602,7 @@ class Youtube(SeleniumUploaderAccount):
 
             return watched, liked
 
+    @session_job
     def like(self, video_id: str) -> bool:
         if not self.is_logged_in:
             print('Error - \'upload\': Isn\'t logged in')
@@ -256,6 +634,7 @@ class Youtube(SeleniumUploaderAccount):
 
             return False
 
+    @session_job
     def upload(
         self,
         video_path: str,
@@ -267,30 +646,80 @@ class Youtube(SeleniumUploaderAccount):
         thumbnail_image_path: Optional[str] = None,
         timeout: Optional[int] = 60*3, # 3 min
         extra_sleep_after_upload: Optional[int] = None,
-        extra_sleep_before_publish: Optional[int] = None
+        extra_sleep_before_publish: Optional[int] = None,
+
+        # resume
+        resume: bool = True,
+        upload_state: Optional[UploadState] = None, # state of a previous attempt, defaults to self.last_upload_state
+
+        # progress - transfer percent and rate, status transitions, the video id and the stages, as they happen
+        upload_events: Optional[UploadEventStream] = None
     ) -> (bool, Optional[str]):
         if not self.is_logged_in:
             print('Error - \'upload\': Isn\'t logged in')
 
+            if upload_events:
+                upload_events.finish(False)
+
             return False, None
 
-        res = self.__upload(
-            video_path=video_path,
-            title=title,
-            description=description,
-            tags=tags,
-            made_for_kids=made_for_kids,
-            visibility=visibility,
-            thumbnail_image_path=thumbnail_image_path,
-            extra_sleep_after_upload=extra_sleep_after_upload,
-            extra_sleep_before_publish=extra_sleep_before_publish,
-            timeout=timeout
-        )
+        if upload_state is None and resume and self.last_upload_state and self.last_upload_state.video_path == video_path:
+            upload_state = self.last_upload_state
+
+        if upload_state is None or upload_state.video_path != video_path or not (resume and upload_state.is_resumable):
+            upload_state = UploadState(video_path)
+
+        self.last_upload_state = upload_state
+
+        if upload_events:
+            upload_events.start(video_path)
+            upload_state.on_stage_change = lambda stage: self.__pump_upload_events(upload_events, stage=stage)
+            self.__upload_events = upload_events
 
-        if isinstance(res, Exception):
+        try:
+            if upload_state.is_resumable:
+                self.print('Upload: resuming', upload_state.video_id, 'after', upload_state.stage.name)
+
+                res = self.__resume_upload(
+                    upload_state=upload_state,
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    made_for_kids=made_for_kids,
+                    visibility=visibility,
+                    thumbnail_image_path=thumbnail_image_path,
+                    timeout=timeout
+                )
+            else:
+                res = self.__upload(
+                    video_path=video_path,
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    made_for_kids=made_for_kids,
+                    visibility=visibility,
+                    thumbnail_image_path=thumbnail_image_path,
+                    extra_sleep_after_upload=extra_sleep_after_upload,
+                    extra_sleep_before_publish=extra_sleep_before_publish,
+                    upload_state=upload_state,
+                    upload_events=upload_events,
+                    timeout=timeout
+                )
+        except BaseException:
+            if upload_events:
+                upload_events.finish(False, upload_state.video_id)
+
+            raise
+        finally:
+            upload_state.on_stage_change = None
+            self.__upload_events = None
+
+        if isinstance(res, BaseException):
             self.print(res)
+            res = (False, None)
 
-            return False, None
+        if upload_events:
+            upload_events.finish(res[0], res[1] or upload_state.video_id)
 
         return res
 
@@ -331,6 +760,7 @@ class Youtube(SeleniumUploaderAccount):
     def load_video(self, video_id: str):
         self.get(self.__video_url(video_id))
 
+    @session_job
     def comment_on_video(
         self,
         video_id: str,
@@ -350,20 +780,21 @@ class Youtube(SeleniumUploaderAccount):
             timeout=timeout
         )
 
-        if isinstance(res, Exception):
+        if isinstance(res, BaseException):
             self.print(res)
 
             return False, False
 
         return res
 
+    @session_job
     def get_channel_video_ids(
         self,
         channel_id: Optional[str] = None,
-        ignored_titles: Optional[List[str]] = None
+        ignored_titles: Optional[List[str]] = None,
+        parser_engine: HtmlParserEngine = DEFAULT_GRID_PARSER_ENGINE
     ) -> List[str]:
         video_ids = []
-        ignored_titles = ignored_titles or []
         channel_id = channel_id or self.current_user_id
 
         try:
@@ -380,7 +811,7 @@ class Youtube(SeleniumUploaderAccount):
 
                 while i < max_i:
                     i += 1
-                    time.sleep(sleep_time)
+                    deadline.sleep(sleep_time)
 
                     if len(last_page_source) != len(self.browser.driver.page_source):
                         last_page_source = self.browser.driver.page_source
@@ -391,33 +822,13 @@ class Youtube(SeleniumUploaderAccount):
                 if should_break:
                     break
 
-            soup = bs(self.browser.driver.page_source, 'lxml')
-            elems = soup.find_all('a', {'id':'video-title', 'class':'yt-simple-endpoint style-scope ytd-grid-video-renderer'})
-
-            for elem in elems:
-                if 'title' in elem.attrs:
-                    should_continue = False
-                    title = elem['title'].strip().lower()
-
-                    for ignored_title in ignored_titles:
-                        if ignored_title.strip().lower() == title:
-                            should_continue = True
-
-                            break
-
-                    if should_continue:
-                        continue
-
-                if 'href' in elem.attrs and '/watch?v=' in elem['href']:
-                    vid_id = strings.between(elem['href'], '?v=', '&')
-
-                    if vid_id is not None and vid_id not in video_ids:
-                        video_ids.append(vid_id)
+            video_ids = extract_video_ids(self.browser.driver.page_source, ignored_titles, engine=parser_engine)
         except Exception as e:
             self.print(e)
 
         return video_ids
 
+    @session_job
     @noraise(default_return_value=False)
     def check_analytics(
         self,
@@ -433,6 +844,7 @@ class Youtube(SeleniumUploaderAccount):
 
         return True
 
+    @session_job
     @noraise(default_return_value=(False, 0))
     def get_violations(self) -> Tuple[bool, int]: # has_warning, strikes
         self.get(YT_STUDIO_URL)
@@ -456,34 +868,85 @@ class Youtube(SeleniumUploaderAccount):
 
         return True, violation_text_number
 
+    # to wait for the processing of several videos, use ProcessingWatcher with FollowUp.endscreen() instead of max_wait_seconds_for_processing
+    @session_job
     @noraise(default_return_value=False)
     def add_endscreen(self, video_id: str, max_wait_seconds_for_processing: float = 0) -> bool:
         self.get(YT_STUDIO_VIDEO_URL.format(video_id))
         start_time = time.time()
 
-        while True:
-            attrs = self.browser.get_attributes(self.browser.find_by('ytcp-text-dropdown-trigger', id_='endscreen-editor-link'))
-
-            if not attrs or 'disabled' in attrs:
-                if time.time() - start_time < max_wait_seconds_for_processing:
-                    time.sleep(1)
+        while not self.__endscreen_editor_enabled():
+            if time.time() - start_time < max_wait_seconds_for_processing:
+                deadline.sleep(1)
 
-                    continue
+                continue
 
-                return False
-            else:
-                break
+            return False
 
         self.browser.find_by('ytcp-text-dropdown-trigger', id_='endscreen-editor-link').click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_all_by('div', class_='card style-scope ytve-endscreen-template-picker')[0].click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_by('ytcp-button', id_='save-button').click()
 
-        time.sleep(2)
+        deadline.sleep(2)
 
         return self.browser.find_by('ytve-endscreen-editor-options-panel', class_='style-scope ytve-editor', timeout=0.5) is None
 
+    # the endscreen editor gets enabled only after the HD processing, a while after the content list already shows the video as processed
+    @session_job
+    @noraise(default_return_value=False)
+    def is_endscreen_editor_enabled(self, video_id: str) -> bool:
+        self.get(YT_STUDIO_VIDEO_URL.format(video_id))
+
+        return self.__endscreen_editor_enabled(timeout=5)
+
+    # the states of many videos with one load of the content list
+    # the ones not on its first page get a probe of their own (one edit page load each), at most max_probes of them
+    @session_job
+    @noraise(default_return_value={})
+    def get_processing_states(
+        self,
+        video_ids: List[str],
+        max_probes: Optional[int] = None
+    ) -> Dict[str, ProcessingState]:
+        states = {}
+
+        if not video_ids:
+            return states
+
+        self.get(YT_PROFILE_CONTENT_URL.format(self._get_current_user_id()))
+        self.browser.find_by('ytcp-video-row', timeout=15)
+
+        for record in parse_content_page(self.browser.driver.page_source):
+            if record.video_id in video_ids:
+                states[record.video_id] = record.processing_state
+
+        for video_id in [video_id for video_id in video_ids if video_id not in states][:max_probes]:
+            self.get(YT_STUDIO_VIDEO_URL.format(video_id))
+            states[video_id] = ProcessingState.PROCESSED if self.__endscreen_editor_enabled(timeout=5) else ProcessingState.PROCESSING
+
+        return states
+
+    @session_job
+    @noraise(default_return_value=False)
+    def set_video_visibility(self, video_id: str, visibility: Visibility) -> bool:
+        self.get(YT_STUDIO_VIDEO_URL.format(video_id))
+        deadline.sleep(2)
+        self.__dismiss_welcome_popup()
+
+        self.browser.find_by('ytcp-video-metadata-visibility', class_='style-scope ytcp-video-metadata-editor-sidepanel', timeout=15).click()
+        self.__settle(0.5)
+        self.browser.find_by('paper-radio-button', class_='style-scope ytcp-video-visibility-select', name=visibility.name).click()
+        self.__settle(0.5)
+        self.browser.find_by('ytcp-button', id_='save-button').click()
+        self.__settle(0.5)
+        self.browser.find_by('ytcp-button', id_='save').click()
+        deadline.sleep(1)
+
+        return True
+
+    @session_job
     @noraise(default_return_value=False)
     def remove_welcome_popup(
         self,
@@ -498,91 +961,176 @@ class Youtube(SeleniumUploaderAccount):
 
         return self.__dismiss_welcome_popup(offset=offset, timeout=timeout)
     
+    # walks the studio content list (newest first) and stores every row in the inventory
+    # incremental refreshes stop at the first page that brought nothing new or changed
+    # full refreshes walk every page and flag the videos that were not found anymore as deleted
+    # returns the new or changed records, None on error
+    @session_job
+    @noraise(default_return_value=None)
+    def refresh_content_inventory(
+        self,
+        inventory: ContentInventory,
+        full: bool = False,
+        max_pages: Optional[int] = None
+    ) -> Optional[List[VideoRecord]]:
+        channel_id = self._get_current_user_id()
+        started_at = time.time()
+        changed = []
+        page_count = 0
+        walked_all_pages = False
+
+        self.get(YT_PROFILE_CONTENT_URL.format(channel_id))
+        self.browser.find_by('ytcp-video-row', timeout=15)
+
+        while True:
+            records = parse_content_page(self.browser.driver.page_source, channel_id)
+            page_changed = inventory.upsert(records)
+            changed.extend(page_changed)
+            page_count += 1
+
+            if not records or (not full and not page_changed):
+                break
+
+            if max_pages and page_count >= max_pages:
+                break
+
+            next_page_button = self.browser.find_by('ytcp-icon-button', id='navigate-after', timeout=2)
+
+            if not next_page_button or next_page_button.get_attribute('aria-disabled') != 'false':
+                walked_all_pages = True
+
+                break
+
+            first_video_id = records[0].video_id
+            next_page_button.click()
+            self.__wait_for_content_page_change(first_video_id)
+
+        if full and walked_all_pages:
+            inventory.mark_deleted_not_seen_since(channel_id, started_at)
+
+        return changed
+
+    @session_job
     @noraise(default_return_value=None)
     def bulk_set_videos_to_private(
-        self
+        self,
+        inventory: Optional[ContentInventory] = None
     ) -> None:
         channel_id = self._get_current_user_id()
+
+        if inventory is not None:
+            # the incremental refresh only walks the pages that changed since the last one
+            # with no public video left in the inventory, the filtered walk with the bulk action is skipped
+            if self.refresh_content_inventory(inventory) is None:
+                return
+
+            if not inventory.find(channel_id=channel_id, visibility=Visibility.PUBLIC):
+                self.quit()
+
+                return
+
         self.get(YT_PROFILE_CONTENT_URL.format(channel_id))
-        time.sleep(2)
+        deadline.sleep(2)
         self.browser.find_by('input', class_='text-input style-scope ytcp-chip-bar').click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_by('paper-item', id='text-item-6').click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_by('ytcp-checkbox-lit', {'test-id':'PUBLIC'}).click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_by('ytcp-button', id='apply-button').click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         next_page_button = self.browser.find_by('ytcp-icon-button', id='navigate-after')
         next_page_status = next_page_button.get_attribute('aria-disabled')
 
         while next_page_status=='false':
-            self.__change_to_private_on_current_page()
+            # the rows the bulk action selects, the list is filtered to the public ones
+            page_records = parse_content_page(self.browser.driver.page_source, channel_id) if inventory is not None else []
+            changed = self.__change_to_private_on_current_page()
             start_time = time.time()
             update_label = self.browser.find_by('div', class_='label loading-text style-scope ytcp-bulk-actions')
 
             while update_label is not None:
                 update_label = self.browser.find_by('div', class_='label loading-text style-scope ytcp-bulk-actions')
-                time.sleep(0.5)
+                deadline.sleep(0.5)
 
                 if time.time()-start_time >= 300:
                     self.quit()
 
                     return
 
+            if changed:
+                for record in page_records:
+                    if record.visibility == Visibility.PUBLIC:
+                        inventory.update(record.video_id, visibility=Visibility.PRIVATE)
+
             next_page_button = self.browser.find_by('ytcp-icon-button', id='navigate-after', timeout=5)
             next_page_status = next_page_button.get_attribute('aria-disabled')
             print('aria-disabled is', next_page_status, type(next_page_status))
             next_page_button.click()
-            time.sleep(2.5)
+            deadline.sleep(2.5)
             public_vids = self.browser.find_by('iron-icon', {'icon':'icons:visibility'})
 
             if next_page_status is None or next_page_status is 'false' or not public_vids:
-                self.quit()
-
-                return
+                break
 
         self.quit()
 
         return
 
-    @noraise(default_return_value=None)
+    # True if the bulk action got confirmed
+    @noraise(default_return_value=False)
     def __change_to_private_on_current_page(
         self
-    ) -> None:
+    ) -> bool:
         try:
             self.browser.find_by('ytcp-checkbox-lit', id='selection-checkbox').click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             edit_container = self.browser.find_by('ytcp-select', class_='top-dropdown bulk-actions-edit style-scope ytcp-bulk-actions')
             self.browser.find_by('ytcp-dropdown-trigger', class_='style-scope ytcp-text-dropdown-trigger', in_element=edit_container).click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             self.browser.find_by('paper-item', {'test-id':'VISIBILITY'}).click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             self.browser.find_by('ytcp-form-select', class_='style-scope ytcp-bulk-actions-editor-visibility').click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             self.browser.find_by('paper-item', {'test-id':'PRIVATE'}).click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             self.browser.find_by('ytcp-button', id='submit-button').click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             self.browser.find_by('ytcp-checkbox-lit', id='confirm-checkbox').click()
-            time.sleep(0.5)
+            self.__settle(0.5)
             self.browser.find_by('ytcp-button', id='confirm-button', class_='style-scope ytcp-confirmation-dialog').click()
-            time.sleep(2.5)
+            deadline.sleep(2.5)
+
+            return True
         except Exception as e:
             print(e)
 
-        return
+        return False
 
+    @session_job
     def bulk_reset_videos(
         self,
-        affiliate_tag: str
+        affiliate_tag: str,
+        inventory: Optional[ContentInventory] = None
     ):
         channel_id = self.get_current_channel_id()
+
+        if inventory is not None:
+            if self.refresh_content_inventory(inventory) is None:
+                return
+
+            # every video needs an edit of its own (the description), the inventory saves reloading the filtered list after each one
+            for record in inventory.find(channel_id=channel_id, visibility=Visibility.PRIVATE):
+                if self.__activate_video(YT_STUDIO_VIDEO_URL.format(record.video_id), affiliate_tag):
+                    inventory.update(record.video_id, visibility=Visibility.PUBLIC)
+
+            return
+
         url = YT_PROFILE_CONTENT_URL.format(channel_id) + "/upload?filter=%5B%7B%22name%22%3A%22VISIBILITY%22%2C%22value%22%3A%5B%22PRIVATE%22%5D%7D%5D&sort=%7B%22columnType%22%3A%22date%22%2C%22sortOrder%22%3A%22DESCENDING%22%7D"
 
         while True:
             self.browser.get(url)
-            time.sleep(1.5)
+            deadline.sleep(1.5)
             search_result_videos = self.browser.find_all_by('a', id='thumbnail-anchor')
 
             if not search_result_videos:
@@ -600,38 +1148,36 @@ class Youtube(SeleniumUploaderAccount):
                 self.__activate_video(url, affiliate_tag)
                 
                 
-    def __activate_video(self, url: str, affiliate_tag: str) -> None:
+    def __activate_video(self, url: str, affiliate_tag: str) -> bool:
         self.browser.get(url)
-        time.sleep(2)
+        deadline.sleep(2)
 
         description_cointainer = self.browser.find_by('div', id='description-container')
 
         if not description_cointainer:
-            return
+            return False
 
         description_field = self.browser.find_by('div', {"id":"textbox", "slot":"input"}, in_element=description_cointainer)
         if description_field:
             description = description_field.text
         
         description=description.replace('lurker0c-20', affiliate_tag)
-        description_field.click()
-        time.sleep(0.5)
-        description_field.clear()
-        time.sleep(0.5)
-        description_field.send_keys(description)
-        time.sleep(1)
+        self.__replace_text(description_field, description)
+        self.__settle(0.5)
         self.browser.find_by('ytcp-video-metadata-visibility', class_='style-scope ytcp-video-metadata-editor-sidepanel', timeout=15).click()
 
         self.browser.find_by('paper-radio-button', class_='style-scope ytcp-video-visibility-select', name='PUBLIC').click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_by('ytcp-button', id='save-button').click()
-        time.sleep(0.5)
+        self.__settle(0.5)
         self.browser.find_by('ytcp-button', id='save').click()
-        time.sleep(1)
+        deadline.sleep(1)
+
+        return True
 
     # ------------------------------------------------------- Private methods -------------------------------------------------------- #
 
-    @signal_timeoutable(name='Upload')
+    @deadline.timeoutable(name='Upload')
     def __upload(
         self,
         video_path: str,
@@ -643,97 +1189,91 @@ class Youtube(SeleniumUploaderAccount):
         thumbnail_image_path: Optional[str] = None,
         extra_sleep_after_upload: Optional[int] = None,
         extra_sleep_before_publish: Optional[int] = None,
+        upload_state: Optional[UploadState] = None,
+        upload_events: Optional[UploadEventStream] = None,
         timeout: Optional[int] = None
     ) -> (bool, Optional[str]):
+        upload_state = upload_state or UploadState(video_path)
         self.get(YT_URL)
-        time.sleep(1.5)
+        deadline.sleep(1.5)
 
         try:
             self.get(YT_UPLOAD_URL)
-            time.sleep(1.5)
+            deadline.sleep(1.5)
             self.save_cookies()
 
             self.browser.find_by('input', type='file').send_keys(video_path)
+            upload_progress.observe(self.browser.driver)
+            upload_state.stage = UploadStage.FILE_SENT
             self.print('Upload: uploaded video')
 
             if extra_sleep_after_upload is not None and extra_sleep_after_upload > 0:
-                time.sleep(extra_sleep_after_upload)
+                self.__pause(extra_sleep_after_upload)
 
             self.__dismiss_welcome_popup()
+            upload_state.video_id = self.__upload_video_id(timeout=1)
+            self.__pump_upload_events()
 
             title_field = self.browser.find_by('div', id_='textbox', timeout=5) or self.browser.find_by(id_='textbox', timeout=5)
-            time.sleep(0.5)
-            title_field.send_keys(Keys.BACK_SPACE)
+            self.__pump_upload_events()
 
-            try:
-                time.sleep(0.5)
-                title_field.send_keys(Keys.COMMAND if platform == 'darwin' else Keys.CONTROL, 'a')
-                time.sleep(0.5)
-                title_field.send_keys(Keys.BACK_SPACE)
-            except Exception as e:
-                self.print(e)
+            if not self.__set_text_fast(title_field, title[:MAX_TITLE_CHAR_LEN]):
+                self.__type_title(title_field, title[:MAX_TITLE_CHAR_LEN])
 
-            time.sleep(0.5)
-            title_field.send_keys('a')
-            time.sleep(0.5)
-            title_field.send_keys(Keys.BACK_SPACE)
-
-            time.sleep(0.5)
-            title_field.send_keys(title[:MAX_TITLE_CHAR_LEN])
+            upload_state.stage = UploadStage.TITLE_SET
             self.print('Upload: added title')
             description_container = self.browser.find(By.XPATH, "/html/body/ytcp-uploads-dialog/paper-dialog/div/ytcp-animatable[1]/ytcp-uploads-details/div/ytcp-uploads-basics/ytcp-mention-textbox[2]")
             description_field = self.browser.find(By.ID, "textbox", element=description_container)
-            description_field.click()
-            time.sleep(0.5)
-            description_field.clear()
-            time.sleep(0.5)
-            description_field.send_keys(description[:MAX_DESCRIPTION_CHAR_LEN])
+            self.__replace_text(description_field, description[:MAX_DESCRIPTION_CHAR_LEN])
+            upload_state.stage = UploadStage.DESCRIPTION_SET
             self.print('Upload: added description')
 
             if thumbnail_image_path is not None:
                 try:
                     self.browser.find(By.XPATH, "//input[@id='file-loader']").send_keys(thumbnail_image_path)
-                    time.sleep(0.5)
+                    self.__pause(0.5)
                     self.print('Upload: added thumbnail')
                 except Exception as e:
                     self.print('Upload: Thumbnail error: ', e)
 
+            upload_state.stage = UploadStage.THUMBNAIL_SET
             self.browser.find(By.XPATH, "/html/body/ytcp-uploads-dialog/paper-dialog/div/ytcp-animatable[1]/ytcp-uploads-details/div/div/ytcp-button/div").click()
             self.print("Upload: clicked more options")
+            self.__pump_upload_events()
 
             if tags:
                 tags_container = self.browser.find(By.XPATH, "/html/body/ytcp-uploads-dialog/paper-dialog/div/ytcp-animatable[1]/ytcp-uploads-details/div/ytcp-uploads-advanced/ytcp-form-input-container/div[1]/div[2]/ytcp-free-text-chip-bar/ytcp-chip-bar/div")
                 tags_field = self.browser.find(By.ID, 'text-input', tags_container)
-                tags_field.send_keys(','.join([t for t in tags if len(t) <= MAX_TAG_CHAR_LEN])[:MAX_TAGS_CHAR_LEN-1] + ',')
+                self.__enter_tags(tags_field, tags)
                 self.print("Upload: added tags")
 
+            upload_state.stage = UploadStage.TAGS_SET
             kids_selection_name = 'MADE_FOR_KIDS' if made_for_kids else 'NOT_MADE_FOR_KIDS'
             kids_section = self.browser.find(By.NAME, kids_selection_name)
             self.browser.find(By.ID, 'radioLabel', kids_section).click()
+            upload_state.stage = UploadStage.KIDS_SET
             self.print('Upload: did set', kids_selection_name)
 
             self.browser.find(By.ID, 'next-button').click()
             self.print('Upload: clicked first next')
+            self.__pump_upload_events()
 
             self.browser.find(By.ID, 'next-button').click()
             self.print('Upload: clicked second next')
+            self.__pump_upload_events()
 
             visibility_main_button = self.browser.find(By.NAME, visibility.name)
             self.browser.find(By.ID, 'radioLabel', visibility_main_button).click()
+            upload_state.stage = UploadStage.VISIBILITY_SET
             self.print('Upload: set to', visibility.name)
 
-            try:
-                video_url_container = self.browser.find(By.XPATH, "//span[@class='video-url-fadeable style-scope ytcp-video-info']", timeout=2.5)
-                video_url_element = self.browser.find(By.XPATH, "//a[@class='style-scope ytcp-video-info']", element=video_url_container, timeout=2.5)
-                video_id = video_url_element.get_attribute('href').split('/')[-1]
-            except Exception as e:
-                self.print(e)
-                video_id = None
+            video_id = upload_state.video_id or self.__upload_video_id()
+            upload_state.video_id = video_id
 
             i=0
 
             if extra_sleep_before_publish is not None and extra_sleep_before_publish > 0:
-                time.sleep(extra_sleep_before_publish)
+                self.__pause(extra_sleep_before_publish)
 
             while True:
                 try:
@@ -745,15 +1285,19 @@ class Youtube(SeleniumUploaderAccount):
 
                     upload_status = UploadStatus.get_status(self.browser, upload_progress_element)
 
+                    if upload_status not in [UploadStatus.UPLOADING, UploadStatus.UNIDENTIFIED]:
+                        upload_state.transfer_complete = True
+
                     if upload_status in [UploadStatus.PROCESSING_SD, UploadStatus.PROCESSED_SD_PROCESSING_HD, UploadStatus.PROCESSED_ALL]:
                         done_button = self.browser.find(By.ID, 'done-button')
 
                         if done_button.get_attribute('aria-disabled') == 'false':
                             done_button.click()
+                            upload_state.stage = UploadStage.PUBLISHED
 
                             self.print('Upload: published')
 
-                            time.sleep(3)
+                            deadline.sleep(3)
                             self.get(YT_URL)
 
                             return True, video_id
@@ -766,17 +1310,116 @@ class Youtube(SeleniumUploaderAccount):
 
                         if done_button.get_attribute('aria-disabled') == 'false':
                             done_button.click()
+                            upload_state.stage = UploadStage.PUBLISHED
 
                             self.print('Upload: published')
 
-                            time.sleep(3)
+                            deadline.sleep(3)
                             self.get(YT_URL)
 
                             return True, video_id
 
                         raise
 
-                time.sleep(1)
+                self.__wait_for_upload_progress(upload_events, 1)
+        except (Exception, deadline.DeadlineExceeded) as e:
+            self.print(e)
+            timed_out = isinstance(e, deadline.DeadlineExceeded)
+
+            # last chance to capture it, so a retry can resume instead of sending the file again
+            # a timeout is the most common failure, the wait runs without the expired deadline, bounded by its own
+            if upload_state.reached(UploadStage.FILE_SENT):
+                with deadline.suspended():
+                    if not upload_state.video_id:
+                        upload_state.video_id = self.__upload_video_id(timeout=0.5)
+
+                    self.__wait_for_transfer(upload_state, upload_events, max_seconds=TIMED_OUT_TRANSFER_WAIT_SECONDS if timed_out else None)
+
+            # timeoutable restores the state of the session
+            if timed_out:
+                raise
+
+            self.get(YT_URL)
+
+            return False, None
+
+    # finishes an upload, whose file was already sent, on the video's studio page
+    @deadline.timeoutable(name='Resume upload')
+    def __resume_upload(
+        self,
+        upload_state: UploadState,
+        title: str,
+        description: str,
+        tags: Optional[List[str]] = None,
+        made_for_kids: bool = False,
+        visibility: Visibility = Visibility.PUBLIC,
+        thumbnail_image_path: Optional[str] = None,
+        timeout: Optional[int] = None
+    ) -> (bool, Optional[str]):
+        try:
+            self.get(YT_STUDIO_VIDEO_URL.format(upload_state.video_id))
+            deadline.sleep(2)
+            self.__dismiss_welcome_popup()
+
+            if not upload_state.reached(UploadStage.TITLE_SET):
+                title_container = self.browser.find_by(id_='title-textarea', timeout=5)
+                self.__replace_text(self.browser.find_by('div', id_='textbox', in_element=title_container), title[:MAX_TITLE_CHAR_LEN])
+                upload_state.stage = UploadStage.TITLE_SET
+                self.print('Upload (resume): added title')
+
+            if not upload_state.reached(UploadStage.DESCRIPTION_SET):
+                description_container = self.browser.find_by('div', id_='description-container', timeout=5)
+                self.__replace_text(self.browser.find_by('div', {'id':'textbox', 'slot':'input'}, in_element=description_container), description[:MAX_DESCRIPTION_CHAR_LEN])
+                upload_state.stage = UploadStage.DESCRIPTION_SET
+                self.print('Upload (resume): added description')
+
+            if not upload_state.reached(UploadStage.THUMBNAIL_SET):
+                if thumbnail_image_path is not None:
+                    try:
+                        self.browser.find(By.XPATH, "//input[@id='file-loader']").send_keys(thumbnail_image_path)
+                        deadline.sleep(0.5)
+                        self.print('Upload (resume): added thumbnail')
+                    except Exception as e:
+                        self.print('Upload (resume): Thumbnail error: ', e)
+
+                upload_state.stage = UploadStage.THUMBNAIL_SET
+
+            if not upload_state.reached(UploadStage.TAGS_SET):
+                if tags:
+                    self.browser.find_by('ytcp-button', id_='toggle-button', timeout=5).click()
+                    self.__settle(0.5)
+                    tags_container = self.browser.find_by('ytcp-free-text-chip-bar', timeout=5)
+                    tags_field = self.browser.find(By.ID, 'text-input', tags_container)
+                    self.__enter_tags(tags_field, tags)
+                    self.print('Upload (resume): added tags')
+
+                upload_state.stage = UploadStage.TAGS_SET
+
+            if not upload_state.reached(UploadStage.KIDS_SET):
+                kids_selection_name = 'MADE_FOR_KIDS' if made_for_kids else 'NOT_MADE_FOR_KIDS'
+                kids_section = self.browser.find(By.NAME, kids_selection_name)
+                self.browser.find(By.ID, 'radioLabel', kids_section).click()
+                upload_state.stage = UploadStage.KIDS_SET
+                self.print('Upload (resume): did set', kids_selection_name)
+
+            # the dialog's choice is only committed by its Done, so it is applied again, even if the stage was reached
+            self.browser.find_by('ytcp-video-metadata-visibility', class_='style-scope ytcp-video-metadata-editor-sidepanel', timeout=15).click()
+            self.__settle(0.5)
+            self.browser.find_by('paper-radio-button', class_='style-scope ytcp-video-visibility-select', name=visibility.name).click()
+            self.__settle(0.5)
+            self.browser.find_by('ytcp-button', id_='save-button').click()
+            self.__settle(0.5)
+            upload_state.stage = UploadStage.VISIBILITY_SET
+            self.print('Upload (resume): set to', visibility.name)
+
+            self.browser.find_by('ytcp-button', id_='save').click()
+            deadline.sleep(1)
+            upload_state.stage = UploadStage.PUBLISHED
+            self.print('Upload (resume): published')
+
+            self.get(YT_URL)
+
+            return True, upload_state.video_id
         except Exception as e:
             self.print(e)
 
@@ -785,7 +1428,7 @@ class Youtube(SeleniumUploaderAccount):
             return False, None
 
     # returns (commented_successfully, pinned_comment_successfully)
-    @signal_timeoutable(name='Comment')
+    @deadline.timeoutable(name='Comment')
     def __comment_on_video(
         self,
         video_id: str,
@@ -794,11 +1437,11 @@ class Youtube(SeleniumUploaderAccount):
         timeout: Optional[int] = None
     ) -> (bool, bool):
         self.load_video(video_id)
-        time.sleep(1)
+        deadline.sleep(1)
         self.browser.scroll(150)
-        time.sleep(1)
+        deadline.sleep(1)
         self.browser.scroll(100)
-        time.sleep(1)
+        deadline.sleep(1)
         self.browser.scroll(100)
 
         try:
@@ -810,7 +1453,7 @@ class Youtube(SeleniumUploaderAccount):
 
             self.print('comment: scrollinng to \'comment_placeholder_area\'')
             self.browser.scroll_to_element(comment_placeholder_area, header_element=header)
-            time.sleep(0.5)
+            self.__settle(0.5)
 
             self.print('comment: getting focus')
             try:
@@ -823,7 +1466,10 @@ class Youtube(SeleniumUploaderAccount):
 
             self.print('comment: sending keys')
             # self.browser.find_by('div', id_='contenteditable-root', timeout=0.5).click()
-            self.browser.find_by('div', id_='contenteditable-root', timeout=0.5).send_keys(comment)
+            comment_field = self.browser.find_by('div', id_='contenteditable-root', timeout=0.5)
+
+            if not self.__set_text_fast(comment_field, comment):
+                comment_field.send_keys(comment)
 
             self.print('comment: clicking post_comment')
             self.browser.find_by('ytd-button-renderer', id_='submit-button', class_='style-scope ytd-commentbox style-primary size-default',timeout=0.5).click()
@@ -837,7 +1483,7 @@ class Youtube(SeleniumUploaderAccount):
                 try:
                     dropdown_menu = self.browser.find_by('yt-sort-filter-sub-menu-renderer', class_='style-scope ytd-comments-header-renderer')
                     self.browser.scroll_to_element(dropdown_menu, header_element=header)
-                    time.sleep(0.5)
+                    self.__settle(0.5)
 
                     self.print('comment: clicking dropdown_trigger (open)')
                     self.browser.find_by('paper-button', id_='label', class_='dropdown-trigger style-scope yt-dropdown-menu', in_element=dropdown_menu, timeout=2.5).click()
@@ -849,7 +1495,7 @@ class Youtube(SeleniumUploaderAccount):
                         last_dropdown_element = dropdown_elements[-1]
 
                         if last_dropdown_element.get_attribute('aria-selected') == 'false':
-                            time.sleep(0.25)
+                            self.__settle(0.25)
                             self.print('comment: clicking last_dropdown_element')
                             last_dropdown_element.click()
                         else:
@@ -862,7 +1508,7 @@ class Youtube(SeleniumUploaderAccount):
                     self.print(e)
 
                 # self.browser.scroll(100)
-                time.sleep(2.5)
+                deadline.sleep(2.5)
 
                 for comment_thread in self.browser.find_all_by('ytd-comment-thread-renderer', class_='style-scope ytd-item-section-renderer'):
                     pinned_element = self.browser.find_by('yt-icon', class_='style-scope ytd-pinned-comment-badge-renderer', in_element=comment_thread, timeout=0.5)
@@ -876,12 +1522,12 @@ class Youtube(SeleniumUploaderAccount):
                         button_3_dots = self.browser.find_by('yt-icon-button', id_='button', class_='dropdown-trigger style-scope ytd-menu-renderer', in_element=comment_thread, timeout=2.5)
 
                         self.browser.scroll_to_element(button_3_dots, header_element=header)
-                        time.sleep(0.5)
+                        self.__settle(0.5)
                         self.print('comment: clicking button_3_dots')
                         button_3_dots.click()
 
                         popup_renderer_3_dots = self.browser.find_by('ytd-menu-popup-renderer', class_='ytd-menu-popup-renderer', timeout=2)
-                        time.sleep(1.5)
+                        self.__settle(1.5)
 
                         try:
                             self.browser.driver.execute_script("arguments[0].scrollIntoView();", self.browser.find_by('a',class_='yt-simple-endpoint style-scope ytd-menu-navigation-item-renderer', in_element=popup_renderer_3_dots, timeout=2.5))
@@ -901,7 +1547,7 @@ class Youtube(SeleniumUploaderAccount):
                         # confirm button
                         self.print('comment: clicking confirm_button')
                         self.browser.find_by('a', class_='yt-simple-endpoint style-scope yt-button-renderer', in_element=confirm_button_container, timeout=2.5).click()
-                        time.sleep(2)
+                        deadline.sleep(2)
 
                         return True, True
                     except Exception as e:
@@ -955,6 +1601,374 @@ class Youtube(SeleniumUploaderAccount):
             click=True
         )
 
+    # page loads are real traffic, the proxy pool counts their errors against the proxy, their durations are kept apart from the probe latency
+    def __get_measured(self, url: str, *args, **kwargs):
+        if not self.proxy_pool or not self.pool_proxy:
+            return super().get(url, *args, **kwargs)
+
+        start_time = time.time()
+
+        try:
+            res = super().get(url, *args, **kwargs)
+        except Exception as e:
+            self.proxy_pool.report_failure(self.pool_proxy, repr(e))
+
+            raise
+
+        if self.__is_network_error_page():
+            self.proxy_pool.report_failure(self.pool_proxy, 'network error page: {}'.format(url))
+        else:
+            self.proxy_pool.report_success(self.pool_proxy, request_seconds=time.time() - start_time)
+
+        return res
+
+    # geckodriver does not always take firefox down with it, whatever is left is killed
+    def __quit_browser(self) -> bool:
+        pid = self.browser_pid
+        browser_pids = {p: process_started_at(p) for p in process_tree_pids(pid)} if pid else {}
+        record = self.session_registry.get(self.session_id) if self.session_registry and self.session_id else None
+
+        try:
+            return super().quit()
+        finally:
+            if record:
+                browser_pids.update(record.browser_pids)
+
+            for p, started_at in browser_pids.items():
+                if is_same_process(p, started_at):
+                    kill_process_tree(p)
+
+            if record:
+                for path in record.profile_paths:
+                    shutil.rmtree(path, ignore_errors=True)
+
+                self.session_registry.unregister(record.session_id)
+
+            if self.__profile_template:
+                self.__profile_template.remove_profile(self.__profile_id)
+
+            self.session_id = None
+
+    def __register_session(self) -> None:
+        if not self.session_registry:
+            return
+
+        pid = self.browser_pid
+        driver = self.browser.driver
+        profile = getattr(driver, 'profile', None)
+        profile_paths = [
+            (getattr(driver, 'capabilities', None) or {}).get('moz:profile'),
+            # selenium's own copy, only when it was started with a FirefoxProfile
+            getattr(profile, 'tempfolder', None) if profile else None
+        ]
+
+        self.session_id = uuid.uuid4().hex
+        self.session_registry.register(SessionRecord(
+            session_id=self.session_id,
+            owner_pid=os.getpid(),
+            owner_started_at=process_started_at(os.getpid()),
+            browser_pids={p: process_started_at(p) for p in process_tree_pids(pid)} if pid else {},
+            # an explicit profile_path belongs to the user, never recorded
+            profile_paths=[path for path in profile_paths if path and path != self.__init_kwargs.get('profile_path')],
+            cookies_id=self.__init_kwargs.get('cookies_id')
+        ))
+
+    # same account id as the browser's own cookie folder, unless 'cookies_id' is given
+    def __cookie_account_id(self) -> str:
+        return self.__active_account_id or self.__init_kwargs.get('cookies_id') or self.browser.cookies_folder_path
+
+    def __sweep_account(self, account_id: str, job: Union[str, Callable[['Youtube'], Any]]) -> AccountResult:
+        start_time = time.time()
+
+        logged_in = False
+
+        try:
+            logged_in = self.switch_account(account_id)
+
+            if not logged_in:
+                return AccountResult(account_id, logged_in=False, duration_seconds=time.time() - start_time)
+
+            result = getattr(self, job)() if isinstance(job, str) else job(self)
+
+            return AccountResult(account_id, logged_in=True, channel_id=self.__channel_id, result=result, duration_seconds=time.time() - start_time)
+        except Exception as e:
+            self.print(e)
+
+            # the next account needs a working browser
+            if not self.__is_browser_alive():
+                self.recycle(RecycleReason.CRASH)
+
+            return AccountResult(account_id, logged_in=logged_in, channel_id=self.__channel_id, error=repr(e), duration_seconds=time.time() - start_time)
+
+    # cookies are deleted per origin, so each origin is visited on a small document of its own
+    def __clear_session_state(self) -> bool:
+        cleared = True
+
+        for url in account_isolation.blank_urls():
+            self.get(url)
+            cleared = account_isolation.clear_current_origin(self.browser.driver) and cleared
+
+        return cleared and not self.is_logged_in
+
+    def __is_browser_alive(self) -> bool:
+        try:
+            return self.browser.driver.current_url is not None
+        except:
+            return False
+
+    def __restore_stored_cookies(self) -> bool:
+        try:
+            cookies = self.cookie_store.load(self.__cookie_account_id(), YT_URL)
+        except Exception as e:
+            self.print('Could not load stored cookies', e)
+
+            return False
+
+        if not cookies:
+            return False
+
+        if CookieStore.domain(self.browser.driver.current_url) != CookieStore.domain(YT_URL):
+            self.get(YT_URL)
+
+        did_add_cookie = False
+
+        for cookie in cookies:
+            try:
+                self.browser.driver.add_cookie(cookie)
+                did_add_cookie = True
+            except Exception as e:
+                self.print('Could not add stored cookie \'{}\''.format(cookie.get('name')), e)
+
+        return did_add_cookie
+
+    # the sleeps that only wait for an animation to finish
+    def __settle(self, seconds: float) -> None:
+        if self.suppress_animations:
+            # the click might have opened a new document
+            animation_suppression.suppress(self.browser.driver)
+            seconds = min(seconds, animation_suppression.SETTLE_SECONDS)
+
+        self.__pause(seconds)
+
+    # sleeps, that keep handing the upload progress to the stream while an upload is observed
+    def __pause(self, seconds: float) -> None:
+        if not self.__upload_events:
+            deadline.sleep(seconds)
+
+            return
+
+        end_time = time.time() + seconds
+
+        while end_time - time.time() > 0:
+            self.__wait_for_upload_progress(self.__upload_events, end_time - time.time())
+
+    # scraper calls get the best proxy of the pool for each call, the session's proxy otherwise
+    def __scrape(self, func: Callable[[YoutubeScraper], Any]) -> Any:
+        proxy = self.proxy_pool.acquire() if self.proxy_pool else self.proxy
+
+        if not self.proxy_pool or not proxy:
+            return func(YoutubeScraper(user_agent=self.user_agent, proxy=proxy.string if proxy else None))
+
+        start_time = time.time()
+        res = func(YoutubeScraper(user_agent=self.user_agent, proxy=proxy.string))
+
+        # the scraper returns None instead of raising
+        if res is None:
+            self.proxy_pool.report_failure(proxy, 'scraper call failed')
+        else:
+            self.proxy_pool.report_success(proxy, request_seconds=time.time() - start_time)
+
+        return res
+
+    # returns the local proxy of the session, registering it again only updates the upstream
+    def __register_shaping_session(self) -> Proxy:
+        return self.__shaping_proxy.register_session(self.shaping_session_id, upstream_proxy=self.__shaping_upstream_proxy, bandwidth=self.__session_bandwidth)
+
+    # True if the proxy was replaced, the browser only uses the new one after a recycle (unless there's a shaping proxy in front)
+    # after quit() released it, the proxy is acquired again, as the browser is started again
+    def __replace_unhealthy_pool_proxy(self) -> bool:
+        if not self.proxy_pool or not self.pool_proxy:
+            return False
+
+        if not self.__pool_released and self.proxy_pool.is_healthy(self.pool_proxy):
+            return False
+
+        proxy = self.proxy_pool.acquire(self.__pool_account_id)
+        self.__pool_assigned = self.__pool_assigned or proxy is not None
+        self.__pool_released = False
+
+        if not proxy or ProxyPool.proxy_id(proxy) == ProxyPool.proxy_id(self.pool_proxy):
+            return False
+
+        self.print('Replacing unhealthy proxy', ProxyPool.proxy_id(self.pool_proxy), 'with', ProxyPool.proxy_id(proxy))
+        self.pool_proxy = proxy
+
+        if self.__shaping_proxy:
+            self.__shaping_upstream_proxy = proxy
+            self.__register_shaping_session()
+        else:
+            self.__init_kwargs['proxy'] = proxy
+
+        return True
+
+    def __is_network_error_page(self) -> bool:
+        try:
+            return self.browser.driver.current_url.startswith('about:neterror')
+        except:
+            return False
+
+    def __endscreen_editor_enabled(self, timeout: Optional[float] = None) -> bool:
+        kwargs = {'timeout': timeout} if timeout is not None else {}
+        attrs = self.browser.get_attributes(self.browser.find_by('ytcp-text-dropdown-trigger', id_='endscreen-editor-link', **kwargs))
+
+        return bool(attrs) and 'disabled' not in attrs
+
+    def __wait_for_content_page_change(self, previous_first_video_id: str, timeout: float = 15) -> None:
+        start_time = time.time()
+
+        while time.time() - start_time < timeout:
+            deadline.sleep(0.5)
+            records = parse_content_page(self.browser.driver.page_source)
+
+            if records and records[0].video_id != previous_first_video_id:
+                return
+
+    # hands what the observer in the page recorded since the last call to the stream, by default to the one of the upload in progress
+    def __pump_upload_events(self, upload_events: Optional[UploadEventStream] = None, stage: Optional[UploadStage] = None) -> None:
+        upload_events = upload_events or self.__upload_events
+
+        if not upload_events:
+            return
+
+        snapshots = upload_progress.drain(self.browser.driver)
+
+        if snapshots:
+            upload_events.add_snapshots(snapshots)
+
+        if stage:
+            upload_events.stage_changed(stage)
+
+    # returns as soon as the upload dialog changes, instead of sleeping the whole interval
+    def __wait_for_upload_progress(self, upload_events: Optional[UploadEventStream], timeout: float) -> Optional[List[Dict]]:
+        deadline.check()
+        # longer waits are left to the caller's loop, a script past its timeout would fail and cost its whole wait again
+        timeout = min(deadline.bound(timeout), MAX_UPLOAD_PROGRESS_WAIT_SECONDS)
+        start_time = time.time()
+        snapshots = upload_progress.wait(self.browser.driver, timeout)
+
+        # no observer in this document, or the script failed, only what is left of the chunk is slept
+        if snapshots is None:
+            deadline.sleep(max(0, timeout - (time.time() - start_time)))
+
+            return None
+
+        if upload_events and snapshots:
+            upload_events.add_snapshots(snapshots)
+
+        return snapshots
+
+    # keeps the upload page open until the file is sent, so the retry can resume instead of sending it again
+    def __wait_for_transfer(self, upload_state: UploadState, upload_events: Optional[UploadEventStream], max_seconds: Optional[float] = None) -> None:
+        start_time = last_change = time.time()
+
+        while time.time() - last_change < STALLED_TRANSFER_TIMEOUT:
+            if max_seconds is not None and time.time() - start_time >= max_seconds:
+                self.print('Upload: transfer still running, giving up on it')
+
+                return
+
+            try:
+                upload_progress_element = self.browser.find_by('ytcp-video-upload-progress', class_='style-scope ytcp-uploads-dialog', timeout=0.2)
+                upload_status = UploadStatus.get_status(self.browser, upload_progress_element) if upload_progress_element else UploadStatus.UNIDENTIFIED
+            except Exception as e:
+                self.print(e)
+
+                return
+
+            if upload_status == UploadStatus.UNIDENTIFIED:
+                return
+
+            if upload_status != UploadStatus.UPLOADING:
+                upload_state.transfer_complete = True
+                self.print('Upload: transfer complete')
+
+                return
+
+            if self.__wait_for_upload_progress(upload_events, 1):
+                last_change = time.time()
+
+        self.print('Upload: transfer stalled, giving up on it')
+
+    def __upload_video_id(self, timeout: float = 2.5) -> Optional[str]:
+        try:
+            video_url_container = self.browser.find(By.XPATH, "//span[@class='video-url-fadeable style-scope ytcp-video-info']", timeout=timeout)
+            video_url_element = self.browser.find(By.XPATH, "//a[@class='style-scope ytcp-video-info']", element=video_url_container, timeout=timeout)
+
+            return video_url_element.get_attribute('href').split('/')[-1]
+        except Exception as e:
+            self.print(e)
+
+            return None
+
+    # True if the text was set and verified, False if the caller has to type it
+    def __set_text_fast(self, field, text: str) -> bool:
+        if not self.fast_text_entry:
+            return False
+
+        if text_entry.set_text(self.browser.driver, field, text):
+            return True
+
+        self.print('Fast text entry could not be verified, typing instead')
+
+        return False
+
+    def __replace_text(self, field, text: str) -> None:
+        if self.__set_text_fast(field, text):
+            return
+
+        field.click()
+        self.__pause(0.5)
+        field.clear()
+        self.__pause(0.5)
+        field.send_keys(text)
+        self.__pause(0.5)
+
+    # the upload dialog prefills the title with the file name, this is what reliably clears it by typing
+    def __type_title(self, title_field, title: str) -> None:
+        self.__pause(0.5)
+        title_field.send_keys(Keys.BACK_SPACE)
+
+        try:
+            self.__pause(0.5)
+            title_field.send_keys(Keys.COMMAND if platform == 'darwin' else Keys.CONTROL, 'a')
+            self.__pause(0.5)
+            title_field.send_keys(Keys.BACK_SPACE)
+        except Exception as e:
+            self.print(e)
+
+        self.__pause(0.5)
+        title_field.send_keys('a')
+        self.__pause(0.5)
+        title_field.send_keys(Keys.BACK_SPACE)
+
+        self.__pause(0.5)
+        title_field.send_keys(title)
+
+    def __enter_tags(self, tags_field, tags: List[str]) -> None:
+        tags_str = ','.join([t for t in tags if len(t) <= MAX_TAG_CHAR_LEN])[:MAX_TAGS_CHAR_LEN-1]
+
+        if self.__set_text_fast(tags_field, tags_str):
+            # the chip bar only turns the text into chips on a typed separator
+            tags_field.send_keys(',')
+
+            if not text_entry.normalized(text_entry.get_text(self.browser.driver, tags_field)):
+                return
+
+            self.print('Fast tag entry did not create the chips, typing instead')
+            tags_field.clear()
+
+        tags_field.send_keys(tags_str + ',')
+
     def __video_url(self, video_id: str) -> str:
         return YT_URL + '/watch?v=' + video_id
 